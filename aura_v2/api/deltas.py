@@ -0,0 +1,129 @@
+# aura_v2/api/deltas.py
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Tuple
+
+from aura_v2.api.frames import track_row
+from aura_v2.domain import Track
+
+__all__ = ["DeltaStreams", "TrackDeltaEncoder"]
+
+_Key = Tuple[float, float, float, float, float, float, float, str, int]
+
+
+def _key(row: Dict[str, Any]) -> _Key:
+    return (
+        row["x"],
+        row["y"],
+        row["z"],
+        row["vx"],
+        row["vy"],
+        row["vz"],
+        row["confidence"],
+        row["status"],
+        row["threat_level"],
+    )
+
+
+class TrackDeltaEncoder:
+    """
+    Turns successive active-track lists into deltas against what was last sent.
+
+    A track is reported as ``updated`` only when a position/velocity
+    component or the confidence moved more than ``epsilon`` since the state
+    last published for it, or its status/threat level changed. Tracks that
+    disappear from the active list are reported as ``deleted``. Every delta
+    carries ``seq``, incremented by one per delta, so a client that sees a
+    jump knows it missed changes and asks for a snapshot.
+    """
+
+    def __init__(self, epsilon: float = 0.01) -> None:
+        if epsilon < 0:
+            raise ValueError("epsilon must be >= 0")
+        self.epsilon = float(epsilon)
+        self.seq = 0
+        self._published: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, _Key] = {}
+
+    def __len__(self) -> int:
+        return len(self._published)
+
+    def _changed(self, old: _Key, new: _Key) -> bool:
+        eps = self.epsilon
+        for i in range(7):
+            if abs(new[i] - old[i]) > eps:  # type: ignore[operator]
+                return True
+        return old[7] != new[7] or old[8] != new[8]
+
+    def delta(self, active: Iterable[Track], **extra: Any) -> Dict[str, Any]:
+        new: List[Dict[str, Any]] = []
+        updated: List[Dict[str, Any]] = []
+        seen = set()
+        for t in active:
+            row = track_row(t)
+            tid = row["id"]
+            seen.add(tid)
+            key = _key(row)
+            old = self._keys.get(tid)
+            if old is None:
+                new.append(row)
+            elif self._changed(old, key):
+                updated.append(row)
+            else:
+                continue
+            self._published[tid] = row
+            self._keys[tid] = key
+        deleted = [tid for tid in self._published if tid not in seen]
+        for tid in deleted:
+            del self._published[tid]
+            del self._keys[tid]
+        self.seq += 1
+        return {
+            "mode": "delta",
+            "seq": self.seq,
+            **extra,
+            "new": new,
+            "updated": updated,
+            "deleted": deleted,
+        }
+
+    def snapshot(self, active: Iterable[Track], **extra: Any) -> Dict[str, Any]:
+        """Full state; resets what was published to it and advances ``seq``."""
+        rows = [track_row(t) for t in active]
+        self._published = {r["id"]: r for r in rows}
+        self._keys = {r["id"]: _key(r) for r in rows}
+        self.seq += 1
+        return {"mode": "snapshot", "seq": self.seq, **extra, "tracks": rows}
+
+
+class DeltaStreams:
+    """
+    One TrackDeltaEncoder per client stream id, so each delta consumer gets
+    its own published state and ``seq``. Streams idle for longest are
+    dropped beyond ``max_streams``; a dropped client's next delta simply
+    reports every track as new again, starting from ``seq`` 1.
+    """
+
+    def __init__(self, epsilon: float = 0.01, max_streams: int = 256) -> None:
+        if max_streams < 1:
+            raise ValueError("max_streams must be >= 1")
+        self.epsilon = float(epsilon)
+        self.max_streams = int(max_streams)
+        self._encoders: "OrderedDict[str, TrackDeltaEncoder]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._encoders)
+
+    def __contains__(self, stream: str) -> bool:
+        return stream in self._encoders
+
+    def get(self, stream: str) -> TrackDeltaEncoder:
+        enc = self._encoders.get(stream)
+        if enc is None:
+            enc = self._encoders[stream] = TrackDeltaEncoder(epsilon=self.epsilon)
+            while len(self._encoders) > self.max_streams:
+                self._encoders.popitem(last=False)
+        else:
+            self._encoders.move_to_end(stream)
+        return enc
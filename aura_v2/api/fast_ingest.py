@@ -0,0 +1,229 @@
+# aura_v2/api/fast_ingest.py
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+try:  # optional: pip install "aura-v2[perf]"
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional
+    orjson = None  # type: ignore[assignment]
+
+from aura_v2.api.schemas import DEFAULT_TZ, DEV_OK
+from aura_v2.domain import DetectionBatch, Track
+from aura_v2.domain.entities.detection_batch import datetime_to_ns
+from aura_v2.utils.time import to_utc
+
+__all__ = [
+    "ColumnarFrame",
+    "FrameError",
+    "parse_track_body",
+    "parse_track_frame",
+    "dumps",
+    "track_output",
+]
+
+# Hot-path /track ingestion without Pydantic models.
+#
+# The body is decoded once (orjson when installed) and validated field by
+# field straight into a DetectionBatch. Timestamps follow the TrackRequest
+# validators: datetimes, ISO-8601 strings or Unix seconds, then ``to_utc`` with the same
+# AURA_ACCEPT_NAIVE_TS / AURA_DEFAULT_TZ settings; each distinct timestamp
+# string is parsed once per frame.
+
+_GROUPS = ("radar_detections", "camera_detections", "lidar_detections")
+
+
+class FrameError(ValueError):
+    """Invalid request body; ``loc`` points at the offending field."""
+
+    def __init__(self, loc: str, msg: str) -> None:
+        super().__init__(f"{loc}: {msg}")
+        self.loc = loc
+        self.msg = msg
+
+
+@dataclass
+class ColumnarFrame:
+    timestamp: datetime  # batch timestamp, UTC
+    batch: DetectionBatch
+
+    def __len__(self) -> int:
+        return len(self.batch)
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _from_unix(value: float) -> datetime:
+    # Pydantic reads numbers beyond 2e10 as milliseconds.
+    if abs(value) > 2e10:
+        value /= 1000.0
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+def _parse_dt(value: Any, loc: str) -> datetime:
+    try:
+        if isinstance(value, datetime):
+            dt = value
+        elif isinstance(value, str):
+            try:
+                dt = datetime.fromisoformat(value)
+            except ValueError:
+                dt = _from_unix(float(value))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            dt = _from_unix(value)
+        else:
+            raise ValueError
+    except (ValueError, OverflowError, OSError):
+        raise FrameError(loc, "invalid datetime") from None
+    try:
+        return to_utc(dt, dev_ok=DEV_OK, default_tz=DEFAULT_TZ)
+    except ValueError as e:
+        raise FrameError(loc, str(e)) from None
+
+
+def _num(value: Any, loc: str) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise FrameError(loc, "value is not a valid number")
+
+
+def parse_track_body(
+    raw: bytes, on_timestamp: Optional[Callable[[datetime], Any]] = None
+) -> ColumnarFrame:
+    """Decode and validate a TrackRequest JSON body into columns."""
+    try:
+        body = _loads(raw)
+    except ValueError as e:
+        raise FrameError("body", f"invalid JSON: {e}") from None
+    return parse_track_frame(body, on_timestamp)
+
+
+def parse_track_frame(
+    body: Any, on_timestamp: Optional[Callable[[datetime], Any]] = None
+) -> ColumnarFrame:
+    """Validate an already decoded TrackRequest-shaped dict into columns."""
+    if not isinstance(body, dict):
+        raise FrameError("body", "expected an object")
+
+    cache: Dict[Any, datetime] = {}
+    ns_of: Dict[datetime, int] = {}
+
+    def stamp(value: Any, loc: str) -> datetime:
+        key = (type(value), value)
+        dt = cache.get(key)
+        if dt is None:
+            dt = cache[key] = _parse_dt(value, loc)
+            ns_of.setdefault(dt, datetime_to_ns(dt))
+            if on_timestamp is not None:
+                on_timestamp(dt)
+        return dt
+
+    ts_raw = body.get("timestamp")
+    if ts_raw is not None:
+        batch_ts = stamp(ts_raw, "timestamp")
+    else:
+        batch_ts = to_utc(None)
+        if on_timestamp is not None:
+            on_timestamp(batch_ts)
+
+    coords: List[float] = []
+    conf: List[float] = []
+    stamps: List[int] = []
+    sensors: List[str] = []
+    attrs: List[Dict[str, Any]] = []
+    for group in _GROUPS:
+        items = body.get(group) or []
+        if not isinstance(items, list):
+            raise FrameError(group, "expected a list")
+        for i, d in enumerate(items):
+            loc = f"{group}.{i}"
+            if not isinstance(d, dict):
+                raise FrameError(loc, "expected an object")
+            try:
+                sensor = d["sensor_id"]
+                pos = d["position"]
+                c = d["confidence"]
+                ts = d["timestamp"]
+            except KeyError as e:
+                raise FrameError(f"{loc}.{e.args[0]}", "field required") from None
+            if not isinstance(sensor, str):
+                raise FrameError(f"{loc}.sensor_id", "expected a string")
+            if not isinstance(pos, dict):
+                raise FrameError(f"{loc}.position", "expected an object")
+            coords.append(_num(pos.get("x", 0.0), f"{loc}.position.x"))
+            coords.append(_num(pos.get("y", 0.0), f"{loc}.position.y"))
+            coords.append(_num(pos.get("z", 0.0), f"{loc}.position.z"))
+            conf.append(_num(c, f"{loc}.confidence"))
+            stamps.append(ns_of[stamp(ts, f"{loc}.timestamp")])
+            sensors.append(sensor)
+            a = d.get("attributes")
+            if a is not None and not isinstance(a, dict):
+                raise FrameError(f"{loc}.attributes", "expected an object")
+            attrs.append(a or {})
+
+    confidence = np.asarray(conf, dtype=float)
+    bad = np.flatnonzero(~((confidence >= 0.0) & (confidence <= 1.0)))
+    if bad.size:
+        raise FrameError("confidence", f"must be in [0, 1] (row {int(bad[0])})")
+    batch = DetectionBatch.from_columns(
+        np.asarray(coords, dtype=float).reshape(-1, 3),
+        confidence,
+        np.asarray(stamps, dtype=np.int64),
+        sensors,
+        attributes=attrs,
+    )
+    return ColumnarFrame(timestamp=batch_ts, batch=batch)
+
+
+# ---------------------------------------------------------------- responses
+
+
+def _iso(dt: datetime) -> str:
+    s = dt.astimezone(timezone.utc).isoformat()
+    return s[:-6] + "Z" if s.endswith("+00:00") else s
+
+
+def dumps(obj: Any) -> bytes:
+    """JSON bytes; datetimes as ISO-8601 with ``Z`` like Pydantic."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        obj,
+        separators=(",", ":"),
+        default=lambda o: _iso(o) if isinstance(o, datetime) else o.tolist(),
+    ).encode()
+
+
+def track_output(tracks: Iterable[Track]) -> List[Dict[str, Any]]:
+    """Rows shaped like ``TrackOutput`` without building the models."""
+    out = []
+    for t in tracks:
+        p = t.state.position
+        v = t.state.velocity
+        out.append(
+            {
+                "id": t.id,
+                "position": {"x": float(p.x), "y": float(p.y), "z": float(p.z)},
+                "velocity": {"vx": float(v.vx), "vy": float(v.vy), "vz": float(v.vz)},
+                "confidence": float(t.confidence),
+                "status": t.status.value,
+                "threat_level": int(t.threat_level),
+                "created_at": t.created_at,
+                "updated_at": t.updated_at,
+            }
+        )
+    return out
@@ -0,0 +1,85 @@
+# aura_v2/api/frames.py
+from __future__ import annotations
+
+import math
+import struct
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:  # optional: pip install "aura-v2[perf]"
+    import msgpack  # type: ignore
+except Exception:  # pragma: no cover - optional
+    msgpack = None  # type: ignore[assignment]
+
+from aura_v2.domain import DetectionBatch, Track
+
+__all__ = [
+    "F32_COLUMNS",
+    "pack_f32_frame",
+    "unpack_f32_frame",
+    "f32_batch",
+    "track_row",
+    "msgpack",
+]
+
+# Packed float32 detection frame (binary WebSocket messages):
+#
+#   <f8 frame timestamp, seconds since the Unix epoch (0 or NaN -> server now)
+#   N x 4 <f4 rows: x, y, z, confidence
+#
+# Every detection in the frame shares the frame timestamp and the sensor id
+# given when the stream was opened.
+F32_COLUMNS = ("x", "y", "z", "confidence")
+_HEADER = struct.Struct("<d")
+_ROW = np.dtype("<f4")
+
+
+def pack_f32_frame(rows: np.ndarray | Sequence[Sequence[float]], ts: Optional[datetime] = None) -> bytes:
+    arr = np.asarray(rows, dtype=_ROW).reshape(-1, len(F32_COLUMNS))
+    stamp = ts.timestamp() if ts is not None else 0.0
+    return _HEADER.pack(stamp) + arr.tobytes()
+
+
+def unpack_f32_frame(buf: bytes) -> Tuple[Optional[datetime], np.ndarray]:
+    """Return ``(timestamp or None, rows)``; ``rows`` is an (N, 4) float32 view."""
+    body = len(buf) - _HEADER.size
+    row_bytes = _ROW.itemsize * len(F32_COLUMNS)
+    if body < 0 or body % row_bytes:
+        raise ValueError(
+            f"packed frame must be 8 + N*{row_bytes} bytes, got {len(buf)}"
+        )
+    (stamp,) = _HEADER.unpack_from(buf)
+    rows = np.frombuffer(buf, dtype=_ROW, offset=_HEADER.size).reshape(-1, len(F32_COLUMNS))
+    ts = None
+    if not math.isnan(stamp) and stamp != 0.0:  # not NaN / unset
+        ts = datetime.fromtimestamp(stamp, tz=timezone.utc)
+    return ts, rows
+
+
+def f32_batch(rows: np.ndarray, ts: datetime, sensor_id: str) -> DetectionBatch:
+    if rows.size and not np.isfinite(rows).all():
+        raise ValueError("packed frame has non-finite values")
+    conf = rows[:, 3].astype(float)
+    if conf.size and (conf.min() < 0.0 or conf.max() > 1.0):
+        raise ValueError("packed frame has confidence outside [0, 1]")
+    return DetectionBatch.from_columns(rows[:, :3], conf, ts, sensor_id)
+
+
+def track_row(t: Track) -> Dict[str, Any]:
+    """Compact, flat track representation for streaming responses."""
+    p = t.state.position
+    v = t.state.velocity
+    return {
+        "id": t.id,
+        "x": p.x,
+        "y": p.y,
+        "z": p.z,
+        "vx": v.vx if v is not None else 0.0,
+        "vy": v.vy if v is not None else 0.0,
+        "vz": v.vz if v is not None else 0.0,
+        "confidence": float(t.confidence),
+        "status": t.status.value,
+        "threat_level": int(t.threat_level),
+    }
@@ -1,6 +1,17 @@
 """Application services."""
 
-from .collision_predictor import BasicCollisionPredictor
+from .collision_predictor import (
+    BasicCollisionPredictor,
+    CollisionCacheStats,
+    IncrementalCollisionPredictor,
+    VectorizedCollisionPredictor,
+)
 from .threat_analyzer import BasicThreatAnalyzer
 
-__all__ = ["BasicThreatAnalyzer", "BasicCollisionPredictor"]
+__all__ = [
+    "BasicThreatAnalyzer",
+    "BasicCollisionPredictor",
+    "VectorizedCollisionPredictor",
+    "IncrementalCollisionPredictor",
+    "CollisionCacheStats",
+]
@@ -1,6 +1,9 @@
 # aura_v2/application/services/collision_predictor.py
+import heapq
 import numpy as np
-from typing import List
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from ...domain.association.spatial_index import candidate_pairs, self_pairs
 from ...domain.entities.track import Track
 from ...domain.services.collision_prediction import CollisionPredictor
 from ...domain.value_objects.collision import Collision
@@ -81,3 +84,315 @@ class BasicCollisionPredictor(CollisionPredictor):
             )
 
         return None
+
+
+class VectorizedCollisionPredictor(BasicCollisionPredictor):
+    """
+    BasicCollisionPredictor's results computed on arrays.
+
+    Positions and velocities are stacked once per call. Two tracks can only
+    come within ``collision_threshold`` inside the horizon if they start
+    closer than ``time_horizon * max_relative_speed + collision_threshold``,
+    so only pairs inside that radius of a spatial index are evaluated. When
+    the radius spans the whole scene every pair is evaluated instead, in
+    row blocks of about ``chunk_pairs`` pairs.
+
+    Array sums round differently from the per-pair ``np.dot``/``norm``
+    (~1e-14), so with ``exact=True`` the tests are applied with a tiny
+    margin and each surviving pair is confirmed by ``_check_collision_pair``,
+    making the output identical to the basic predictor's. ``exact=False``
+    returns the array values directly.
+    """
+
+    _MARGIN = 1e-9
+
+    def __init__(
+        self,
+        collision_threshold: float = 10.0,
+        time_horizon: float = 30.0,
+        method: str = "kdtree",
+        chunk_pairs: int = 1 << 20,
+        exact: bool = True,
+    ):
+        super().__init__(collision_threshold, time_horizon)
+        self.method = method  # spatial index backend, see spatial_index
+        self.chunk_pairs = chunk_pairs
+        self.exact = exact
+
+    def predict(self, tracks: List[Track]) -> List[Collision]:
+        """Predicts potential collisions between tracks."""
+        if len(tracks) < 2:
+            return []
+        pos = np.array(
+            [(t.state.position.x, t.state.position.y, t.state.position.z) for t in tracks],
+            dtype=float,
+        )
+        vel = np.array(
+            [(t.state.velocity.vx, t.state.velocity.vy, t.state.velocity.vz) for t in tracks],
+            dtype=float,
+        )
+
+        collisions = []
+        for i, j in self._pair_blocks(pos, vel):
+            i, j, t_closest, distance = self._closest_approach(pos, vel, i, j)
+            if self.exact:
+                for a, b in zip(i.tolist(), j.tolist()):
+                    collision = self._check_collision_pair(tracks[a], tracks[b])
+                    if collision:
+                        collisions.append(collision)
+                continue
+            probability = 1.0 - distance / self.collision_threshold
+            collisions.extend(
+                Collision(
+                    track1=tracks[a],
+                    track2=tracks[b],
+                    time_to_collision=t,
+                    probability=p,
+                )
+                for a, b, t, p in zip(
+                    i.tolist(), j.tolist(), t_closest.tolist(), probability.tolist()
+                )
+            )
+        return collisions
+
+    def search_radius(self, vel: np.ndarray, horizon: Optional[float] = None) -> float:
+        """Pruning radius: horizon x bound on pairwise relative speed + threshold."""
+        horizon = self.time_horizon if horizon is None else horizon
+        # Every velocity lies within r of the mean, so |v_i - v_j| <= 2r.
+        r = np.sqrt(((vel - vel.mean(axis=0)) ** 2).sum(axis=1).max())
+        radius = horizon * 2.0 * float(r) + self.collision_threshold
+        return radius * (1.0 + self._MARGIN)
+
+    def _pair_blocks(
+        self, pos: np.ndarray, vel: np.ndarray
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Candidate (i, j), i < j, in the order the pairwise loop visits them."""
+        n = len(pos)
+        radius = self.search_radius(vel)
+        extent = float(np.linalg.norm(pos.max(axis=0) - pos.min(axis=0)))
+        if radius < extent:
+            i, j = self_pairs(pos, radius, method=self.method)
+            for k in range(0, len(i), self.chunk_pairs):
+                yield i[k : k + self.chunk_pairs], j[k : k + self.chunk_pairs]
+            return
+
+        rows = max(1, self.chunk_pairs // n)
+        cols = np.arange(n)
+        for start in range(0, n - 1, rows):
+            block = np.arange(start, min(start + rows, n - 1))
+            i, j = np.nonzero(cols[None, :] > block[:, None])
+            yield block[i], j
+
+    def _closest_approach(
+        self,
+        pos: np.ndarray,
+        vel: np.ndarray,
+        i: np.ndarray,
+        j: np.ndarray,
+        horizon: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Pairs that pass the tests of _check_collision_pair, with t and distance."""
+        horizon = self.time_horizon if horizon is None else horizon
+        # Exact mode widens every test by _MARGIN; the scalar check decides.
+        eps = self._MARGIN if self.exact else 0.0
+        rel_pos = pos[j] - pos[i]
+        rel_vel = vel[j] - vel[i]
+        rel_speed = np.sqrt(np.einsum("ij,ij->i", rel_vel, rel_vel))
+        moving = rel_speed >= 0.01 * (1.0 - eps)
+        i, j = i[moving], j[moving]
+        rel_pos, rel_vel, rel_speed = rel_pos[moving], rel_vel[moving], rel_speed[moving]
+
+        t_closest = -np.einsum("ij,ij->i", rel_pos, rel_vel) / (rel_speed**2)
+        slack = eps * (1.0 + np.abs(t_closest))
+        ahead = (t_closest >= -slack) & (t_closest <= horizon + slack)
+        i, j, t_closest = i[ahead], j[ahead], t_closest[ahead]
+        miss = rel_pos[ahead] + rel_vel[ahead] * t_closest[:, None]
+        distance = np.sqrt(np.einsum("ij,ij->i", miss, miss))
+
+        hit = distance < self.collision_threshold * (1.0 + eps)
+        return i[hit], j[hit], t_closest[hit], distance[hit]
+
+
+@dataclass
+class CollisionCacheStats:
+    frames: int = 0
+    tracks_seen: int = 0
+    tracks_reused: int = 0  # unchanged tracks whose pairs came from the cache
+    pairs_evaluated: int = 0
+    entries_expired: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.tracks_reused / self.tracks_seen if self.tracks_seen else 0.0
+
+
+class IncrementalCollisionPredictor(VectorizedCollisionPredictor):
+    """
+    Stateful collision predictor that only re-evaluates tracks that changed.
+
+    Each track keeps the state it was last evaluated with. A track counts
+    as changed when it is new, when its position is more than
+    ``position_tolerance`` from that state extrapolated at constant
+    velocity, when its velocity moved by more than ``velocity_tolerance``,
+    or when it was last evaluated more than ``refresh`` seconds ago. Only
+    pairs involving changed tracks are recomputed (against every track
+    inside the pruning radius). Pairs of unchanged tracks keep their
+    cached closest approach, whose absolute time and miss distance do not
+    move under constant velocity.
+
+    Pairs are evaluated over ``time_horizon + refresh`` so that pairs that
+    only enter the horizon later are already cached. Only pairs that come
+    within ``collision_threshold`` are stored. An entry ages out once its
+    time of closest approach has passed.
+
+    ``predict`` takes the frame time as ``now`` (epoch seconds). It
+    defaults to the newest ``updated_at`` among the tracks. With zero
+    tolerances and constant-velocity motion the output matches
+    BasicCollisionPredictor's, up to float rounding.
+    """
+
+    def __init__(
+        self,
+        collision_threshold: float = 10.0,
+        time_horizon: float = 30.0,
+        position_tolerance: float = 0.5,  # meters
+        velocity_tolerance: float = 0.1,  # m/s
+        refresh: float = 5.0,  # seconds
+        method: str = "kdtree",
+    ):
+        super().__init__(collision_threshold, time_horizon, method=method, exact=False)
+        self.position_tolerance = position_tolerance
+        self.velocity_tolerance = velocity_tolerance
+        self.refresh = refresh
+        self.stats = CollisionCacheStats()
+        # track id -> (position, velocity, time) it was last evaluated with
+        self._ref: Dict[str, Tuple[np.ndarray, np.ndarray, float]] = {}
+        # (id, id) sorted -> (absolute time of closest approach, miss distance)
+        self._pairs: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._by_track: Dict[str, Set[Tuple[str, str]]] = {}
+        self._expiry: List[Tuple[float, Tuple[str, str]]] = []
+        self._origin: Optional[float] = None
+
+    def predict(self, tracks: List[Track], now: Optional[float] = None) -> List[Collision]:
+        """Predicts potential collisions between tracks."""
+        if not tracks:
+            return []
+        if now is None:
+            now = max(t.updated_at for t in tracks).timestamp()
+        # Cached times are relative to the first frame: epoch seconds would
+        # cost ~1e-7 s of precision in t_abs - now.
+        if self._origin is None:
+            self._origin = now
+        now -= self._origin
+        ids = [t.id for t in tracks]
+        pos = np.array(
+            [(t.state.position.x, t.state.position.y, t.state.position.z) for t in tracks],
+            dtype=float,
+        )
+        vel = np.array(
+            [(t.state.velocity.vx, t.state.velocity.vy, t.state.velocity.vz) for t in tracks],
+            dtype=float,
+        )
+
+        self._forget(set(self._ref) - set(ids))
+        self._age_out(now)
+        changed = self._changed(ids, pos, vel, now)
+        self._evaluate(ids, pos, vel, changed, now)
+
+        st = self.stats
+        st.frames += 1
+        st.tracks_seen += len(ids)
+        st.tracks_reused += len(ids) - len(changed)
+        return self._report(tracks, now)
+
+    def _changed(self, ids: List[str], pos: np.ndarray, vel: np.ndarray, now: float) -> np.ndarray:
+        """Indices of tracks whose cached pairs can no longer be trusted."""
+        ref = self._ref
+        known = np.fromiter((i in ref for i in ids), dtype=bool, count=len(ids))
+        stale = ~known
+        k = np.flatnonzero(known)
+        if len(k):
+            entries = [ref[ids[i]] for i in k.tolist()]
+            p0 = np.array([e[0] for e in entries])
+            v0 = np.array([e[1] for e in entries])
+            age = now - np.array([e[2] for e in entries])
+            drift = pos[k] - (p0 + v0 * age[:, None])
+            stale[k] = (
+                (np.einsum("ij,ij->i", drift, drift) > self.position_tolerance**2)
+                | (np.abs(vel[k] - v0).max(axis=1) > self.velocity_tolerance)
+                | (age > self.refresh)
+            )
+        changed = np.flatnonzero(stale)
+        for i in changed.tolist():
+            ref[ids[i]] = (pos[i].copy(), vel[i].copy(), now)
+        self._forget({ids[i] for i in changed.tolist()}, keep_reference=True)
+        return changed
+
+    def _evaluate(
+        self, ids: List[str], pos: np.ndarray, vel: np.ndarray, changed: np.ndarray, now: float
+    ) -> None:
+        if not len(changed) or len(ids) < 2:
+            return
+        horizon = self.time_horizon + self.refresh
+        radius = self.search_radius(vel, horizon)
+        c, j, _ = candidate_pairs(pos[changed], pos, radius, method=self.method)
+        i = changed[c]
+        # Each pair once: skip self-pairs, and pairs of two changed tracks
+        # are kept only in their i < j orientation.
+        is_changed = np.zeros(len(ids), dtype=bool)
+        is_changed[changed] = True
+        keep = (i != j) & (~is_changed[j] | (i < j))
+        i, j = i[keep], j[keep]
+        self.stats.pairs_evaluated += len(i)
+
+        i, j, t_closest, distance = self._closest_approach(pos, vel, i, j, horizon)
+        for a, b, t, d in zip(i.tolist(), j.tolist(), t_closest.tolist(), distance.tolist()):
+            key = (ids[a], ids[b]) if ids[a] < ids[b] else (ids[b], ids[a])
+            t_abs = now + t
+            self._pairs[key] = (t_abs, d)
+            self._by_track.setdefault(key[0], set()).add(key)
+            self._by_track.setdefault(key[1], set()).add(key)
+            heapq.heappush(self._expiry, (t_abs, key))
+
+    def _report(self, tracks: List[Track], now: float) -> List[Collision]:
+        index = {t.id: k for k, t in enumerate(tracks)}
+        found = []
+        for (a, b), (t_abs, d) in self._pairs.items():
+            ttc = t_abs - now
+            if 0.0 <= ttc <= self.time_horizon:
+                i, j = sorted((index[a], index[b]))
+                found.append((i, j, ttc, d))
+        found.sort(key=lambda f: (f[0], f[1]))
+        return [
+            Collision(
+                track1=tracks[i],
+                track2=tracks[j],
+                time_to_collision=ttc,
+                probability=1.0 - d / self.collision_threshold,
+            )
+            for i, j, ttc, d in found
+        ]
+
+    def _age_out(self, now: float) -> None:
+        heap = self._expiry
+        while heap and heap[0][0] < now:
+            t_abs, key = heapq.heappop(heap)
+            entry = self._pairs.get(key)
+            if entry is not None and entry[0] == t_abs:
+                self._drop(key)
+                self.stats.entries_expired += 1
+
+    def _forget(self, track_ids: Set[str], keep_reference: bool = False) -> None:
+        for tid in track_ids:
+            for key in list(self._by_track.get(tid, ())):
+                self._drop(key)
+            if not keep_reference:
+                self._ref.pop(tid, None)
+                self._by_track.pop(tid, None)
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        self._pairs.pop(key, None)
+        for tid in key:
+            pairs = self._by_track.get(tid)
+            if pairs is not None:
+                pairs.discard(key)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from scipy.sparse import coo_matrix, csgraph
+
+# Cost used for pairs outside the gate. Large enough that the solver always
+# prefers one more in-gate match over any in-gate cost difference.
+FORBIDDEN = 1e9
+
+
+def gated_assignment(
+    cost: np.ndarray, gate: float, forbidden: float = FORBIDDEN
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Globally optimal assignment restricted to pairs with ``cost <= gate``.
+
+    Rows/columns without any in-gate pair are dropped before calling
+    ``linear_sum_assignment``, so the solver only sees the gated sub-problem.
+    Returns ``(rows, cols)`` index arrays into ``cost`` of the accepted pairs.
+    """
+    empty = np.empty(0, dtype=np.intp)
+    if cost.size == 0:
+        return empty, empty
+
+    feasible = cost <= gate
+    r_idx = np.flatnonzero(feasible.any(axis=1))
+    if r_idx.size == 0:
+        return empty, empty
+    c_idx = np.flatnonzero(feasible.any(axis=0))
+
+    sub_ok = feasible[np.ix_(r_idx, c_idx)]
+    sub = np.where(sub_ok, cost[np.ix_(r_idx, c_idx)], forbidden)
+    r, c = linear_sum_assignment(sub)
+    keep = sub_ok[r, c]
+    return r_idx[r[keep]], c_idx[c[keep]]
+
+
+def connected_components(
+    n_rows: int, n_cols: int, rows: np.ndarray, cols: np.ndarray
+) -> np.ndarray:
+    """Component label per edge of the bipartite graph given as edge lists."""
+    if rows.size == 0:
+        return np.empty(0, dtype=np.intp)
+    n = n_rows + n_cols
+    graph = coo_matrix(
+        (np.ones(rows.size, dtype=np.int8), (rows, cols + n_rows)), shape=(n, n)
+    )
+    _, labels = csgraph.connected_components(graph, directed=False)
+    return labels[rows]
+
+
+@dataclass
+class ComponentStats:
+    """Per-call breakdown of the gate graph solved by ``sparse_assignment``."""
+
+    edges: int = 0
+    components: int = 0
+    closed_form: int = 0  # 1xK / Kx1 clusters picked without the solver
+    solved: int = 0  # clusters sent to linear_sum_assignment
+    pooled: int = 0  # of which ran on the executor
+    largest: Tuple[int, int] = (0, 0)  # rows x cols of the biggest cluster
+    histogram: Dict[str, int] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+
+
+# Histogram buckets by cluster size (rows * cols)
+_BUCKETS = ((1, "1"), (2, "2"), (8, "<=8"), (64, "<=64"), (512, "<=512"))
+
+
+def _bucket(size: int) -> str:
+    for limit, name in _BUCKETS:
+        if size <= limit:
+            return name
+    return ">512"
+
+
+def _solve_block(
+    grp: np.ndarray, rows: np.ndarray, cols: np.ndarray, costs: np.ndarray, forbidden: float
+) -> np.ndarray:
+    r_loc, ri = np.unique(rows[grp], return_inverse=True)
+    c_loc, ci = np.unique(cols[grp], return_inverse=True)
+    edge = np.full((r_loc.size, c_loc.size), -1, dtype=np.intp)
+    edge[ri, ci] = grp
+    sub = np.full(edge.shape, forbidden, dtype=float)
+    sub[ri, ci] = costs[grp]
+    r, c = linear_sum_assignment(sub)
+    e = edge[r, c]
+    return e[e >= 0]
+
+
+def sparse_assignment(
+    n_rows: int,
+    n_cols: int,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    costs: np.ndarray,
+    forbidden: float = FORBIDDEN,
+    executor: Optional[Executor] = None,
+    parallel_min_size: int = 256,
+    stats: Optional[ComponentStats] = None,
+) -> np.ndarray:
+    """
+    Optimal assignment over a sparse candidate list ``(rows, cols, costs)``.
+
+    Pairs that are not listed are forbidden. The bipartite graph is split into
+    connected components and each one is solved independently; the union is
+    the same optimum as solving the full N x M matrix with ``forbidden``
+    everywhere else.
+
+    - clusters with a single row or a single column are closed-form (keep the
+      cheapest edge), all at once with array ops;
+    - the rest get a small dense ``linear_sum_assignment``; clusters with at
+      least ``parallel_min_size`` cells go to ``executor`` when one is given
+      (SciPy releases the GIL while solving).
+
+    Returns the indices of the accepted edges, i.e. the matches are
+    ``rows[e], cols[e]`` with cost ``costs[e]``. Pass ``stats`` to have it
+    filled with the component breakdown.
+    """
+    t0 = time.perf_counter()
+    rows = np.asarray(rows, dtype=np.intp)
+    cols = np.asarray(cols, dtype=np.intp)
+    costs = np.asarray(costs, dtype=float)
+    if rows.size == 0:
+        if stats is not None:
+            stats.elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        return np.empty(0, dtype=np.intp)
+
+    labels = connected_components(n_rows, n_cols, rows, cols)
+    n_lab = int(labels.max()) + 1
+    # distinct rows / cols per component
+    r_cnt = np.bincount(np.unique(labels * n_rows + rows) // n_rows, minlength=n_lab)
+    c_cnt = np.bincount(np.unique(labels * n_cols + cols) // n_cols, minlength=n_lab)
+    present = np.flatnonzero(r_cnt)
+
+    # Closed form: a star (1xK or Kx1) can only keep one edge, the cheapest.
+    star = (r_cnt == 1) | (c_cnt == 1)
+    on_star = star[labels]
+    e_star = np.flatnonzero(on_star)
+    e_star = e_star[np.lexsort((costs[e_star], labels[e_star]))]
+    first = np.ones(e_star.size, dtype=bool)
+    first[1:] = labels[e_star][1:] != labels[e_star][:-1]
+    picked = e_star[first]
+    accepted = [picked[costs[picked] < forbidden]]
+
+    rest = np.flatnonzero(~on_star)
+    order = rest[np.argsort(labels[rest], kind="stable")]
+    groups = np.split(order, np.flatnonzero(np.diff(labels[order])) + 1) if order.size else []
+    futures = []
+    for grp in groups:
+        lab = labels[grp[0]]
+        if executor is not None and r_cnt[lab] * c_cnt[lab] >= parallel_min_size:
+            futures.append(executor.submit(_solve_block, grp, rows, cols, costs, forbidden))
+        else:
+            accepted.append(_solve_block(grp, rows, cols, costs, forbidden))
+    accepted.extend(f.result() for f in futures)
+
+    if stats is not None:
+        sizes = (r_cnt * c_cnt)[present]
+        big = present[int(np.argmax(sizes))]
+        counts: Dict[str, int] = {}
+        for size in sizes.tolist():
+            name = _bucket(size)
+            counts[name] = counts.get(name, 0) + 1
+        names = [name for _, name in _BUCKETS] + [">512"]
+        hist = {name: counts[name] for name in names if name in counts}
+        stats.edges = int(rows.size)
+        stats.components = int(present.size)
+        stats.closed_form = int(np.count_nonzero(star[present]))
+        stats.solved = len(groups)
+        stats.pooled = len(futures)
+        stats.largest = (int(r_cnt[big]), int(c_cnt[big]))
+        stats.histogram = hist
+        stats.elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    return np.sort(np.concatenate(accepted))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List, Dict
 import math
+import numpy as np
 
 
 def iou_cost(b1: List[float], b2: List[float]) -> float:
@@ -33,3 +34,42 @@ def combined_cost(det_box, trk_box, det_conf, weights: Dict[str, float]) -> floa
         + weights.get("motion", 0.4) * motion_cost(det_box, trk_box)
         + weights.get("confidence", 0.1) * confidence_cost(det_conf)
     )
+
+
+# --- Array versions -------------------------------------------------------
+# Same formulas on (..., 4) bbox arrays with NumPy broadcasting, e.g.
+# det[:, None, :] against trk[None, :, :] gives the full M x N cost grid.
+# Results agree with the scalar functions to within float rounding (the
+# motion term uses np.hypot where the scalar one uses math.dist).
+
+
+def iou_cost_np(b1: np.ndarray, b2: np.ndarray) -> np.ndarray:
+    x1, y1, w1, h1 = np.moveaxis(np.asarray(b1, dtype=float), -1, 0)
+    x2, y2, w2, h2 = np.moveaxis(np.asarray(b2, dtype=float), -1, 0)
+    xa, ya = np.maximum(x1, x2), np.maximum(y1, y2)
+    xb, yb = np.minimum(x1 + w1, x2 + w2), np.minimum(y1 + h1, y2 + h2)
+    inter = np.maximum(0.0, xb - xa) * np.maximum(0.0, yb - ya)
+    union = w1 * h1 + w2 * h2 - inter
+    with np.errstate(invalid="ignore", divide="ignore"):
+        iou = np.where(union > 0, inter / union, 0.0)
+    return 1.0 - iou
+
+
+def motion_cost_np(p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+    x1, y1, w1, h1 = np.moveaxis(np.asarray(p1, dtype=float), -1, 0)
+    x2, y2, w2, h2 = np.moveaxis(np.asarray(p2, dtype=float), -1, 0)
+    dx = (x1 + w1 / 2.0) - (x2 + w2 / 2.0)
+    dy = (y1 + h1 / 2.0) - (y2 + h2 / 2.0)
+    return np.hypot(dx, dy)
+
+
+def confidence_cost_np(conf: np.ndarray) -> np.ndarray:
+    return 1.0 - np.maximum(0.0, np.minimum(1.0, np.asarray(conf, dtype=float)))
+
+
+def combined_cost_np(det_box, trk_box, det_conf, weights: Dict[str, float]) -> np.ndarray:
+    return (
+        weights.get("iou", 0.5) * iou_cost_np(det_box, trk_box)
+        + weights.get("motion", 0.4) * motion_cost_np(det_box, trk_box)
+        + weights.get("confidence", 0.1) * confidence_cost_np(det_conf)
+    )
@@ -2,15 +2,18 @@ from __future__ import annotations
 from typing import List, Tuple, Dict
 import numpy as np
 from scipy.optimize import linear_sum_assignment
-from .hungarian_costs import combined_cost
+from .assignment import sparse_assignment
+from .hungarian_costs import combined_cost, combined_cost_np
+from .spatial_index import candidate_pairs
 
 
-def build_cost_matrix(
+def build_cost_matrix_py(
     detections: List[Dict],
     tracks: List[Dict],
     weights: Dict[str, float],
     max_cost: float,
 ) -> np.ndarray:
+    """Reference implementation: one ``combined_cost`` call per pair."""
     M, N = len(detections), len(tracks)
     C = np.full((M, N), fill_value=max_cost, dtype=float)
     for i, d in enumerate(detections):
@@ -20,22 +23,129 @@ def build_cost_matrix(
     return C
 
 
+def build_cost_matrix_np(
+    det_boxes: np.ndarray,
+    trk_boxes: np.ndarray,
+    det_scores: np.ndarray,
+    weights: Dict[str, float],
+    max_cost: float,
+) -> np.ndarray:
+    """
+    Vectorized cost matrix from (M, 4) / (N, 4) ``[x, y, w, h]`` arrays and an
+    (M,) score vector. Matches ``build_cost_matrix_py`` to within float rounding.
+    """
+    det = np.asarray(det_boxes, dtype=float).reshape(-1, 4)
+    trk = np.asarray(trk_boxes, dtype=float).reshape(-1, 4)
+    scores = np.asarray(det_scores, dtype=float).reshape(-1)
+    if det.shape[0] == 0 or trk.shape[0] == 0:
+        return np.full((det.shape[0], trk.shape[0]), fill_value=max_cost, dtype=float)
+    C = combined_cost_np(det[:, None, :], trk[None, :, :], scores[:, None], weights)
+    return np.minimum(C, max_cost)
+
+
+def _boxes(items: List[Dict]) -> np.ndarray:
+    return np.asarray([it["bbox"] for it in items], dtype=float).reshape(-1, 4)
+
+
+def _scores(items: List[Dict]) -> np.ndarray:
+    return np.fromiter((it.get("score", 1.0) for it in items), dtype=float, count=len(items))
+
+
+def build_cost_matrix(
+    detections: List[Dict],
+    tracks: List[Dict],
+    weights: Dict[str, float],
+    max_cost: float,
+) -> np.ndarray:
+    return build_cost_matrix_np(
+        _boxes(detections), _boxes(tracks), _scores(detections), weights, max_cost
+    )
+
+
+def _centers(boxes: np.ndarray) -> np.ndarray:
+    return boxes[:, :2] + boxes[:, 2:] / 2.0
+
+
+def build_sparse_cost(
+    detections: List[Dict],
+    tracks: List[Dict],
+    weights: Dict[str, float],
+    max_cost: float,
+    index: str = "kdtree",
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sparse counterpart of ``build_cost_matrix``: ``(det_idx, trk_idx, cost)``
+    for every pair with ``cost < max_cost``, without an M x N matrix.
+
+    All cost terms are non-negative, so ``cost >= w_motion * center_dist``;
+    pairs with centers further apart than ``max_cost / w_motion`` can never
+    pass and are never generated.
+    """
+    M, N = len(detections), len(tracks)
+    if M == 0 or N == 0:
+        e = np.empty(0, dtype=np.intp)
+        return e, e.copy(), np.empty(0, dtype=float)
+
+    det, trk = _boxes(detections), _boxes(tracks)
+    w_motion = weights.get("motion", 0.4)
+    if w_motion > 0 and min(weights.get("iou", 0.5), weights.get("confidence", 0.1)) >= 0:
+        rows, cols, _ = candidate_pairs(
+            _centers(det), _centers(trk), max_cost / w_motion, method=index
+        )
+    else:  # no usable spatial bound: every pair is a candidate
+        rows = np.repeat(np.arange(M, dtype=np.intp), N)
+        cols = np.tile(np.arange(N, dtype=np.intp), M)
+
+    costs = combined_cost_np(det[rows], trk[cols], _scores(detections)[rows], weights)
+    keep = costs < max_cost
+    return rows[keep], cols[keep], costs[keep]
+
+
+def _result(
+    r: np.ndarray, c: np.ndarray, n_det: int, n_trk: int, as_arrays: bool
+) -> Tuple:
+    used_d = np.zeros(n_det, dtype=bool)
+    used_t = np.zeros(n_trk, dtype=bool)
+    used_d[r] = True
+    used_t[c] = True
+    unm_det = np.flatnonzero(~used_d)
+    unm_trk = np.flatnonzero(~used_t)
+    if as_arrays:
+        return np.column_stack((r, c)).astype(np.intp, copy=False), unm_det, unm_trk
+    return list(zip(r.tolist(), c.tolist())), unm_det.tolist(), unm_trk.tolist()
+
+
 def solve_assignment(
-    C: np.ndarray, max_cost: float
+    C: np.ndarray, max_cost: float, as_arrays: bool = False
 ) -> Tuple[List[Tuple[int, int]], List[int], List[int]]:
+    """
+    Hungarian solve plus gating at ``max_cost``.
+
+    Returns ``(matches, unmatched_det, unmatched_trk)`` as lists, or with
+    ``as_arrays=True`` as a (K, 2) index array and two index arrays so large
+    frames skip building Python tuples.
+    """
     row_ind, col_ind = linear_sum_assignment(C)
-    matches, unm_det, unm_trk = [], [], []
-    assigned_trk = set()
-    for r, c in zip(row_ind, col_ind):
-        if C[r, c] < max_cost:
-            matches.append((r, c))
-            assigned_trk.add(c)
-        else:
-            unm_det.append(r)
-    for r in range(C.shape[0]):
-        if r not in [m[0] for m in matches]:
-            unm_det.append(r)
-    for c in range(C.shape[1]):
-        if c not in assigned_trk:
-            unm_trk.append(c)
-    return matches, sorted(set(unm_det)), sorted(set(unm_trk))
+    keep = C[row_ind, col_ind] < max_cost
+    return _result(row_ind[keep], col_ind[keep], C.shape[0], C.shape[1], as_arrays)
+
+
+def solve_sparse_assignment(
+    n_det: int,
+    n_trk: int,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    costs: np.ndarray,
+    max_cost: float,
+    as_arrays: bool = False,
+) -> Tuple[List[Tuple[int, int]], List[int], List[int]]:
+    """
+    ``solve_assignment`` for the output of ``build_sparse_cost``.
+
+    Missing pairs cost ``max_cost`` (as in the clipped dense matrix), and each
+    connected cluster of candidates is solved on its own.
+    """
+    e = sparse_assignment(n_det, n_trk, rows, cols, costs, forbidden=max_cost)
+    r, c = rows[e], cols[e]
+    order = np.lexsort((c, r))
+    return _result(r[order], c[order], n_det, n_trk, as_arrays)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+from itertools import product
+from typing import Tuple
+import numpy as np
+from scipy.spatial import cKDTree
+
+# Candidate-pair generation for gated association.
+#
+# Instead of filling an N x M distance matrix and throwing almost all of it
+# away, index one side and only emit pairs closer than the gate radius. Both
+# backends return the same pairs, sorted by (i, j):
+#   - "kdtree": scipy cKDTree on both sides
+#   - "grid":   uniform hash grid with cell size == radius (pure NumPy)
+
+PairList = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _empty() -> PairList:
+    e = np.empty(0, dtype=np.intp)
+    return e, e.copy(), np.empty(0, dtype=float)
+
+
+def _finish(a: np.ndarray, b: np.ndarray, ia: np.ndarray, ib: np.ndarray, radius: float) -> PairList:
+    diff = a[ia] - b[ib]
+    dist = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+    keep = dist <= radius
+    ia, ib, dist = ia[keep], ib[keep], dist[keep]
+    order = np.lexsort((ib, ia))
+    return ia[order].astype(np.intp), ib[order].astype(np.intp), dist[order]
+
+
+def _kdtree_pairs(a: np.ndarray, b: np.ndarray, radius: float) -> PairList:
+    sdm = cKDTree(a).sparse_distance_matrix(cKDTree(b), radius, output_type="ndarray")
+    return _finish(a, b, sdm["i"], sdm["j"], radius)
+
+
+def _grid_pairs(a: np.ndarray, b: np.ndarray, radius: float) -> PairList:
+    cell = radius if radius > 0 else 1.0
+    origin = np.minimum(a.min(axis=0), b.min(axis=0))
+    ca = np.floor((a - origin) / cell).astype(np.int64) + 1
+    cb = np.floor((b - origin) / cell).astype(np.int64) + 1
+    dims = tuple((np.maximum(ca.max(axis=0), cb.max(axis=0)) + 2).tolist())
+
+    kb = np.ravel_multi_index(cb.T, dims)
+    order = np.argsort(kb, kind="stable")
+    kb_sorted = kb[order]
+
+    all_a, all_b = [], []
+    for off in product((-1, 0, 1), repeat=a.shape[1]):
+        ka = np.ravel_multi_index((ca + np.asarray(off)).T, dims)
+        lo = np.searchsorted(kb_sorted, ka, side="left")
+        cnt = np.searchsorted(kb_sorted, ka, side="right") - lo
+        total = int(cnt.sum())
+        if total == 0:
+            continue
+        ia = np.repeat(np.arange(a.shape[0]), cnt)
+        within = np.arange(total) - np.repeat(np.cumsum(cnt) - cnt, cnt)
+        all_a.append(ia)
+        all_b.append(order[np.repeat(lo, cnt) + within])
+    if not all_a:
+        return _empty()
+    return _finish(a, b, np.concatenate(all_a), np.concatenate(all_b), radius)
+
+
+def candidate_pairs(
+    a: np.ndarray, b: np.ndarray, radius: float, method: str = "kdtree"
+) -> PairList:
+    """
+    All pairs ``(i, j)`` with ``||a[i] - b[j]|| <= radius``.
+
+    ``a`` is (N, d) and ``b`` is (M, d). Returns ``(i, j, dist)`` arrays
+    sorted by ``(i, j)``; the dense N x M matrix is never built.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if a.shape[0] == 0 or b.shape[0] == 0 or radius < 0:
+        return _empty()
+    if a.shape[1] != b.shape[1]:
+        raise ValueError("point sets must have the same dimension")
+    if method == "kdtree":
+        return _kdtree_pairs(a, b, radius)
+    if method == "grid":
+        return _grid_pairs(a, b, radius)
+    raise ValueError(f"Unknown spatial index method: {method}")
+
+
+def self_pairs(points: np.ndarray, radius: float, method: str = "kdtree") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    All pairs ``(i, j)`` with ``i < j`` and ``||points[i] - points[j]|| <= radius``
+    within one point set, sorted by ``(i, j)``.
+    """
+    points = np.asarray(points, dtype=float)
+    if points.shape[0] < 2 or radius < 0:
+        e = np.empty(0, dtype=np.intp)
+        return e, e.copy()
+    if method == "kdtree":
+        ij = cKDTree(points).query_pairs(radius, output_type="ndarray")
+        i, j = ij[:, 0].astype(np.intp), ij[:, 1].astype(np.intp)
+        order = np.lexsort((j, i))
+        return i[order], j[order]
+    i, j, _ = candidate_pairs(points, points, radius, method=method)
+    keep = i < j
+    return i[keep], j[keep]
@@ -1,14 +1,19 @@
 # Re-export a stable surface for tests
 from .detection import Detection
+from .detection_batch import DetectionBatch
 from .track import Track, TrackStatus, ThreatLevel, TrackState
+from .track_store import TrackStore, TrackView
 from ..value_objects import Position3D, Velocity3D, Confidence, CovarianceMatrix
 
 __all__ = [
     "Detection",
+    "DetectionBatch",
     "Track",
     "TrackStatus",
     "ThreatLevel",
     "TrackState",
+    "TrackStore",
+    "TrackView",
     "Position3D",
     "Velocity3D",
     "Confidence",
@@ -0,0 +1,276 @@
+# aura_v2/domain/entities/detection_batch.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from ..value_objects import Confidence, CovarianceMatrix, Position3D, Velocity3D
+from .detection import Detection
+
+_UTC = ZoneInfo("UTC")
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+_US = timedelta(microseconds=1)
+
+
+def datetime_to_ns(ts: datetime) -> int:
+    """Aware datetime -> integer nanoseconds since the Unix epoch (exact)."""
+    return ((ts - _EPOCH) // _US) * 1000
+
+
+def ns_to_datetime(ns: int) -> datetime:
+    """Inverse of :func:`datetime_to_ns` (microsecond resolution, UTC)."""
+    return _EPOCH + timedelta(microseconds=int(ns) // 1000)
+
+
+@dataclass(frozen=True, eq=False)
+class DetectionBatch:
+    """
+    One frame of detections as columns (struct of arrays).
+
+    Row ``i`` of every array is one detection. ``sensor_codes`` index into
+    ``sensor_ids``. Optional per-row data that most frames do not carry lives
+    in side tables that are ``None`` when absent: ``velocities`` (NaN rows
+    where a detection has none), ``attributes`` and ``covariances``.
+
+    Slicing with ``batch[a:b]`` returns views; index arrays and boolean masks
+    copy, as in numpy. ``batch[i]`` and :meth:`to_detections` build
+    :class:`Detection` objects on demand.
+    """
+
+    positions: np.ndarray  # (N, 3) float64
+    confidences: np.ndarray  # (N,) float64
+    timestamps_ns: np.ndarray  # (N,) int64, ns since the Unix epoch
+    sensor_codes: np.ndarray  # (N,) int32 into sensor_ids
+    sensor_ids: Tuple[str, ...] = ()
+    velocities: Optional[np.ndarray] = None  # (N, 3) float64
+    attributes: Optional[List[Dict[str, Any]]] = None
+    covariances: Optional[List[Optional[CovarianceMatrix]]] = None
+
+    def __post_init__(self) -> None:
+        n = len(self.confidences)
+        if self.positions.shape != (n, 3):
+            raise ValueError(f"positions must be ({n}, 3), got {self.positions.shape}")
+        if len(self.timestamps_ns) != n or len(self.sensor_codes) != n:
+            raise ValueError("all DetectionBatch columns must have the same length")
+        if n and not ((self.confidences >= 0.0) & (self.confidences <= 1.0)).all():
+            raise ValueError("confidences must be in [0, 1]")
+
+    # ------------------------------------------------------------ construction
+
+    @classmethod
+    def empty(cls) -> "DetectionBatch":
+        return cls(
+            positions=np.empty((0, 3)),
+            confidences=np.empty(0),
+            timestamps_ns=np.empty(0, dtype=np.int64),
+            sensor_codes=np.empty(0, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        positions: Any,
+        confidences: Any,
+        timestamps: Union[Sequence[datetime], np.ndarray, datetime],
+        sensor_ids: Union[Sequence[str], str],
+        attributes: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        velocities: Optional[Any] = None,
+        covariances: Optional[Sequence[Optional[CovarianceMatrix]]] = None,
+    ) -> "DetectionBatch":
+        """
+        Build a batch from columns. ``timestamps`` is one datetime for the
+        whole frame, a sequence of datetimes or an int64 ns array;
+        ``sensor_ids`` is one id or one per row.
+        """
+        xyz = np.asarray(positions, dtype=float).reshape(-1, 3)
+        n = len(xyz)
+        conf = np.asarray(confidences, dtype=float).reshape(n)
+
+        if isinstance(timestamps, datetime):
+            ts = np.full(n, datetime_to_ns(timestamps), dtype=np.int64)
+        elif isinstance(timestamps, np.ndarray) and timestamps.dtype.kind in "iu":
+            ts = timestamps.astype(np.int64, copy=False).reshape(n)
+        else:
+            memo: Dict[datetime, int] = {}
+            ts = np.fromiter(
+                (memo[t] if t in memo else memo.setdefault(t, datetime_to_ns(t)) for t in timestamps),
+                dtype=np.int64,
+                count=n,
+            )
+
+        if isinstance(sensor_ids, str):
+            names: Tuple[str, ...] = (sensor_ids,)
+            codes = np.zeros(n, dtype=np.int32)
+        else:
+            lookup: Dict[str, int] = {}
+            codes = np.fromiter(
+                (lookup.setdefault(s, len(lookup)) for s in sensor_ids), dtype=np.int32, count=n
+            )
+            names = tuple(lookup)
+
+        attrs = None
+        if attributes is not None and any(attributes):
+            attrs = [a or {} for a in attributes]
+        vel = None if velocities is None else np.asarray(velocities, dtype=float).reshape(n, 3)
+        covs = None
+        if covariances is not None and any(c is not None for c in covariances):
+            covs = list(covariances)
+        return cls(xyz, conf, ts, codes, names, vel, attrs, covs)
+
+    @classmethod
+    def from_detections(cls, detections: Iterable[Detection]) -> "DetectionBatch":
+        dets = detections if isinstance(detections, list) else list(detections)
+        n = len(dets)
+        if n == 0:
+            return cls.empty()
+        xyz = np.array([(d.position.x, d.position.y, d.position.z) for d in dets], dtype=float)
+        conf = np.fromiter((float(d.confidence) for d in dets), dtype=float, count=n)
+        vel = None
+        if any(d.velocity is not None for d in dets):
+            vel = np.array(
+                [
+                    (d.velocity.vx, d.velocity.vy, d.velocity.vz) if d.velocity is not None
+                    else (np.nan, np.nan, np.nan)
+                    for d in dets
+                ],
+                dtype=float,
+            )
+        return cls.from_columns(
+            xyz,
+            conf,
+            [d.timestamp for d in dets],
+            [d.sensor_id for d in dets],
+            attributes=[d.attributes for d in dets],
+            velocities=vel,
+            covariances=[d.covariance for d in dets],
+        )
+
+    @classmethod
+    def concat(cls, batches: Sequence["DetectionBatch"]) -> "DetectionBatch":
+        """Stack batches (e.g. one per sensor) into one frame."""
+        parts = [b for b in batches if len(b)]
+        if not parts:
+            return cls.empty()
+        if len(parts) == 1:
+            return parts[0]
+        lookup: Dict[str, int] = {}
+        codes = []
+        for b in parts:
+            remap = np.array([lookup.setdefault(s, len(lookup)) for s in b.sensor_ids], dtype=np.int32)
+            codes.append(remap[b.sensor_codes] if len(remap) else b.sensor_codes)
+        vel = None
+        if any(b.velocities is not None for b in parts):
+            vel = np.concatenate(
+                [b.velocities if b.velocities is not None else np.full((len(b), 3), np.nan) for b in parts]
+            )
+        attrs = None
+        if any(b.attributes is not None for b in parts):
+            attrs = [a for b in parts for a in (b.attributes or [{} for _ in range(len(b))])]
+        covs = None
+        if any(b.covariances is not None for b in parts):
+            covs = [c for b in parts for c in (b.covariances or [None] * len(b))]
+        return cls(
+            np.concatenate([b.positions for b in parts]),
+            np.concatenate([b.confidences for b in parts]),
+            np.concatenate([b.timestamps_ns for b in parts]),
+            np.concatenate(codes),
+            tuple(lookup),
+            vel,
+            attrs,
+            covs,
+        )
+
+    # ------------------------------------------------------------------ views
+
+    def __len__(self) -> int:
+        return len(self.confidences)
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.positions[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.positions[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.positions[:, 2]
+
+    @property
+    def xy(self) -> np.ndarray:
+        return self.positions[:, :2]
+
+    def sensor_id(self, i: int) -> str:
+        return self.sensor_ids[int(self.sensor_codes[i])]
+
+    def timestamp(self, i: int) -> datetime:
+        return ns_to_datetime(int(self.timestamps_ns[i]))
+
+    def take(self, index: Any) -> "DetectionBatch":
+        """Rows selected by a slice, an index array or a boolean mask."""
+        rows = None
+        if self.attributes is not None or self.covariances is not None:
+            rows = np.arange(len(self))[index].tolist()
+        return DetectionBatch(
+            self.positions[index],
+            self.confidences[index],
+            self.timestamps_ns[index],
+            self.sensor_codes[index],
+            self.sensor_ids,
+            None if self.velocities is None else self.velocities[index],
+            None if self.attributes is None else [self.attributes[i] for i in rows],  # type: ignore[union-attr]
+            None if self.covariances is None else [self.covariances[i] for i in rows],  # type: ignore[union-attr]
+        )
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, (int, np.integer)):
+            return self.row(int(index))
+        return self.take(index)
+
+    # ------------------------------------------------------------ to objects
+
+    def row(self, i: int) -> Detection:
+        return self.rows((i,))[0]
+
+    def to_detections(self) -> List[Detection]:
+        return self.rows(range(len(self)))
+
+    def rows(self, index: Iterable[int]) -> List[Detection]:
+        """Detections for the given row numbers (each timestamp decoded once)."""
+        xyz = self.positions.tolist()
+        conf = self.confidences.tolist()
+        stamps = self.timestamps_ns.tolist()
+        codes = self.sensor_codes.tolist()
+        vel = self.velocities.tolist() if self.velocities is not None else None
+        has_vel = (~np.isnan(self.velocities[:, 0])).tolist() if self.velocities is not None else None
+        names = self.sensor_ids
+        attrs = self.attributes
+        covs = self.covariances
+        memo: Dict[int, datetime] = {}
+        out = []
+        for i in index:
+            ns = stamps[i]
+            ts = memo.get(ns)
+            if ts is None:
+                ts = memo[ns] = ns_to_datetime(ns)
+            x, y, z = xyz[i]
+            v = None
+            if vel is not None and has_vel[i]:  # NaN row -> no velocity
+                v = Velocity3D(vx=vel[i][0], vy=vel[i][1], vz=vel[i][2])
+            out.append(
+                Detection(
+                    sensor_id=names[codes[i]],
+                    timestamp=ts,
+                    position=Position3D(x=x, y=y, z=z),
+                    confidence=Confidence(conf[i]),
+                    velocity=v,
+                    covariance=covs[i] if covs is not None else None,
+                    attributes=attrs[i] if attrs is not None else {},
+                )
+            )
+        return out
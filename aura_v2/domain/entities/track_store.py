@@ -0,0 +1,408 @@
+# aura_v2/domain/entities/track_store.py
+from __future__ import annotations
+
+import copy
+import dataclasses
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from ..value_objects import Confidence, Position3D, Velocity3D
+from .detection_batch import datetime_to_ns, ns_to_datetime
+from .track import ThreatLevel, Track, TrackState, TrackStatus
+
+__all__ = ["TrackStore", "TrackView", "STATUS_CODES"]
+
+# Status is stored as its index in this tuple.
+STATUS_CODES = tuple(TrackStatus)
+_STATUS_CODE = {s: i for i, s in enumerate(STATUS_CODES)}
+_THREATS = {t.value: t for t in ThreatLevel}
+
+
+class TrackStore:
+    """
+    All fields of many tracks in preallocated column arrays.
+
+    Row ``slot`` of every column belongs to one track: ``state`` (x, y, z,
+    vx, vy, vz), ``confidence``, ``threat``, ``status`` (index into
+    ``STATUS_CODES``), ``created_ns``/``updated_ns`` (ns since the epoch),
+    ``hits``, ``missed`` and ``has_velocity``. Capacity doubles when full;
+    removed slots go on a free list and are reused before the high-water
+    mark moves, so a slot index stays valid for the lifetime of its track.
+
+    Each live track has one cached :class:`TrackView`, a ``Track`` whose
+    fields read and write the columns. Removing a track detaches its view
+    onto a private one-row store, so views held by callers (deleted-track
+    lists, write-behind queues) keep their last values after the slot is
+    reused.
+    """
+
+    _COLUMNS = {
+        "state": ((6,), np.float64, 0.0),
+        "confidence": ((), np.float64, 1.0),
+        "threat": ((), np.int8, 0),
+        "status": ((), np.int8, 0),
+        "created_ns": ((), np.int64, 0),
+        "updated_ns": ((), np.int64, 0),
+        "hits": ((), np.int32, 0),
+        "missed": ((), np.int32, 0),
+        "has_velocity": ((), np.bool_, True),
+        "alive": ((), np.bool_, False),
+    }
+
+    state: np.ndarray
+    confidence: np.ndarray
+    threat: np.ndarray
+    status: np.ndarray
+    created_ns: np.ndarray
+    updated_ns: np.ndarray
+    hits: np.ndarray
+    missed: np.ndarray
+    has_velocity: np.ndarray
+    alive: np.ndarray
+
+    def __init__(self, capacity: int = 1024) -> None:
+        cap = max(1, int(capacity))
+        for name, (shape, dtype, fill) in self._COLUMNS.items():
+            setattr(self, name, np.full((cap, *shape), fill, dtype=dtype))
+        self._ids: List[Optional[str]] = [None] * cap
+        self._views: List[Optional[TrackView]] = [None] * cap
+        self._slot: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._top = 0  # slots [0, _top) have been handed out at least once
+
+    # ----------------------------------------------------------------- storage
+
+    @staticmethod
+    def code(status: TrackStatus) -> int:
+        """Column value stored for ``status``."""
+        return _STATUS_CODE[status]
+
+    @property
+    def capacity(self) -> int:
+        return len(self._ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (excluding ids and views)."""
+        return sum(getattr(self, name).nbytes for name in self._COLUMNS)
+
+    def __len__(self) -> int:
+        return len(self._slot)
+
+    def __contains__(self, track_id: object) -> bool:
+        return track_id in self._slot
+
+    def __iter__(self) -> Iterator["TrackView"]:
+        return (v for v in self._views[: self._top] if v is not None)
+
+    def get(self, track_id: str) -> Optional["TrackView"]:
+        slot = self._slot.get(track_id)
+        return None if slot is None else self._views[slot]
+
+    def live_slots(self) -> np.ndarray:
+        return np.flatnonzero(self.alive[: self._top])
+
+    def slots(self, views: Iterable["TrackView"]) -> np.ndarray:
+        return np.fromiter((v._slot for v in views), dtype=np.intp)
+
+    def ids_at(self, slots: Iterable[int]) -> List[str]:
+        """Track ids held in ``slots`` (all must be live)."""
+        ids = self._ids
+        return [ids[s] for s in slots]  # type: ignore[misc]
+
+    def slots_of(self, track_ids: Iterable[str]) -> np.ndarray:
+        """Slots of ``track_ids`` (KeyError for unknown ids)."""
+        slot = self._slot
+        return np.fromiter((slot[t] for t in track_ids), dtype=np.intp)
+
+    def columns(self, slots: np.ndarray) -> Dict[str, np.ndarray]:
+        """Copy of every field column at ``slots`` (``alive`` excluded)."""
+        return {name: getattr(self, name)[slots] for name in _FIELDS}
+
+    def assign(self, slots: np.ndarray, columns: Dict[str, np.ndarray]) -> None:
+        """Write field columns (as returned by :meth:`columns`) into ``slots``."""
+        for name in _FIELDS:
+            getattr(self, name)[slots] = columns[name]
+
+    @staticmethod
+    def gather(views: Sequence["TrackView"]) -> Dict[str, np.ndarray]:
+        """:meth:`columns` for ``views`` that may live in different (or detached) stores."""
+        if not views:
+            return TrackStore(capacity=1).columns(np.empty(0, dtype=np.intp))
+        rows = [v._store.columns(np.array([v._slot])) for v in views]
+        return {name: np.concatenate([r[name] for r in rows]) for name in _FIELDS}
+
+    def _grow(self) -> None:
+        old = self.capacity
+        for name, (shape, dtype, fill) in self._COLUMNS.items():
+            col = np.full((2 * old, *shape), fill, dtype=dtype)
+            col[:old] = getattr(self, name)
+            setattr(self, name, col)
+        self._ids.extend([None] * old)
+        self._views.extend([None] * old)
+
+    def _take_slot(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._top == self.capacity:
+            self._grow()
+        self._top += 1
+        return self._top - 1
+
+    def add(
+        self,
+        track_id: str,
+        position: Sequence[float],
+        velocity: Optional[Sequence[float]] = None,
+        *,
+        status: TrackStatus = TrackStatus.TENTATIVE,
+        confidence: float = 1.0,
+        threat_level: int = 0,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        hits: int = 1,
+        missed: int = 0,
+    ) -> "TrackView":
+        """Insert a track (defaults as in ``Track``) and return its view."""
+        if track_id in self._slot:
+            raise KeyError(f"track {track_id!r} already in store")
+        now = datetime.now(timezone.utc)
+        slot = self._take_slot()
+        self.state[slot, :3] = position
+        self.state[slot, 3:] = velocity if velocity is not None else 0.0
+        self.has_velocity[slot] = velocity is not None
+        self.confidence[slot] = float(confidence)
+        self.threat[slot] = int(threat_level)
+        self.status[slot] = _STATUS_CODE[status]
+        self.created_ns[slot] = datetime_to_ns(created_at or now)
+        self.updated_ns[slot] = datetime_to_ns(updated_at or now)
+        self.hits[slot] = hits
+        self.missed[slot] = missed
+        self.alive[slot] = True
+        self._ids[slot] = track_id
+        self._slot[track_id] = slot
+        view = self._views[slot] = TrackView(self, slot, track_id)
+        return view
+
+    def adopt(self, track: Track) -> "TrackView":
+        """Copy a ``Track`` (or another store's view) into this store."""
+        p = track.state.position
+        v = track.state.velocity
+        return self.add(
+            track.id,
+            (p.x, p.y, p.z),
+            (v.vx, v.vy, v.vz) if v is not None else None,
+            status=track.status,
+            confidence=float(track.confidence),
+            threat_level=int(track.threat_level),
+            created_at=track.created_at,
+            updated_at=track.updated_at,
+            hits=track.hits,
+            missed=track.missed,
+        )
+
+    def remove(self, track_id: str) -> Optional["TrackView"]:
+        """Free the track's slot; its view is detached and returned."""
+        slot = self._slot.pop(track_id, None)
+        if slot is None:
+            return None
+        view = self._views[slot]
+        assert view is not None
+        private = TrackStore(capacity=1)
+        private.adopt(view)
+        view._store, view._slot = private, 0
+        private._views[0] = view
+        self.alive[slot] = False
+        self._ids[slot] = None
+        self._views[slot] = None
+        self._free.append(slot)
+        return view
+
+
+_FIELDS = tuple(name for name in TrackStore._COLUMNS if name != "alive")
+
+
+class _StateView(TrackState):
+    """``TrackState`` whose position/velocity live in a ``TrackStore`` row."""
+
+    __slots__ = ("_store", "_slot")
+
+    def __new__(cls, *args: Any, **fields: Any) -> Any:
+        # dataclasses.replace() calls cls(position=..., velocity=...):
+        # hand back a detached TrackState rather than a broken view.
+        if fields:
+            return TrackState(**fields)
+        return super().__new__(cls)
+
+    def __init__(self, store: TrackStore, slot: int) -> None:
+        self._store = store
+        self._slot = slot
+
+    def to_state(self) -> TrackState:
+        """Plain ``TrackState`` copy of the row."""
+        return TrackState(position=self.position, velocity=self.velocity)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _StateView):
+            other = other.to_state()
+        if not isinstance(other, TrackState):
+            return NotImplemented
+        return self.to_state() == other
+
+    # Copies and pickles detach from the store instead of dragging it along.
+    def __copy__(self) -> TrackState:
+        return self.to_state()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> TrackState:
+        return copy.deepcopy(self.to_state(), memo)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return TrackState, (self.position, self.velocity)
+
+    @property  # type: ignore[override]
+    def position(self) -> Position3D:
+        x, y, z = self._store.state[self._slot, :3].tolist()
+        return Position3D(x, y, z)
+
+    @position.setter
+    def position(self, p: Position3D) -> None:
+        self._store.state[self._slot, :3] = (p.x, p.y, p.z)
+
+    @property  # type: ignore[override]
+    def velocity(self) -> Optional[Velocity3D]:  # type: ignore[override]
+        s = self._store
+        if not s.has_velocity[self._slot]:
+            return None
+        vx, vy, vz = s.state[self._slot, 3:].tolist()
+        return Velocity3D(vx, vy, vz)
+
+    @velocity.setter
+    def velocity(self, v: Optional[Velocity3D]) -> None:
+        s = self._store
+        s.has_velocity[self._slot] = v is not None
+        s.state[self._slot, 3:] = (v.vx, v.vy, v.vz) if v is not None else 0.0
+
+
+class TrackView(Track):
+    """
+    A ``Track`` backed by one row of a :class:`TrackStore`.
+
+    Reads build the usual value objects from the columns; assignments
+    (``view.state = ...``, ``view.state.position = ...``, ``view.hits += 1``,
+    ``Track.update``) write straight into the row.
+    """
+
+    __slots__ = ("id", "_store", "_slot")
+
+    def __new__(cls, *args: Any, **fields: Any) -> Any:
+        # dataclasses.replace() calls cls(id=..., state=..., ...): hand
+        # back a detached Track rather than a broken view.
+        if fields:
+            return Track(**fields)
+        return super().__new__(cls)
+
+    def __init__(self, store: TrackStore, slot: int, track_id: str) -> None:
+        self.id = track_id
+        self._store = store
+        self._slot = slot
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TrackView):
+            other = other.to_track()
+        if not isinstance(other, Track):
+            return NotImplemented
+        return self.to_track() == other
+
+    # Copies and pickles are plain Tracks: copying a view must not copy (or
+    # keep alive) the whole backing store.
+    def __copy__(self) -> Track:
+        return self.to_track()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Track:
+        return copy.deepcopy(self.to_track(), memo)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        t = self.to_track()
+        return Track, tuple(getattr(t, f.name) for f in dataclasses.fields(Track))
+
+    def to_track(self) -> Track:
+        """Plain ``Track`` copy of the row (no link back to the store)."""
+        return Track(
+            id=self.id,
+            state=_StateView(self._store, self._slot).to_state(),
+            status=self.status,
+            confidence=self.confidence,
+            threat_level=self.threat_level,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            hits=self.hits,
+            missed=self.missed,
+        )
+
+    @property  # type: ignore[override]
+    def state(self) -> TrackState:
+        return _StateView(self._store, self._slot)
+
+    @state.setter
+    def state(self, st: TrackState) -> None:
+        sv = _StateView(self._store, self._slot)
+        sv.position = st.position
+        sv.velocity = st.velocity
+
+    @property  # type: ignore[override]
+    def status(self) -> TrackStatus:
+        return STATUS_CODES[self._store.status[self._slot]]
+
+    @status.setter
+    def status(self, value: TrackStatus) -> None:
+        self._store.status[self._slot] = _STATUS_CODE[TrackStatus(value)]
+
+    @property  # type: ignore[override]
+    def confidence(self) -> Confidence:
+        return Confidence(float(self._store.confidence[self._slot]))
+
+    @confidence.setter
+    def confidence(self, value: Confidence | float) -> None:
+        self._store.confidence[self._slot] = float(value)
+
+    @property  # type: ignore[override]
+    def threat_level(self) -> ThreatLevel:
+        return _THREATS[int(self._store.threat[self._slot])]
+
+    @threat_level.setter
+    def threat_level(self, value: ThreatLevel | int) -> None:
+        self._store.threat[self._slot] = int(value)
+
+    @property  # type: ignore[override]
+    def created_at(self) -> datetime:
+        return ns_to_datetime(self._store.created_ns[self._slot])
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._store.created_ns[self._slot] = datetime_to_ns(value)
+
+    @property  # type: ignore[override]
+    def updated_at(self) -> datetime:
+        return ns_to_datetime(self._store.updated_ns[self._slot])
+
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self._store.updated_ns[self._slot] = datetime_to_ns(value)
+
+    @property  # type: ignore[override]
+    def hits(self) -> int:
+        return int(self._store.hits[self._slot])
+
+    @hits.setter
+    def hits(self, value: int) -> None:
+        self._store.hits[self._slot] = value
+
+    @property  # type: ignore[override]
+    def missed(self) -> int:
+        return int(self._store.missed[self._slot])
+
+    @missed.setter
+    def missed(self, value: int) -> None:
+        self._store.missed[self._slot] = value
@@ -1,9 +1,20 @@
 # aura_v2/domain/services/association.py
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from itertools import chain
+from typing import List, Optional, Sequence, Tuple
 import numpy as np
-from scipy.optimize import linear_sum_assignment
-from ..entities import Detection, Track
+from ..association.assignment import ComponentStats, sparse_assignment
+from ..association.spatial_index import candidate_pairs
+from ..entities import Detection, DetectionBatch, Track
+
+
+def positions_array(points: Sequence) -> np.ndarray:
+    """Stack objects with ``.x/.y/.z`` into an (N, 3) float array."""
+    n = len(points)
+    flat = np.fromiter(
+        chain.from_iterable((p.x, p.y, p.z) for p in points), dtype=float, count=3 * n
+    )
+    return flat.reshape(n, 3)
 
 
 class AssociationStrategy(ABC):
@@ -16,43 +27,92 @@ class AssociationStrategy(ABC):
         """Associates detections to tracks."""
         pass
 
+    def associate_batch(
+        self,
+        tracks: List[Track],
+        batch: DetectionBatch,
+        track_xyz: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Columnar variant: ``(track_idx, det_idx, score)`` arrays, one entry
+        per matched pair. ``track_xyz`` optionally gives the (N, 3) track
+        positions when the caller already has them as an array. The default
+        builds Detections and defers to :meth:`associate`; strategies
+        working on positions override it.
+        """
+        dets = batch.to_detections()
+        pairs = self.associate(tracks, dets)
+        t_pos = {id(t): i for i, t in enumerate(tracks)}
+        d_pos = {id(d): j for j, d in enumerate(dets)}
+        return (
+            np.fromiter((t_pos[id(t)] for t, _, _ in pairs), dtype=np.intp, count=len(pairs)),
+            np.fromiter((d_pos[id(d)] for _, d, _ in pairs), dtype=np.intp, count=len(pairs)),
+            np.fromiter((s for _, _, s in pairs), dtype=float, count=len(pairs)),
+        )
+
 
 class GNN_AssociationStrategy(AssociationStrategy):
-    """Global Nearest Neighbor association strategy."""
+    """
+    Global Nearest Neighbor association strategy. ``last_stats`` holds the
+    component breakdown of the latest ``assign`` call, as on
+    ``HungarianAssociationStrategy``.
+    """
 
-    def __init__(self, max_distance: float = 50.0):
+    def __init__(self, max_distance: float = 50.0, index: str = "kdtree"):
         self.max_distance = max_distance
+        self.index = index  # "kdtree" or "grid", see domain.association.spatial_index
+        self.last_stats = ComponentStats()
+
+    def assign(
+        self, track_xyz: np.ndarray, det_xyz: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Optimal assignment on raw (N, 3) / (M, 3) position arrays.
+
+        Returns ``(track_idx, det_idx, distance)`` for pairs within
+        ``max_distance``.
+        """
+        rows, cols, dist = candidate_pairs(
+            track_xyz, det_xyz, self.max_distance, method=self.index
+        )
+        stats = ComponentStats()
+        e = sparse_assignment(len(track_xyz), len(det_xyz), rows, cols, dist, stats=stats)
+        self.last_stats = stats
+        return rows[e], cols[e], dist[e]
 
     def associate(
         self, tracks: List[Track], detections: List[Detection]
     ) -> List[Tuple[Track, Detection, float]]:
         """
         Associates detections to tracks using Global Nearest Neighbor (GNN) algorithm.
-        This is a concrete implementation.
+        Only pairs within ``max_distance`` are generated (spatial index) and each
+        connected cluster of them is solved on its own.
         """
         if not tracks or not detections:
+            self.last_stats = ComponentStats()
             return []
 
-        # Create a cost matrix
-        cost_matrix = np.full((len(tracks), len(detections)), self.max_distance + 1.0)
-        for i, track in enumerate(tracks):
-            for j, detection in enumerate(detections):
-                distance = np.linalg.norm(
-                    track.state.position.to_array() - detection.position.to_array()
-                )
-                if distance < self.max_distance:
-                    cost_matrix[i, j] = distance
-
-        # Use the Hungarian algorithm to find the optimal assignment
-        track_indices, detection_indices = linear_sum_assignment(cost_matrix)
-
-        associations = []
-        for track_idx, det_idx in zip(track_indices, detection_indices):
-            if cost_matrix[track_idx, det_idx] <= self.max_distance:
-                track = tracks[track_idx]
-                detection = detections[det_idx]
-                # Score can be inverse of distance, or simply 1.0
-                score = 1.0 / (1.0 + cost_matrix[track_idx, det_idx])
-                associations.append((track, detection, score))
-
-        return associations
+        rows, cols, dist = self.assign(
+            positions_array([t.state.position for t in tracks]),
+            positions_array([d.position for d in detections]),
+        )
+        scores = 1.0 / (1.0 + dist)
+        return [
+            (tracks[i], detections[j], s)
+            for i, j, s in zip(rows.tolist(), cols.tolist(), scores.tolist())
+        ]
+
+    def associate_batch(
+        self,
+        tracks: List[Track],
+        batch: DetectionBatch,
+        track_xyz: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if not tracks or not len(batch):
+            self.last_stats = ComponentStats()
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty, np.empty(0)
+        if track_xyz is None:
+            track_xyz = positions_array([t.state.position for t in tracks])
+        rows, cols, dist = self.assign(track_xyz, batch.positions)
+        return rows, cols, 1.0 / (1.0 + dist)
@@ -1,50 +1,108 @@
 from __future__ import annotations
-from typing import List, Tuple
-import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 import numpy as np
-from scipy.optimize import linear_sum_assignment
+from ..association.assignment import ComponentStats, sparse_assignment
+from ..association.spatial_index import candidate_pairs
+from ..entities import DetectionBatch
 
 # Minimal protocol for Track/Detection used here:
 #  - Track: .id (str), .state.position -> tuple[float,float] or (x,y,...) indexable
 #  - Detection: .id (str), .position -> tuple[float,float] or (x,y,...) indexable
+#  - or a DetectionBatch: matched rows come back as Detections, unmatched
+#    ones as a DetectionBatch
 
 
-def _euclidean(a, b) -> float:
-    ax, ay = a[0], a[1]
-    bx, by = b[0], b[1]
-    dx, dy = ax - bx, ay - by
-    return math.hypot(dx, dy)
+def _xy(points: List[object]) -> np.ndarray:
+    out = np.empty((len(points), 2), dtype=float)
+    for k, p in enumerate(points):
+        if hasattr(p, "x"):
+            out[k, 0], out[k, 1] = p.x, p.y  # type: ignore[attr-defined]
+        else:
+            out[k, 0], out[k, 1] = p[0], p[1]  # type: ignore[index]
+    return out
 
 
 class HungarianAssociationStrategy:
-    def __init__(self, max_distance: float = 5.0) -> None:
+    """
+    Gated Hungarian association on 2D positions.
+
+    The gate graph is solved per connected component (see
+    ``sparse_assignment``). With ``workers > 1`` clusters of at least
+    ``parallel_min_size`` cells are solved on a thread pool. ``last_stats``
+    holds the component breakdown of the latest frame.
+    """
+
+    def __init__(
+        self,
+        max_distance: float = 5.0,
+        index: str = "kdtree",
+        workers: int = 0,
+        parallel_min_size: int = 256,
+    ) -> None:
         self.max_distance = max_distance
+        self.index = index
+        self.workers = int(workers)
+        self.parallel_min_size = int(parallel_min_size)
+        self.last_stats = ComponentStats()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def _executor(self) -> Optional[ThreadPoolExecutor]:
+        if self.workers <= 1:
+            return None
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="aura-assoc"
+            )
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
 
     def associate(
         self,
         tracks: List[object],
-        detections: List[object],
-    ) -> Tuple[List[Tuple[object, object]], List[object], List[object]]:
-        if not tracks or not detections:
-            return [], list(detections), list(tracks)
-
-        n_t, n_d = len(tracks), len(detections)
-        cost = np.zeros((n_t, n_d), dtype=np.float32)
-        for i, tr in enumerate(tracks):
-            tp = tr.state.position
-            for j, det in enumerate(detections):
-                dp = det.position
-                d = _euclidean(tp, dp)
-                cost[i, j] = d if d <= self.max_distance else 1e6  # effectively forbid
-
-        rows, cols = linear_sum_assignment(cost)
-        matched, used_t, used_d = [], set(), set()
-        for i, j in zip(rows, cols):
-            if cost[i, j] < 1e6:
-                matched.append((tracks[i], detections[j]))
-                used_t.add(i)
-                used_d.add(j)
-
-        unmatched_tracks = [t for i, t in enumerate(tracks) if i not in used_t]
-        unmatched_dets = [d for j, d in enumerate(detections) if j not in used_d]
+        detections: List[object] | DetectionBatch,
+    ) -> Tuple[List[Tuple[object, object]], List[object] | DetectionBatch, List[object]]:
+        batch = detections if isinstance(detections, DetectionBatch) else None
+        if not tracks or not len(detections):
+            self.last_stats = ComponentStats()
+            return [], detections if batch is not None else list(detections), list(tracks)
+
+        # Sparse gate: only pairs within max_distance (2D) ever get a cost.
+        det_xy = batch.xy if batch is not None else _xy([det.position for det in detections])  # type: ignore[attr-defined]
+        rows, cols, dist = candidate_pairs(
+            _xy([tr.state.position for tr in tracks]),  # type: ignore[attr-defined]
+            det_xy,
+            self.max_distance,
+            method=self.index,
+        )
+        stats = ComponentStats()
+        e = sparse_assignment(
+            len(tracks),
+            len(detections),
+            rows,
+            cols,
+            dist,
+            forbidden=1e6,
+            executor=self._executor(),
+            parallel_min_size=self.parallel_min_size,
+            stats=stats,
+        )
+        self.last_stats = stats
+
+        picked = cols[e].tolist()
+        det_rows = batch.rows(picked) if batch is not None else [detections[j] for j in picked]
+        matched = [(tracks[i], d) for i, d in zip(rows[e].tolist(), det_rows)]
+        used_t = np.zeros(len(tracks), dtype=bool)
+        used_d = np.zeros(len(detections), dtype=bool)
+        used_t[rows[e]] = True
+        used_d[cols[e]] = True
+
+        unmatched_tracks = [t for t, u in zip(tracks, used_t.tolist()) if not u]
+        if batch is not None:
+            return matched, batch.take(~used_d), unmatched_tracks
+        unmatched_dets = [d for d, u in zip(detections, used_d.tolist()) if not u]
         return matched, unmatched_dets, unmatched_tracks
@@ -0,0 +1,228 @@
+# aura_v2/infrastructure/persistence/codec.py
+from __future__ import annotations
+
+import dataclasses
+from datetime import datetime, timezone
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Callable, Dict, Mapping, Optional
+
+try:
+    import numpy as _np  # type: ignore
+except Exception:  # pragma: no cover
+    _np = None  # type: ignore
+
+from aura_v2.domain.entities import (
+    Detection,
+    ThreatLevel,
+    Track,
+    TrackState,
+    TrackStatus,
+    TrackView,
+)
+from aura_v2.domain.value_objects import (
+    Confidence,
+    CovarianceMatrix,
+    Position3D,
+    Velocity3D,
+)
+
+# Flat document codecs for the persistence hot path.
+#
+# Encoders are plain functions over fixed attribute getters, dispatched by
+# exact type; no dataclass/asdict reflection. Documents are flat:
+#
+#   Track:     _id id x y z vx vy vz status confidence threat_level
+#              created_at updated_at hits missed
+#   Detection: sensor_id timestamp x y z confidence [vx vy vz] [covariance]
+#              attributes
+#
+# Datetimes are stored as BSON dates (ms precision, naive UTC on the way back;
+# decoders re-attach UTC). Anything without a registered encoder goes through
+# the reflective ``_jsonify``.
+
+__all__ = [
+    "encode",
+    "encode_position",
+    "encode_velocity",
+    "encode_state",
+    "encode_track",
+    "decode_track",
+    "encode_detection",
+    "decode_detection",
+]
+
+
+def _is_dc_instance(o: Any) -> bool:
+    return dataclasses.is_dataclass(o) and not isinstance(o, type)
+
+
+def _jsonify(obj: Any) -> Any:
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if _np is not None and isinstance(obj, _np.generic):  # type: ignore[attr-defined]
+        return obj.item()
+    if isinstance(obj, Enum):
+        return obj.value
+    if _is_dc_instance(obj):
+        return {k: _jsonify(v) for k, v in dataclasses.asdict(obj).items()}
+    if hasattr(obj, "model_dump"):
+        try:
+            data = obj.model_dump(mode="python")  # type: ignore[attr-defined]
+            return {k: _jsonify(v) for k, v in data.items()}
+        except Exception:
+            pass
+    if hasattr(obj, "dict"):
+        try:
+            data = obj.dict()  # type: ignore[call-arg]
+            return {k: _jsonify(v) for k, v in data.items()}
+        except Exception:
+            pass
+    if isinstance(obj, Mapping):
+        return {k: _jsonify(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [_jsonify(v) for v in obj]
+    if hasattr(obj, "__dict__"):
+        return {k: _jsonify(v) for k, v in vars(obj).items()}
+    return str(obj)
+
+
+_xyz = attrgetter("x", "y", "z")
+_vxyz = attrgetter("vx", "vy", "vz")
+
+
+def _value(e: Any) -> Any:
+    return e.value if isinstance(e, Enum) else e
+
+
+def _utc(ts: Any) -> Any:
+    if isinstance(ts, datetime) and ts.tzinfo is None:
+        return ts.replace(tzinfo=timezone.utc)
+    return ts
+
+
+# ---------------------------------------------------------------- encoders
+
+
+def encode_position(p: Position3D) -> Dict[str, Any]:
+    x, y, z = _xyz(p)
+    return {"x": float(x), "y": float(y), "z": float(z)}
+
+
+def encode_velocity(v: Optional[Velocity3D]) -> Dict[str, Any]:
+    if v is None:
+        return {}
+    vx, vy, vz = _vxyz(v)
+    return {"vx": float(vx), "vy": float(vy), "vz": float(vz)}
+
+
+def encode_state(st: TrackState) -> Dict[str, Any]:
+    doc = encode_position(st.position)
+    doc.update(encode_velocity(st.velocity))
+    return doc
+
+
+def encode_track(track: Track) -> Dict[str, Any]:
+    tid = track.id
+    if not tid:
+        raise ValueError("track must include one of: id, track_id, _id")
+    st = track.state
+    x, y, z = _xyz(st.position)
+    doc: Dict[str, Any] = {
+        "_id": str(tid),
+        "id": tid,
+        "x": float(x),
+        "y": float(y),
+        "z": float(z),
+    }
+    if st.velocity is not None:
+        vx, vy, vz = _vxyz(st.velocity)
+        doc["vx"] = float(vx)
+        doc["vy"] = float(vy)
+        doc["vz"] = float(vz)
+    doc["status"] = _value(track.status)
+    doc["confidence"] = float(track.confidence)
+    doc["threat_level"] = int(_value(track.threat_level))
+    doc["created_at"] = track.created_at
+    doc["updated_at"] = track.updated_at
+    doc["hits"] = int(track.hits)
+    doc["missed"] = int(track.missed)
+    return doc
+
+
+def encode_detection(det: Detection) -> Dict[str, Any]:
+    x, y, z = _xyz(det.position)
+    doc: Dict[str, Any] = {
+        "sensor_id": det.sensor_id,
+        "timestamp": det.timestamp,
+        "x": float(x),
+        "y": float(y),
+        "z": float(z),
+        "confidence": float(det.confidence),
+    }
+    if det.velocity is not None:
+        doc.update(encode_velocity(det.velocity))
+    if det.covariance is not None:
+        doc["covariance"] = [list(map(float, row)) for row in det.covariance.matrix]
+    doc["attributes"] = _jsonify(det.attributes) if det.attributes else {}
+    return doc
+
+
+_ENCODERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    Track: encode_track,
+    TrackView: encode_track,
+    TrackState: encode_state,
+    Position3D: encode_position,
+    Velocity3D: encode_velocity,
+    Detection: encode_detection,
+}
+
+
+def encode(obj: Any) -> Any:
+    """Flat document for known domain types, reflective ``_jsonify`` otherwise."""
+    fn = _ENCODERS.get(type(obj))
+    if fn is not None:
+        return fn(obj)
+    return _jsonify(obj)
+
+
+# ---------------------------------------------------------------- decoders
+
+
+def _velocity(doc: Mapping[str, Any]) -> Optional[Velocity3D]:
+    if "vx" not in doc:
+        return None
+    return Velocity3D(doc["vx"], doc["vy"], doc["vz"])
+
+
+def decode_track(doc: Mapping[str, Any]) -> Track:
+    tid = doc.get("id")
+    if tid is None:
+        tid = str(doc["_id"])
+    return Track(
+        id=tid,
+        state=TrackState(
+            position=Position3D(doc["x"], doc["y"], doc["z"]),
+            velocity=_velocity(doc),  # type: ignore[arg-type]
+        ),
+        status=TrackStatus(doc["status"]),
+        confidence=Confidence(doc["confidence"]),
+        threat_level=ThreatLevel(doc["threat_level"]),
+        created_at=_utc(doc["created_at"]),
+        updated_at=_utc(doc["updated_at"]),
+        hits=doc["hits"],
+        missed=doc["missed"],
+    )
+
+
+def decode_detection(doc: Mapping[str, Any]) -> Detection:
+    cov = doc.get("covariance")
+    return Detection(
+        sensor_id=doc["sensor_id"],
+        timestamp=_utc(doc["timestamp"]),
+        position=Position3D(doc["x"], doc["y"], doc["z"]),
+        confidence=Confidence(doc["confidence"]),
+        velocity=_velocity(doc),
+        covariance=CovarianceMatrix(matrix=cov) if cov is not None else None,
+        attributes=dict(doc.get("attributes") or {}),
+    )
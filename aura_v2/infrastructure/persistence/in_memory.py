@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from copy import deepcopy
 from threading import RLock
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 try:
     from aura_v2.domain.entities import Track
@@ -25,6 +25,14 @@ class InMemoryTrackRepository:
             self._store[track.id] = track
             return track.id
 
+    async def save_many(self, tracks: Iterable[Track]) -> List[str]:
+        with self._lock:
+            ids = []
+            for t in tracks:
+                self._store[t.id] = t
+                ids.append(t.id)
+            return ids
+
     async def get_by_id(self, track_id: str) -> Optional[Track]:
         with self._lock:
             return self._store.get(str(track_id))
@@ -37,6 +45,12 @@ class InMemoryTrackRepository:
         with self._lock:
             return 1 if self._store.pop(str(track_id), None) is not None else 0
 
+    async def delete_many(self, track_ids: Iterable[str]) -> int:
+        with self._lock:
+            return sum(
+                1 for tid in track_ids if self._store.pop(str(tid), None) is not None
+            )
+
     async def delete_all(self) -> int:
         with self._lock:
             n = len(self._store)
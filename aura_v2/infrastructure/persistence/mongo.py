@@ -1,21 +1,16 @@
 from __future__ import annotations
 
-import dataclasses
 import os
-from enum import Enum
-from typing import Any, Dict, Mapping, Optional, List
-
-try:
-    import numpy as _np  # type: ignore
-except Exception:  # pragma: no cover
-    _np = None  # type: ignore
+from typing import Any, Dict, Iterable, Mapping, Optional, List
 
 from motor.motor_asyncio import (
     AsyncIOMotorClient,
     AsyncIOMotorCollection,
     AsyncIOMotorDatabase,
 )
+from pymongo import DeleteOne, ReplaceOne
 
+from aura_v2.infrastructure.persistence.codec import _jsonify, decode_track, encode_track
 from aura_v2.infrastructure.persistence.mongo_client import MongoProvider
 
 try:
@@ -25,43 +20,18 @@ try:
         Position3D,  # type: ignore[attr-defined]
         Velocity3D,  # type: ignore[attr-defined]
         TrackStatus,  # type: ignore[attr-defined]
+        TrackView,  # type: ignore[attr-defined]
     )
 except Exception:  # noqa: BLE001
     from aura_v2.domain.entities.track import Track, TrackState, Position3D, Velocity3D, TrackStatus  # type: ignore[no-redef]
+    from aura_v2.domain.entities.track_store import TrackView  # type: ignore[no-redef]
 
 
-def _is_dc_instance(o: Any) -> bool:
-    return dataclasses.is_dataclass(o) and not isinstance(o, type)
-
-
-def _jsonify(obj: Any) -> Any:
-    if obj is None or isinstance(obj, (bool, int, float, str)):
-        return obj
-    if _np is not None and isinstance(obj, _np.generic):  # type: ignore[attr-defined]
-        return obj.item()
-    if isinstance(obj, Enum):
-        return obj.value
-    if _is_dc_instance(obj):
-        return {k: _jsonify(v) for k, v in dataclasses.asdict(obj).items()}
-    if hasattr(obj, "model_dump"):
-        try:
-            data = obj.model_dump(mode="python")  # type: ignore[attr-defined]
-            return {k: _jsonify(v) for k, v in data.items()}
-        except Exception:
-            pass
-    if hasattr(obj, "dict"):
-        try:
-            data = obj.dict()  # type: ignore[call-arg]
-            return {k: _jsonify(v) for k, v in data.items()}
-        except Exception:
-            pass
-    if isinstance(obj, Mapping):
-        return {k: _jsonify(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple, set)):
-        return [_jsonify(v) for v in obj]
-    if hasattr(obj, "__dict__"):
-        return {k: _jsonify(v) for k, v in vars(obj).items()}
-    return str(obj)
+def _encode_track(track: Any) -> Dict[str, Any]:
+    """Flat codec document for domain tracks, reflective ``_to_doc`` otherwise."""
+    if type(track) is Track or type(track) is TrackView:
+        return encode_track(track)
+    return MongoTrackRepository._to_doc(track)
 
 
 def _reconstruct_state(data: Dict[str, Any]) -> None:
@@ -153,6 +123,9 @@ class MongoTrackRepository:
 
     @staticmethod
     def _to_track(doc: Mapping[str, Any]) -> Track:
+        if "state" not in doc and "x" in doc:
+            return decode_track(doc)
+        # Legacy nested documents written before the flat codec
         data: Dict[str, Any] = dict(doc)
         raw_id = str(data.pop("_id")) if "_id" in data else None
         if "id" not in data and raw_id is not None:
@@ -164,10 +137,19 @@ class MongoTrackRepository:
         return Track(**data)  # type: ignore[call-arg]
 
     async def save(self, track: Any) -> str:
-        doc = self._to_doc(track)
+        doc = _encode_track(track)
         await self._collection.replace_one({"_id": doc["_id"]}, doc, upsert=True)
         return str(doc["_id"])
 
+    async def save_many(self, tracks: Iterable[Any]) -> List[str]:
+        """Upsert many tracks with one unordered ``bulk_write``."""
+        docs = [_encode_track(t) for t in tracks]
+        if not docs:
+            return []
+        ops = [ReplaceOne({"_id": d["_id"]}, d, upsert=True) for d in docs]
+        await self._collection.bulk_write(ops, ordered=False)
+        return [str(d["_id"]) for d in docs]
+
     async def get_by_id(self, track_id: str) -> Optional[Track]:
         doc = await self._collection.find_one(
             {"$or": [{"_id": track_id}, {"id": track_id}, {"track_id": track_id}]}
@@ -184,6 +166,14 @@ class MongoTrackRepository:
         res = await self._collection.delete_one({"_id": track_id})
         return int(res.deleted_count)
 
+    async def delete_many(self, track_ids: Iterable[str]) -> int:
+        """Delete many tracks with one unordered ``bulk_write``."""
+        ops = [DeleteOne({"_id": str(tid)}) for tid in track_ids]
+        if not ops:
+            return 0
+        res = await self._collection.bulk_write(ops, ordered=False)
+        return int(res.deleted_count)
+
     async def delete_all(self) -> int:
         res = await self._collection.delete_many({})
         return int(res.deleted_count)
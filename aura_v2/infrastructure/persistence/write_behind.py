@@ -0,0 +1,140 @@
+# aura_v2/infrastructure/persistence/write_behind.py
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+__all__ = ["WriteBehindTrackSink", "SinkStats"]
+
+# Marker for "delete this id" in the pending map
+_DELETE = object()
+
+
+@dataclass
+class SinkStats:
+    submitted_frames: int = 0
+    flushes: int = 0
+    upserts: int = 0
+    deletes: int = 0
+    errors: int = 0
+    pending: int = 0
+    last_flush_ms: float = 0.0
+    last_error: Optional[str] = None
+
+
+class WriteBehindTrackSink:
+    """
+    Coalescing write-behind buffer in front of a track repository.
+
+    The tracker submits one delta per frame (tracks to upsert, ids to
+    delete). Deltas are merged per track id, so a slow store sees at most one
+    write per track however many frames went by, and the last state wins.
+
+    ``schedule()`` drains the buffer on a background task of the running loop;
+    ``flush()`` drains it inline. Repositories exposing ``save_many`` /
+    ``delete_many`` get one call per flush, otherwise ``save`` / ``delete``
+    are called per item.
+    """
+
+    def __init__(self, repository: Any) -> None:
+        self.repository = repository
+        self.stats = SinkStats()
+        self._pending: Dict[str, Any] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(self, upserts: Iterable[Any] = (), deletes: Iterable[str] = ()) -> None:
+        for track in upserts:
+            self._pending[str(track.id)] = track
+        for track_id in deletes:
+            self._pending[str(track_id)] = _DELETE
+        self.stats.submitted_frames += 1
+        self.stats.pending = len(self._pending)
+
+    def schedule(self) -> None:
+        """Make sure a background drain is running on the current loop."""
+        if not self._pending:
+            return
+        loop = asyncio.get_running_loop()
+        task = self._task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._task = loop.create_task(self._drain())
+
+    async def flush(self) -> None:
+        """Write everything submitted so far."""
+        async with self._get_lock():
+            while self._pending:
+                await self._write_once()
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        ):
+            await task
+        await self.flush()
+
+    # ----------------------------------------------------------------- internals
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def _drain(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            # Already counted in stats; the delta stays pending for the next frame.
+            pass
+
+    async def _write_once(self) -> None:
+        batch, self._pending = self._pending, {}
+        upserts: List[Any] = []
+        deletes: List[str] = []
+        for key, item in batch.items():
+            if item is _DELETE:
+                deletes.append(key)
+            else:
+                upserts.append(item)
+
+        t0 = time.perf_counter()
+        try:
+            repo = self.repository
+            if upserts:
+                if hasattr(repo, "save_many"):
+                    await repo.save_many(upserts)
+                else:
+                    for track in upserts:
+                        await repo.save(track)
+            if deletes:
+                if hasattr(repo, "delete_many"):
+                    await repo.delete_many(deletes)
+                else:
+                    for track_id in deletes:
+                        await repo.delete(track_id)
+        except BaseException as e:
+            # Put back whatever was not superseded by a newer submit.
+            for key, item in batch.items():
+                self._pending.setdefault(key, item)
+            self.stats.pending = len(self._pending)
+            if isinstance(e, Exception):
+                self.stats.errors += 1
+                self.stats.last_error = repr(e)
+            raise
+        self.stats.flushes += 1
+        self.stats.upserts += len(upserts)
+        self.stats.deletes += len(deletes)
+        self.stats.pending = len(self._pending)
+        self.stats.last_flush_ms = (time.perf_counter() - t0) * 1000.0
@@ -1,7 +1,15 @@
 from __future__ import annotations
-from typing import Dict, Any
+import asyncio
+import time
+from typing import Dict, Any, List, Mapping, Optional
+from pymongo.errors import BulkWriteError
 from .mongo_client import MongoProvider
 from .schemas import Detection, TrackEvent, MetricPoint, AuditLog
+from ..telemetry.metrics import (
+    mongo_writer_docs_total,
+    mongo_writer_flush_seconds,
+    mongo_writer_queue_depth,
+)
 
 
 class MongoWriter:
@@ -25,3 +33,153 @@ class MongoWriter:
     async def health() -> Dict[str, Any]:
         ok = await MongoProvider.ping()
         return {"mongo": "ok" if ok else "down"}
+
+
+class BufferedMongoWriter:
+    """
+    Async batching counterpart of ``MongoWriter``.
+
+    Documents go into a bounded queue per collection and are written with
+    ``insert_many(ordered=False)`` once ``max_batch`` documents are waiting or
+    the ``max_age_s`` tick fires, whichever comes first. A full queue makes
+    ``write*`` wait (backpressure) instead of growing without limit.
+
+    Call ``start()`` inside the running loop, ``flush()`` to wait until
+    everything queued so far is written, and ``close()`` on shutdown.
+    """
+
+    def __init__(
+        self,
+        db: Any = None,
+        max_batch: int = 500,
+        max_age_s: float = 0.2,
+        max_queue: int = 10_000,
+    ) -> None:
+        if max_batch <= 0 or max_queue <= 0:
+            raise ValueError("max_batch and max_queue must be positive")
+        self._db = db
+        self.max_batch = int(max_batch)
+        self.max_age_s = float(max_age_s)
+        self.max_queue = int(max_queue)
+        self._queues: Dict[str, asyncio.Queue[Mapping[str, Any]]] = {}
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._closed = False
+        self._written: Dict[str, int] = {}
+        self._failed: Dict[str, int] = {}
+        self._last_flush_ms: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------ lifecycle
+
+    async def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._resolve_db()
+        self._closed = False
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def flush(self) -> None:
+        """Write everything queued so far."""
+        await self._drain(force=True)
+        for q in list(self._queues.values()):
+            await q.join()
+
+    async def close(self) -> None:
+        self._closed = True
+        task, self._task = self._task, None
+        if task is not None:
+            assert self._wake is not None
+            self._wake.set()
+            await task
+        await self.flush()
+
+    # ------------------------------------------------------------------ writes
+
+    async def write(self, collection: str, doc: Mapping[str, Any]) -> None:
+        if self._closed:
+            raise RuntimeError("writer is closed")
+        q = self._queues.get(collection)
+        if q is None:
+            q = self._queues[collection] = asyncio.Queue(maxsize=self.max_queue)
+        await q.put(doc)
+        mongo_writer_queue_depth.labels(collection).set(q.qsize())
+        if q.qsize() >= self.max_batch and self._wake is not None:
+            self._wake.set()
+
+    async def write_detection(self, doc: Detection) -> None:
+        await self.write("detections", doc.to_bson())
+
+    async def write_track_event(self, doc: TrackEvent) -> None:
+        await self.write("tracks", doc.to_bson())
+
+    async def write_metric(self, doc: MetricPoint) -> None:
+        await self.write("metrics", doc.to_bson())
+
+    async def write_audit(self, doc: AuditLog) -> None:
+        await self.write("audit", doc.to_bson())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            name: {
+                "queued": q.qsize(),
+                "written": self._written.get(name, 0),
+                "failed": self._failed.get(name, 0),
+                "last_flush_ms": self._last_flush_ms.get(name, 0.0),
+            }
+            for name, q in self._queues.items()
+        }
+
+    # ------------------------------------------------------------------ internals
+
+    def _resolve_db(self) -> Any:
+        # Resolved once, not per write like the static MongoWriter
+        if self._db is None:
+            self._db = MongoProvider.db()
+        if self._db is None:
+            raise RuntimeError("MongoProvider is not initialised")
+        return self._db
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.max_age_s)
+                # woken early: only full batches are due
+                self._wake.clear()
+                await self._drain(force=False)
+            except asyncio.TimeoutError:
+                # age tick: everything waiting is due
+                await self._drain(force=True)
+
+    async def _drain(self, force: bool) -> None:
+        for name, q in list(self._queues.items()):
+            while q.qsize() >= self.max_batch or (force and not q.empty()):
+                n = min(q.qsize(), self.max_batch)
+                batch = [q.get_nowait() for _ in range(n)]
+                mongo_writer_queue_depth.labels(name).set(q.qsize())
+                try:
+                    await self._insert(name, batch)
+                finally:
+                    for _ in range(n):
+                        q.task_done()
+
+    async def _insert(self, name: str, batch: List[Mapping[str, Any]]) -> None:
+        t0 = time.perf_counter()
+        ok = len(batch)
+        try:
+            await self._resolve_db()[name].insert_many(batch, ordered=False)
+        except BulkWriteError as e:
+            ok = int(e.details.get("nInserted", 0))
+        except Exception:
+            # The batch is dropped and counted; the writer keeps going.
+            ok = 0
+        dt = time.perf_counter() - t0
+        mongo_writer_flush_seconds.labels(name).observe(dt)
+        self._last_flush_ms[name] = dt * 1000.0
+        self._written[name] = self._written.get(name, 0) + ok
+        if ok:
+            mongo_writer_docs_total.labels(name, "written").inc(ok)
+        if ok < len(batch):
+            self._failed[name] = self._failed.get(name, 0) + len(batch) - ok
+            mongo_writer_docs_total.labels(name, "failed").inc(len(batch) - ok)
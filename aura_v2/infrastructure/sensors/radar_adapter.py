@@ -1,12 +1,51 @@
 # aura_v2/infrastructure/sensors/radar_adapter.py
 import asyncio
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import AsyncIterator, Dict, List
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import numpy as np
 
-from ...domain.entities import Detection
-from ...domain.value_objects import Confidence, Position3D, Velocity3D
+from ...domain.entities import Detection, DetectionBatch
+from .cfar import CFAR
+from .range_doppler import RangeDopplerPipeline
+
+
+@dataclass
+class RadarStats:
+    frames: int = 0
+    overruns: int = 0  # frames that finished after their slot at frame_rate
+    dsp_ms: float = 0.0  # last frame's FFT + CFAR time
+
+
+@dataclass(frozen=True, eq=False)
+class RadarBatch:
+    """
+    One radar frame of detections as columns: the generic ``batch`` plus
+    the radar measurements behind each row. Every row shares the frame
+    timestamp.
+    """
+
+    batch: DetectionBatch
+    range_m: np.ndarray
+    azimuth: np.ndarray
+    elevation: np.ndarray
+    doppler: np.ndarray  # radial velocity, m/s
+    snr: np.ndarray  # dB
+    rcs: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.batch)
+
+    def to_detections(self) -> List[Detection]:
+        """Legacy object form, with rcs/snr/doppler in each attributes dict."""
+        attrs = [
+            {"rcs": c, "snr": s, "doppler": d}
+            for c, s, d in zip(self.rcs.tolist(), self.snr.tolist(), self.doppler.tolist())
+        ]
+        return replace(self.batch, attributes=attrs or None).to_detections()
 
 
 class RadarAdapter:
@@ -17,134 +56,161 @@ class RadarAdapter:
         device_path: str = "/dev/radar0",
         sample_rate: int = 1000000,  # 1 MHz
         range_resolution: float = 0.5,  # meters
-        velocity_resolution: float = 0.1,
-    ):  # m/s
+        velocity_resolution: float = 0.1,  # m/s
+        cfar: Optional[CFAR] = None,
+        frame_shape: Tuple[int, int] = (256, 128),  # range bins x chirps
+        window: Optional[str] = "hann",
+        fft_workers: Optional[int] = None,
+        frame_rate: float = 20.0,  # Hz
+        offload_dsp: bool = True,
+    ):
         self.device_path = device_path
         self.sample_rate = sample_rate
         self.range_res = range_resolution
         self.vel_res = velocity_resolution
+        # 4 guard + 16 training cells per side, CA, pfa 1e-6
+        self.cfar = cfar or CFAR()
+        self.pipeline = RangeDopplerPipeline(frame_shape, window=window, workers=fft_workers)
+        self.frame_rate = frame_rate
+        self.stats = RadarStats()
+        # FFT and CFAR release the GIL, so a worker thread keeps the event
+        # loop free while a frame is processed. One thread: the pipeline's
+        # buffers are reused frame to frame.
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="radar-dsp")
+            if offload_dsp
+            else None
+        )
+        self._rng = np.random.default_rng()
         self._connected = False
 
     async def stream(self) -> AsyncIterator[List[Detection]]:
         """Stream detections from radar"""
+        async for frame in self.stream_batches():
+            yield frame.to_detections()
+
+    async def stream_batches(self) -> AsyncIterator[RadarBatch]:
+        """Stream one columnar RadarBatch per radar frame"""
+        loop = asyncio.get_running_loop()
+        period = 1.0 / self.frame_rate if self.frame_rate > 0 else 0.0
+        deadline = loop.time()
 
         while True:
             try:
                 # Simulate radar data acquisition
                 raw_data = await self._read_radar_frame()
+                timestamp = datetime.now(timezone.utc)
 
-                # Process range-doppler map
-                range_doppler = self._process_range_doppler(raw_data)
-
-                # CFAR detection
-                detections = self._cfar_detect(range_doppler)
-
-                # Convert to domain entities
-                domain_detections = []
-                for det in detections:
-                    position = self._polar_to_cartesian(
-                        det["range"], det["azimuth"], det["elevation"]
-                    )
-
-                    detection = Detection(
-                        timestamp=datetime.now(timezone.utc),
-                        position=Position3D(
-                            x=position[0], y=position[1], z=position[2]
-                        ),
-                        velocity=Velocity3D(vx=det["doppler_velocity"], vy=0, vz=0),
-                        confidence=Confidence(min(1.0, det["snr"] / 30.0)),
-                        sensor_id="radar_main",
-                        attributes={
-                            "rcs": det["rcs"],
-                            "snr": det["snr"],
-                            "doppler": det["doppler_velocity"],
-                        },
+                # Range-doppler map, CFAR and conversion, off the event loop
+                if self._executor is not None:
+                    frame = await loop.run_in_executor(
+                        self._executor, self._process_frame, raw_data, timestamp
                     )
-                    domain_detections.append(detection)
-
-                yield domain_detections
-
-                # Control update rate
-                await asyncio.sleep(0.05)  # 20 Hz
+                else:
+                    frame = self._process_frame(raw_data, timestamp)
+
+                yield frame
+
+                # Control update rate: fixed frame slots, so processing time
+                # does not stretch the period
+                self.stats.frames += 1
+                deadline += period
+                delay = deadline - loop.time()
+                if delay < 0:
+                    self.stats.overruns += 1
+                    deadline = loop.time()
+                    delay = 0.0
+                await asyncio.sleep(delay)
 
             except Exception as e:
                 # Log error and continue
                 print(f"Radar error: {e}")
                 await asyncio.sleep(0.1)
+                deadline = loop.time()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     async def _read_radar_frame(self) -> np.ndarray:
         """Simulate reading radar frame"""
-        # Generate synthetic radar data for testing
-        return np.random.complex128((256, 128))
+        # Generate synthetic radar data for testing, straight into the
+        # pipeline's input buffer (real and imaginary parts interleaved)
+        buf = self.pipeline.frame_buffer()
+        self._rng.standard_normal(out=buf.view(np.float64))
+        return buf
+
+    def _process_frame(self, raw_data: np.ndarray, timestamp: datetime) -> RadarBatch:
+        t = time.perf_counter()
+        detections = self._cfar_columns(self._process_range_doppler(raw_data))
+        frame = self._frame_batch(detections, timestamp)
+        self.stats.dsp_ms = (time.perf_counter() - t) * 1000.0
+        return frame
 
     def _process_range_doppler(self, raw_data: np.ndarray) -> np.ndarray:
         """Generate range-doppler map from raw radar data"""
-        # FFT for range processing
-        range_fft = np.fft.fft(raw_data, axis=0)
-
-        # FFT for doppler processing
-        doppler_fft = np.fft.fft(range_fft, axis=1)
-
-        # Power spectrum
-        range_doppler = np.abs(doppler_fft) ** 2
-
-        return range_doppler
-
-    def _cfar_detect(self, range_doppler: np.ndarray, pfa: float = 1e-6) -> List[Dict]:
+        # Windowed range FFT, doppler FFT and power spectrum in the
+        # pipeline's preallocated buffers
+        return self.pipeline.process(raw_data)
+
+    def _cfar_columns(
+        self, range_doppler: np.ndarray, pfa: Optional[float] = None
+    ) -> Dict[str, np.ndarray]:
+        """CFAR detections as arrays, keyed like the _cfar_detect dicts"""
+        cfar = self.cfar
+        if pfa is not None and pfa != cfar.pfa:
+            cfar = replace(cfar, pfa=pfa)
+
+        r, d, noise = cfar.detect(range_doppler)
+        cut = np.asarray(range_doppler, dtype=np.float64)[r, d]
+        cols = range_doppler.shape[1]
+        zeros = np.zeros(len(r))
+
+        return {
+            "range": r * self.range_res,
+            "doppler_velocity": (d - cols // 2) * self.vel_res,
+            "snr": 10 * np.log10(cut / noise),
+            "azimuth": zeros,  # Would come from antenna array
+            "elevation": zeros,
+            "rcs": cut,  # Radar cross section
+        }
+
+    def _cfar_detect(
+        self, range_doppler: np.ndarray, pfa: Optional[float] = None
+    ) -> List[Dict]:
         """Constant False Alarm Rate detection"""
-        detections = []
-
-        # CFAR parameters
-        guard_cells = 4
-        training_cells = 16
-
-        rows, cols = range_doppler.shape
-
-        # Scan through range-doppler map
-        for r in range(
-            guard_cells + training_cells, rows - guard_cells - training_cells
-        ):
-            for d in range(
-                guard_cells + training_cells, cols - guard_cells - training_cells
-            ):
-                # Cell under test
-                cut = range_doppler[r, d]
-
-                # Training cells (excluding guard cells)
-                training = []
-                for i in range(
-                    -training_cells - guard_cells, training_cells + guard_cells + 1
-                ):
-                    for j in range(
-                        -training_cells - guard_cells, training_cells + guard_cells + 1
-                    ):
-                        if abs(i) > guard_cells or abs(j) > guard_cells:
-                            training.append(range_doppler[r + i, d + j])
-
-                # CFAR threshold
-                noise_level = np.mean(training)
-                threshold = noise_level * (-np.log(pfa))
-
-                # Detection
-                if cut > threshold:
-                    detections.append(
-                        {
-                            "range": r * self.range_res,
-                            "doppler_velocity": (d - cols // 2) * self.vel_res,
-                            "snr": 10 * np.log10(cut / noise_level),
-                            "azimuth": 0,  # Would come from antenna array
-                            "elevation": 0,
-                            "rcs": cut,  # Radar cross section
-                        }
-                    )
-
-        return detections
-
-    def _polar_to_cartesian(
-        self, range_m: float, azimuth_rad: float, elevation_rad: float
-    ) -> np.ndarray:
-        """Convert polar coordinates to Cartesian"""
-        x = range_m * np.cos(elevation_rad) * np.cos(azimuth_rad)
-        y = range_m * np.cos(elevation_rad) * np.sin(azimuth_rad)
+        c = self._cfar_columns(range_doppler, pfa)
+        keys = list(c)
+        rows = zip(*(c[k].tolist() for k in keys))
+        return [dict(zip(keys, row)) for row in rows]
+
+    def _frame_batch(self, det: Dict[str, np.ndarray], timestamp: datetime) -> RadarBatch:
+        """Columnar frame from _cfar_columns output"""
+        doppler = det["doppler_velocity"]
+        velocities = np.zeros((len(doppler), 3))
+        velocities[:, 0] = doppler
+        batch = DetectionBatch.from_columns(
+            self._polar_to_cartesian(det["range"], det["azimuth"], det["elevation"]),
+            np.clip(det["snr"] / 30.0, 0.0, 1.0),
+            timestamp,
+            "radar_main",
+            velocities=velocities,
+        )
+        return RadarBatch(
+            batch,
+            det["range"],
+            det["azimuth"],
+            det["elevation"],
+            doppler,
+            det["snr"],
+            det["rcs"],
+        )
+
+    def _polar_to_cartesian(self, range_m, azimuth_rad, elevation_rad) -> np.ndarray:
+        """Convert polar coordinates to Cartesian: (3,) for scalars, (N, 3) for arrays"""
+        cos_el = np.cos(elevation_rad)
+        x = range_m * cos_el * np.cos(azimuth_rad)
+        y = range_m * cos_el * np.sin(azimuth_rad)
         z = range_m * np.sin(elevation_rad)
-        return np.array([x, y, z])
+        return np.stack([x, y, z], axis=-1)
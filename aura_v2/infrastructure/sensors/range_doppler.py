@@ -0,0 +1,67 @@
+# aura_v2/infrastructure/sensors/range_doppler.py
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+import scipy.fft
+import scipy.signal
+
+__all__ = ["RangeDopplerPipeline"]
+
+
+class RangeDopplerPipeline:
+    """
+    Range-doppler processing for a fixed frame shape with no per-frame
+    allocation: raw IQ -> window -> range FFT (axis 0) -> doppler FFT
+    (axis 1) -> power.
+
+    The windowed frame, the spectrum and the power map are buffers owned by
+    the pipeline. ``process`` returns the power buffer itself, which the
+    next call overwrites, so copy it if it must outlive the frame.
+
+    ``window`` is any ``scipy.signal.get_window`` name applied separably on
+    both axes, or ``None`` for the unwindowed map RadarAdapter used to
+    compute. ``workers`` is passed to ``scipy.fft`` (``-1`` = all cores).
+    """
+
+    def __init__(
+        self,
+        shape: Tuple[int, int] = (256, 128),
+        window: Optional[str] = "hann",
+        workers: Optional[int] = None,
+    ):
+        self.shape = tuple(shape)
+        self.workers = workers
+        rows, cols = self.shape
+        if window is None:
+            self._window = None
+        else:
+            w_r = scipy.signal.get_window(window, rows)
+            w_d = scipy.signal.get_window(window, cols)
+            self._window = np.outer(w_r, w_d)
+        self._raw = np.empty(self.shape, dtype=np.complex128)
+        self._spectrum = np.empty(self.shape, dtype=np.complex128)
+        self._power = np.empty(self.shape, dtype=np.float64)
+
+    def frame_buffer(self) -> np.ndarray:
+        """Input buffer a reader can fill in place and pass to ``process``."""
+        return self._raw
+
+    def process(self, raw: np.ndarray) -> np.ndarray:
+        """Power map ``|FFT2(window * raw)|**2`` in the pipeline's buffer."""
+        if raw.shape != self.shape:
+            raise ValueError(f"expected a {self.shape} frame, got {raw.shape}")
+        spec = self._spectrum
+        if self._window is None:
+            np.copyto(spec, raw)
+        else:
+            np.multiply(raw, self._window, out=spec)
+        # overwrite_x lets pocketfft transform the buffer in place (it
+        # returns the same memory for contiguous complex input).
+        spec = scipy.fft.fft(spec, axis=0, overwrite_x=True, workers=self.workers)
+        spec = scipy.fft.fft(spec, axis=1, overwrite_x=True, workers=self.workers)
+        power = self._power
+        np.abs(spec, out=power)
+        np.square(power, out=power)
+        return power
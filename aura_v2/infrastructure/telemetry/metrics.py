@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 naive_ts_rejections = Counter(
     "aura_naive_ts_rejections_total", "Naive timestamps rejected by API"
@@ -8,3 +8,21 @@ ts_skew_seconds = Histogram(
     "Absolute timestamp skew vs server (seconds)",
     buckets=[1, 5, 10, 30, 60, 120, 300, 600],
 )
+
+# Buffered Mongo writer
+mongo_writer_queue_depth = Gauge(
+    "aura_mongo_writer_queue_depth",
+    "Documents waiting in the buffered Mongo writer",
+    ["collection"],
+)
+mongo_writer_flush_seconds = Histogram(
+    "aura_mongo_writer_flush_seconds",
+    "insert_many latency per flushed batch (seconds)",
+    ["collection"],
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0],
+)
+mongo_writer_docs_total = Counter(
+    "aura_mongo_writer_docs_total",
+    "Documents handled by the buffered Mongo writer",
+    ["collection", "outcome"],
+)
@@ -0,0 +1,179 @@
+# aura_v2/infrastructure/tracking/kalman_bank.py
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np  # type: ignore[import-not-found]
+
+__all__ = ["KalmanBank"]
+
+
+class KalmanBank:
+    """
+    Constant-velocity Kalman filters for many tracks, stored column-wise.
+
+    Every track owns one row of ``x`` (N×6: x, y, z, vx, vy, vz) and one
+    slice of ``P`` (N×6×6). Rows ``[0, len(bank))`` are always live: removing
+    a track moves the last row into the freed slot so the batched kernels
+    never have to skip holes.
+
+    The maths mirrors the per-track ``filterpy.kalman.KalmanFilter`` set up
+    by ``ModernTracker._init_kf`` (same F/H/Q/R/P0, Joseph-form update), so
+    both backends produce the same estimates.
+    """
+
+    dim_x = 6
+    dim_z = 3
+
+    def __init__(
+        self,
+        capacity: int = 64,
+        p0: float = 10.0,
+        r: float = 0.5,
+        q: float = 0.01,
+    ) -> None:
+        capacity = max(1, int(capacity))
+        self._x = np.zeros((capacity, self.dim_x), dtype=float)
+        self._P = np.zeros((capacity, self.dim_x, self.dim_x), dtype=float)
+        self._ids: List[str] = []
+        self._slot: Dict[str, int] = {}
+
+        self.P0 = np.eye(self.dim_x, dtype=float) * float(p0)
+        self.R = np.eye(self.dim_z, dtype=float) * float(r)
+        self.Q = np.eye(self.dim_x, dtype=float) * float(q)
+        self.H = np.hstack([np.eye(self.dim_z), np.zeros((self.dim_z, 3))]).astype(float)
+        self._I = np.eye(self.dim_x, dtype=float)
+
+    # ----------------------------------------------------------------- storage
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, track_id: object) -> bool:
+        return track_id in self._slot
+
+    @property
+    def ids(self) -> List[str]:
+        """Track ids in row order (row ``i`` of ``x``/``P`` belongs to ``ids[i]``)."""
+        return list(self._ids)
+
+    @property
+    def x(self) -> np.ndarray:
+        """View of the live state rows (N×6)."""
+        return self._x[: len(self._ids)]
+
+    @property
+    def P(self) -> np.ndarray:
+        """View of the live covariance blocks (N×6×6)."""
+        return self._P[: len(self._ids)]
+
+    def _grow(self, needed: int) -> None:
+        cap = self._x.shape[0]
+        if needed <= cap:
+            return
+        while cap < needed:
+            cap *= 2
+        x = np.zeros((cap, self.dim_x), dtype=float)
+        P = np.zeros((cap, self.dim_x, self.dim_x), dtype=float)
+        n = len(self._ids)
+        x[:n] = self._x[:n]
+        P[:n] = self._P[:n]
+        self._x, self._P = x, P
+
+    def add(
+        self,
+        track_id: str,
+        position: Iterable[float],
+        velocity: Optional[Iterable[float]] = None,
+    ) -> int:
+        """Start a filter for ``track_id`` (or reset it) and return its row."""
+        slot = self._slot.get(track_id)
+        if slot is None:
+            slot = len(self._ids)
+            self._grow(slot + 1)
+            self._ids.append(track_id)
+            self._slot[track_id] = slot
+        self._x[slot, :3] = np.asarray(tuple(position), dtype=float)
+        self._x[slot, 3:] = (
+            np.asarray(tuple(velocity), dtype=float) if velocity is not None else 0.0
+        )
+        self._P[slot] = self.P0
+        return slot
+
+    def remove(self, track_id: str) -> bool:
+        """Drop ``track_id``; the last row is moved into its slot."""
+        slot = self._slot.pop(track_id, None)
+        if slot is None:
+            return False
+        last = len(self._ids) - 1
+        if slot != last:
+            moved = self._ids[last]
+            self._x[slot] = self._x[last]
+            self._P[slot] = self._P[last]
+            self._ids[slot] = moved
+            self._slot[moved] = slot
+        self._ids.pop()
+        return True
+
+    def slots(self, track_ids: Iterable[str]) -> np.ndarray:
+        """Row indices for ``track_ids`` (KeyError for unknown ids)."""
+        return np.fromiter(
+            (self._slot[t] for t in track_ids), dtype=np.intp
+        )
+
+    # ------------------------------------------------------------------ kernels
+
+    def predict(self, dt: np.ndarray, slots: Optional[np.ndarray] = None) -> None:
+        """
+        Propagate the selected rows by their own ``dt`` (seconds).
+
+        ``slots=None`` means every live row, in which case ``dt`` has one entry
+        per row. Rows with ``dt <= 0`` are left untouched, like
+        ``ModernTracker.predict_track``.
+        """
+        idx = np.arange(len(self._ids)) if slots is None else np.asarray(slots, dtype=np.intp)
+        dt = np.asarray(dt, dtype=float).reshape(-1)
+        if idx.shape[0] != dt.shape[0]:
+            raise ValueError("dt must have one entry per selected track")
+        keep = dt > 0
+        if not keep.all():
+            idx, dt = idx[keep], dt[keep]
+        if idx.size == 0:
+            return
+
+        F = np.broadcast_to(self._I, (idx.size, self.dim_x, self.dim_x)).copy()
+        F[:, 0, 3] = dt
+        F[:, 1, 4] = dt
+        F[:, 2, 5] = dt
+
+        x = self._x[idx]
+        P = self._P[idx]
+        self._x[idx] = np.matmul(F, x[:, :, None])[:, :, 0]
+        self._P[idx] = np.matmul(np.matmul(F, P), F.transpose(0, 2, 1)) + self.Q
+
+    def update(self, slots: np.ndarray, z: np.ndarray) -> None:
+        """Fuse one position measurement per selected row (``z`` is K×3)."""
+        idx = np.asarray(slots, dtype=np.intp)
+        z = np.asarray(z, dtype=float).reshape(-1, self.dim_z)
+        if idx.shape[0] != z.shape[0]:
+            raise ValueError("z must have one row per selected track")
+        if idx.size == 0:
+            return
+
+        x = self._x[idx]
+        P = self._P[idx]
+
+        y = z - x[:, :3]
+        PHT = P[:, :, :3]
+        S = P[:, :3, :3] + self.R
+        # K = PHᵀ S⁻¹, solved as Sᵀ Kᵀ = (PHᵀ)ᵀ for every track at once
+        K = np.linalg.solve(S.transpose(0, 2, 1), PHT.transpose(0, 2, 1)).transpose(0, 2, 1)
+
+        x = x + np.matmul(K, y[:, :, None])[:, :, 0]
+        I_KH = self._I - np.matmul(K, self.H)
+        P = np.matmul(np.matmul(I_KH, P), I_KH.transpose(0, 2, 1)) + np.matmul(
+            np.matmul(K, self.R), K.transpose(0, 2, 1)
+        )
+
+        self._x[idx] = x
+        self._P[idx] = P
@@ -6,14 +6,39 @@ import os
 import time
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Protocol, Tuple, runtime_checkable
+from functools import partial
+from itertools import compress
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    runtime_checkable,
+)
 
 import numpy as np  # type: ignore[import-not-found]
 from filterpy.kalman import KalmanFilter
 
-from ...domain.entities import Detection, Track, TrackState, TrackStatus
+from ...domain.entities import (
+    Detection,
+    DetectionBatch,
+    Position3D,
+    Track,
+    TrackState,
+    TrackStatus,
+    TrackStore,
+    TrackView,
+)
+from ...domain.entities.detection_batch import datetime_to_ns
+from ...domain.services.association import AssociationStrategy, GNN_AssociationStrategy
 from ...infrastructure.persistence.in_memory import InMemoryTrackRepository  # type: ignore
 from ...infrastructure.persistence.mongo import MongoTrackRepository  # type: ignore
+from ...infrastructure.persistence.write_behind import WriteBehindTrackSink
+from .kalman_bank import KalmanBank
 
 try:
     from ...domain.value_objects.velocity import Velocity3D
@@ -55,63 +80,282 @@ class ModernTracker:
         ) = None,
         max_distance: float = 50.0,
         max_missed: int = 2,
+        batch_kalman: bool = False,
+        associator: Optional[AssociationStrategy] = None,
+        write_behind: bool = True,
+        track_store: bool = False,
+        id_prefix: str = "track_",
     ) -> None:
         self.track_repository: TrackRepo = track_repository or InMemoryTrackRepository()  # type: ignore[assignment]
+        # The tracker owns the live tracks; the repository is only a sink fed
+        # with one batched delta per frame. write_behind=False awaits the
+        # flush inside update() instead of draining in the background.
+        self._tracks: Dict[str, Track] = {}
+        self._hydrated = False
+        self.write_behind = bool(write_behind)
+        self.sink = WriteBehindTrackSink(self.track_repository)
         self.kalman_filters: Dict[str, KalmanFilter] = {}
+        # batch_kalman=True keeps every filter in one KalmanBank and runs
+        # predict/update for the whole frame as batched array ops.
+        # track_store=True (implies batch_kalman) also keeps the tracks in a
+        # TrackStore: tracks are TrackView rows and the per-frame bookkeeping
+        # runs on the columns instead of per Track object.
+        self.store: Optional[TrackStore] = TrackStore() if track_store else None
+        self.kalman_bank: Optional[KalmanBank] = (
+            KalmanBank() if batch_kalman or track_store else None
+        )
         self._id_counter: int = 0
+        self.id_prefix = str(id_prefix)
         self.max_distance = float(max_distance)
         self.max_missed = int(max_missed)
+        # Any AssociationStrategy can be plugged in; the default is gated GNN.
+        self.associator: AssociationStrategy = associator or GNN_AssociationStrategy(
+            max_distance=self.max_distance
+        )
         self.stale_after_sec = float(os.getenv("AURA_TRACK_STALE_SEC", "5.0"))
         self._frame_timestamp: Optional[datetime] = None
         self._last_obs: Dict[str, datetime] = {}
 
     async def update(
-        self, detections: List[Detection], timestamp: datetime
+        self, detections: List[Detection] | DetectionBatch, timestamp: datetime
     ) -> TrackingResult:
         start_time = time.time()
         self._frame_timestamp = self._to_dt(timestamp)
 
-        current_tracks = await self.track_repository.list()
+        if not self._hydrated:
+            await self._hydrate()
+        current_tracks = list(self._tracks.values())
+
+        if self.kalman_bank is not None:
+            self._predict_bank(current_tracks, self._frame_timestamp)
+        else:
+            for t in current_tracks:
+                self.predict_track(t, self._frame_timestamp)
+
+        if self.store is not None:
+            new_tracks = self._step_store(detections, current_tracks)
+        else:
+            new_tracks = self._step(detections, current_tracks)
+
+        deleted_tracks = self._prune()
+        if self.store is not None:
+            # _prune() already dropped every DELETED row from the working set
+            active_tracks = list(self._tracks.values())
+        else:
+            active_tracks = [
+                t for t in self._tracks.values() if t.status != TrackStatus.DELETED
+            ]
+
+        # Every live track changed this frame (predicted, updated or missed).
+        self.sink.submit(active_tracks, (t.id for t in deleted_tracks))
+        if self.write_behind:
+            self.sink.schedule()
+        else:
+            await self.sink.flush()
 
-        for t in current_tracks:
-            self.predict_track(t, self._frame_timestamp)
+        processing_time = (time.time() - start_time) * 1000.0
 
-        matched, unmatched_dets, unmatched_tracks = self._associate(
-            detections, current_tracks
+        return TrackingResult(
+            active_tracks=active_tracks,
+            new_tracks=new_tracks,
+            deleted_tracks=deleted_tracks,
+            processing_time_ms=processing_time,
         )
 
-        for track, det, score in matched:
-            self._update_track(track, det, score, self._frame_timestamp)
-            await self.track_repository.save(track)
+    async def update_columns(
+        self,
+        xyz: np.ndarray,
+        confidence: np.ndarray,
+        timestamps: Sequence[datetime],
+        sensor_ids: Sequence[str],
+        timestamp: datetime,
+        attributes: Optional[Sequence[Dict[str, Any]]] = None,
+    ) -> TrackingResult:
+        """Columnar entry point: row ``i`` of every column is one detection."""
+        batch = DetectionBatch.from_columns(
+            xyz, confidence, timestamps, sensor_ids, attributes=attributes
+        )
+        return await self.update(batch, timestamp)
+
+    def _step(
+        self, detections: List[Detection] | DetectionBatch, current_tracks: List[Track]
+    ) -> List[Track]:
+        """Associate, update matched tracks, start new ones, count misses."""
+        z: Optional[np.ndarray] = None
+        if isinstance(detections, DetectionBatch):
+            matched, unmatched_dets, unmatched_tracks, z = self._associate_batch(
+                detections, current_tracks
+            )
+        else:
+            matched, unmatched_dets, unmatched_tracks = self._associate(
+                detections, current_tracks
+            )
+
+        if self.kalman_bank is not None:
+            self._update_bank(matched, self._frame_timestamp, z)
+        else:
+            for track, det, score in matched:
+                self._update_track(track, det, score, self._frame_timestamp)
 
         new_tracks: List[Track] = []
         for det in unmatched_dets:
             nt = self._new_track_from_detection(det, self._frame_timestamp)
-            await self.track_repository.save(nt)
+            self._tracks[nt.id] = nt
             self._last_obs[nt.id] = self._frame_timestamp or datetime.now(timezone.utc)
             new_tracks.append(nt)
 
         for t in unmatched_tracks:
             t.missed = getattr(t, "missed", 0) + 1
-            await self.track_repository.save(t)
-
-        deleted_tracks = await self._prune()
-
-        processing_time = (time.time() - start_time) * 1000.0
-        active_tracks = [
-            t
-            for t in await self.track_repository.list()
-            if t.status != TrackStatus.DELETED
-        ]
-
-        return TrackingResult(
-            active_tracks=active_tracks,
-            new_tracks=new_tracks,
-            deleted_tracks=deleted_tracks,
-            processing_time_ms=processing_time,
+        return new_tracks
+
+    def _step_store(
+        self, detections: List[Detection] | DetectionBatch, live: List[Track]
+    ) -> List[Track]:
+        """
+        ``_step`` on TrackStore columns. The matched-track bookkeeping mirrors
+        ``Track.update`` followed by ``_after_update`` (position set to the
+        measurement, confidence to the score, hits += 2, TENTATIVE -> ACTIVE
+        at 3 hits, updated_at = frame time) as array ops.
+        """
+        st = self.store
+        bank = self.kalman_bank
+        assert st is not None and bank is not None
+        batch = (
+            detections
+            if isinstance(detections, DetectionBatch)
+            else DetectionBatch.from_detections(detections)
         )
+        now = self._frame_timestamp or datetime.now(timezone.utc)
+        ss = st.slots(live)
+        used_d = np.zeros(len(batch), dtype=bool)
+
+        if live and len(batch):
+            associate_batch = getattr(self.associator, "associate_batch", None) or partial(
+                AssociationStrategy.associate_batch, self.associator
+            )
+            ti, dj, score = associate_batch(live, batch, track_xyz=st.state[ss, :3])
+            used_d[dj] = True
+            m = ss[ti]
+            z = batch.positions[dj]
+            bslots = bank.slots(live[i].id for i in ti.tolist())
+            bank.update(bslots, z)
+            st.state[m] = bank.x[bslots]
+            st.has_velocity[m] = True
+
+            st.state[m, :3] = z
+            st.confidence[m] = score
+            st.hits[m] += 1
+            promote = (st.status[m] == TrackStore.code(TrackStatus.TENTATIVE)) & (
+                st.hits[m] >= 3
+            )
+            st.status[m[promote]] = TrackStore.code(TrackStatus.ACTIVE)
+            st.updated_ns[m] = datetime_to_ns(now)
+            st.missed[m] = 0
+            st.hits[m] += 1
+
+            missed = np.ones(len(live), dtype=bool)
+            missed[ti] = False
+            st.missed[ss[missed]] += 1
+        elif live:
+            st.missed[ss] += 1
+
+        new_tracks: List[Track] = []
+        for x, y, z_ in batch.positions[~used_d].tolist():
+            nt = self._new_track(Position3D(x=x, y=y, z=z_), now)
+            self._tracks[nt.id] = nt
+            new_tracks.append(nt)
+        return new_tracks
+
+    def active_tracks(self) -> List[Track]:
+        """Current working set, without running a frame."""
+        return [t for t in self._tracks.values() if t.status != TrackStatus.DELETED]
+
+    def reserve_ids(self, track_ids: Iterable[str]) -> None:
+        """
+        Move the id counter past every ``<id_prefix><number>`` id in
+        ``track_ids`` so new tracks never reuse an id this tracker (or an
+        earlier run of it) has handed out.
+        """
+        n = len(self.id_prefix)
+        for tid in track_ids:
+            if tid.startswith(self.id_prefix) and tid[n:].isdigit():
+                self._id_counter = max(self._id_counter, int(tid[n:]) + 1)
+
+    def detach(
+        self, track_ids: Sequence[str]
+    ) -> List[Tuple[Track, np.ndarray, np.ndarray]]:
+        """
+        Stop tracking ``track_ids`` without deleting them and return each as
+        ``(Track, x, P)``: a plain ``Track`` plus its Kalman state (6,) and
+        covariance (6, 6), ready for ``attach`` on another tracker. Unknown
+        ids are skipped.
+        """
+        out: List[Tuple[Track, np.ndarray, np.ndarray]] = []
+        bank = self.kalman_bank
+        for tid in track_ids:
+            t = self._tracks.pop(tid, None)
+            if t is None:
+                continue
+            if bank is not None and tid in bank:
+                slot = int(bank.slots([tid])[0])
+                x, P = bank.x[slot].copy(), bank.P[slot].copy()
+                bank.remove(tid)
+            elif tid in self.kalman_filters:
+                kf = self.kalman_filters.pop(tid)
+                x = np.asarray(kf.x, dtype=float).reshape(6)
+                P = np.array(kf.P, dtype=float)
+            else:
+                x, P = np.full(6, np.nan), np.full((6, 6), np.nan)
+            self._last_obs.pop(tid, None)
+            if self.store is not None:
+                self.store.remove(tid)
+            out.append((t.to_track() if isinstance(t, TrackView) else t, x, P))
+        return out
+
+    def attach(
+        self, items: Sequence[Tuple[Track, Optional[np.ndarray], Optional[np.ndarray]]]
+    ) -> None:
+        """
+        Take over tracks handed out by ``detach``. A NaN or ``None`` state
+        starts a fresh filter at the track's position.
+        """
+        self.reserve_ids(track.id for track, _, _ in items)
+        for track, x, P in items:
+            t = self.store.adopt(track) if self.store is not None else track
+            self._tracks[t.id] = t
+            self._init_kf(t)
+            if x is None or P is None or np.isnan(x).any():
+                continue
+            if self.kalman_bank is not None:
+                slot = int(self.kalman_bank.slots([t.id])[0])
+                self.kalman_bank.x[slot] = x
+                self.kalman_bank.P[slot] = P
+            else:
+                kf = self.kalman_filters[t.id]
+                kf.x = np.asarray(x, dtype=float).reshape(6, 1)
+                kf.P = np.array(P, dtype=float)
+
+    async def flush(self) -> None:
+        """Write all pending track deltas to the repository."""
+        await self.sink.flush()
+
+    async def close(self) -> None:
+        await self.sink.close()
+
+    async def _hydrate(self) -> None:
+        # One scan at start-up so a restart picks up persisted tracks.
+        persisted = await self.track_repository.list()
+        # Deleted tracks keep their ids in the repository too.
+        self.reserve_ids(t.id for t in persisted)
+        for t in persisted:
+            if t.status != TrackStatus.DELETED and t.id not in self._tracks:
+                self._tracks[t.id] = self.store.adopt(t) if self.store is not None else t
+        self._hydrated = True
 
     def predict_track(self, track: Track, timestamp: datetime | None) -> None:
+        if self.kalman_bank is not None:
+            self._predict_bank([track], timestamp)
+            return
         if track.id not in self.kalman_filters:
             self._init_kf(track)
         if timestamp is None or track.updated_at is None:
@@ -170,7 +414,15 @@ class ModernTracker:
             vz=float(kf.x[5, 0]),
         )
         track.state = replace(track.state, position=pos, velocity=vel)
+        self._after_update(track, detection, score, timestamp)
 
+    def _after_update(
+        self,
+        track: Track,
+        detection: Detection,
+        score: float,
+        timestamp: datetime | None,
+    ) -> None:
         if hasattr(track, "update"):
             track.update(detection, score)
 
@@ -181,45 +433,134 @@ class ModernTracker:
         track.missed = 0
         track.hits = getattr(track, "hits", 0) + 1
 
+    def _predict_bank(self, tracks: List[Track], timestamp: datetime | None) -> None:
+        bank = self.kalman_bank
+        assert bank is not None
+        for t in tracks:
+            if t.id not in bank:
+                self._init_kf(t)
+        if timestamp is None:
+            return
+        if self.store is not None:
+            st = self.store
+            ss = st.slots(tracks)
+            dt = (datetime_to_ns(timestamp) - st.updated_ns[ss]) / 1e9
+            slots = bank.slots(t.id for t in tracks)
+            bank.predict(dt, slots)
+            moved = dt > 0
+            st.state[ss[moved]] = bank.x[slots[moved]]
+            st.has_velocity[ss[moved]] = True
+            return
+        live = [t for t in tracks if t.updated_at is not None]
+        if not live:
+            return
+
+        dt = np.fromiter(
+            ((timestamp - t.updated_at).total_seconds() for t in live),
+            dtype=float,
+            count=len(live),
+        )
+        slots = bank.slots(t.id for t in live)
+        bank.predict(dt, slots)
+
+        moved = dt > 0
+        rows = bank.x[slots[moved]].tolist()
+        for t, row in zip(compress(live, moved), rows):
+            t.state = TrackState(
+                position=Position3D(x=row[0], y=row[1], z=row[2]),
+                velocity=Velocity3D(vx=row[3], vy=row[4], vz=row[5]),
+            )
+
+    def _update_bank(
+        self,
+        matched: List[Tuple[Track, Detection, float]],
+        timestamp: datetime | None,
+        z: Optional[np.ndarray] = None,
+    ) -> None:
+        bank = self.kalman_bank
+        assert bank is not None
+        if not matched:
+            return
+        slots = bank.slots(track.id for track, _, _ in matched)
+        if z is None:
+            z = np.array(
+                [[d.position.x, d.position.y, d.position.z] for _, d, _ in matched],
+                dtype=float,
+            )
+        bank.update(slots, z)
+
+        rows = bank.x[slots].tolist()
+        for (track, det, score), row in zip(matched, rows):
+            track.state = TrackState(
+                position=Position3D(x=row[0], y=row[1], z=row[2]),
+                velocity=Velocity3D(vx=row[3], vy=row[4], vz=row[5]),
+            )
+            self._after_update(track, det, score, timestamp)
+
     def _associate(
         self, detections: List[Detection], live_tracks: List[Track]
     ) -> Tuple[List[Tuple[Track, Detection, float]], List[Detection], List[Track]]:
         if not live_tracks:
             return [], detections, []
 
-        matched: List[Tuple[Track, Detection, float]] = []
-        used_tracks: set[int] = set()
-        used_dets: set[int] = set()
-
-        for j, det in enumerate(detections):
-            best_i = -1
-            best_dist = float("inf")
-            for i, tr in enumerate(live_tracks):
-                if i in used_tracks:
-                    continue
-                dist = self._euclidean(tr.state.position, det.position)
-                if dist < best_dist:
-                    best_dist = dist
-                    best_i = i
-            if best_i >= 0 and best_dist <= self.max_distance:
-                matched.append((live_tracks[best_i], det, 1.0 / (1.0 + best_dist)))
-                used_tracks.add(best_i)
-                used_dets.add(j)
-
-        unmatched_dets = [d for j, d in enumerate(detections) if j not in used_dets]
-        unmatched_tracks = [
-            t for i, t in enumerate(live_tracks) if i not in used_tracks
-        ]
+        matched = self.associator.associate(live_tracks, detections)
+
+        used_tracks = {id(t) for t, _, _ in matched}
+        used_dets = {id(d) for _, d, _ in matched}
+        unmatched_dets = [d for d in detections if id(d) not in used_dets]
+        unmatched_tracks = [t for t in live_tracks if id(t) not in used_tracks]
         return matched, unmatched_dets, unmatched_tracks
 
+    def _associate_batch(
+        self, batch: DetectionBatch, live_tracks: List[Track]
+    ) -> Tuple[
+        List[Tuple[Track, Detection, float]],
+        List[Detection],
+        List[Track],
+        Optional[np.ndarray],
+    ]:
+        """
+        Association and Kalman measurements straight from the batch columns;
+        Detection objects are built only for ``Track.update`` and new tracks.
+        ``z`` holds the matched measurements in ``matched`` order.
+        """
+        associate_batch = getattr(self.associator, "associate_batch", None)
+        if not live_tracks or associate_batch is None:
+            return (*self._associate(batch.to_detections(), live_tracks), None)
+
+        ti, dj, score = associate_batch(live_tracks, batch)
+        matched = [
+            (live_tracks[i], d, s)
+            for i, d, s in zip(ti.tolist(), batch.rows(dj.tolist()), score.tolist())
+        ]
+        used_t = np.zeros(len(live_tracks), dtype=bool)
+        used_d = np.zeros(len(batch), dtype=bool)
+        used_t[ti] = True
+        used_d[dj] = True
+        unmatched_dets = batch.rows(np.flatnonzero(~used_d).tolist())
+        unmatched_tracks = [t for t, u in zip(live_tracks, used_t.tolist()) if not u]
+        return matched, unmatched_dets, unmatched_tracks, batch.positions[dj]
+
     def _new_track_from_detection(
         self, detection: Detection, now: datetime | None
     ) -> Track:
+        return self._new_track(detection.position, now)
+
+    def _new_track(self, position: Position3D, now: datetime | None) -> Track:
         now_nn = now or datetime.now(timezone.utc)
         track_id = self._next_track_id()
-        state = TrackState(
-            position=detection.position, velocity=Velocity3D(0.0, 0.0, 0.0)
-        )
+        if self.store is not None:
+            view = self.store.add(
+                track_id,
+                (position.x, position.y, position.z),
+                (0.0, 0.0, 0.0),
+                status=TrackStatus.ACTIVE,
+                created_at=now_nn,
+                updated_at=now_nn,
+            )
+            self._init_kf(view)
+            return view
+        state = TrackState(position=position, velocity=Velocity3D(0.0, 0.0, 0.0))
         track = Track(
             id=track_id,
             state=state,
@@ -233,6 +574,15 @@ class ModernTracker:
         return track
 
     def _init_kf(self, track: Track) -> None:
+        vel = track.state.velocity
+        if self.kalman_bank is not None:
+            pos = track.state.position
+            self.kalman_bank.add(
+                track.id,
+                (float(pos.x), float(pos.y), float(pos.z)),
+                (float(vel.vx), float(vel.vy), float(vel.vz)) if vel else None,
+            )
+            return
         kf = KalmanFilter(dim_x=6, dim_z=3)
         kf.F = np.eye(6, dtype=float)
         kf.H = np.hstack([np.eye(3), np.zeros((3, 3))]).astype(float)
@@ -255,13 +605,14 @@ class ModernTracker:
         )
         self.kalman_filters[track.id] = kf
 
-    async def _prune(self) -> List[Track]:
+    def _prune(self) -> List[Track]:
+        if self.store is not None:
+            return self._prune_store()
         deleted: List[Track] = []
         ttl = getattr(self, "stale_after_sec", 5.0)
         ts = self._frame_timestamp
 
-        current_tracks = await self.track_repository.list()
-        for t in current_tracks:
+        for t in list(self._tracks.values()):
             too_old = False
             if (
                 ts is not None
@@ -276,20 +627,34 @@ class ModernTracker:
             if t.missed > self.max_missed or too_old:
                 t.status = TrackStatus.DELETED
                 deleted.append(t)
-                try:
-                    await self.track_repository.delete(t.id)
-                finally:
-                    self.kalman_filters.pop(t.id, None)
+                del self._tracks[t.id]
+                self.kalman_filters.pop(t.id, None)
+                if self.kalman_bank is not None:
+                    self.kalman_bank.remove(t.id)
+        return deleted
+
+    def _prune_store(self) -> List[Track]:
+        st = self.store
+        assert st is not None
+        slots = st.live_slots()
+        dead = st.missed[slots] > self.max_missed
+        ttl = getattr(self, "stale_after_sec", 5.0)
+        if self._frame_timestamp is not None and ttl > 0:
+            age = (datetime_to_ns(self._frame_timestamp) - st.updated_ns[slots]) / 1e9
+            dead |= age > ttl
+        if not dead.any():
+            return []
+        gone = set(slots[dead].tolist())
+        deleted = [t for t in self._tracks.values() if t._slot in gone]  # type: ignore[attr-defined]
+        for t in deleted:
+            t.status = TrackStatus.DELETED
+            del self._tracks[t.id]
+            if self.kalman_bank is not None:
+                self.kalman_bank.remove(t.id)
+            st.remove(t.id)
         return deleted
 
     def _next_track_id(self) -> str:
-        tid = f"track_{self._id_counter:05d}"
+        tid = f"{self.id_prefix}{self._id_counter:05d}"
         self._id_counter += 1
         return tid
-
-    @staticmethod
-    def _euclidean(a: Any, b: Any) -> float:
-        dx = float(a.x) - float(b.x)
-        dy = float(a.y) - float(b.y)
-        dz = float(a.z) - float(b.z)
-        return float(np.sqrt(dx * dx + dy * dy + dz * dz))
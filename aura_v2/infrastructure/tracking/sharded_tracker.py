@@ -0,0 +1,451 @@
+# aura_v2/infrastructure/tracking/sharded_tracker.py
+from __future__ import annotations
+
+import asyncio
+import multiprocessing as mp
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np  # type: ignore[import-not-found]
+from scipy.spatial import cKDTree
+
+from ...domain.entities import (
+    Detection,
+    DetectionBatch,
+    Track,
+    TrackStatus,
+    TrackStore,
+)
+from ...domain.entities.detection_batch import datetime_to_ns
+from ..persistence.in_memory import InMemoryTrackRepository
+from ..persistence.write_behind import WriteBehindTrackSink
+from .modern_tracker import ModernTracker, TrackingResult, TrackRepo
+
+__all__ = ["ZoneGrid", "ZoneShard", "ZoneFrame", "ShardedTracker"]
+
+Handoff = Tuple[Track, Optional[np.ndarray], Optional[np.ndarray]]
+
+
+class ZoneGrid:
+    """
+    ``cols`` × ``rows`` equal zones over ``bounds`` (xmin, ymin, xmax, ymax).
+
+    Zone ``r * cols + c`` owns its core cell; points outside the bounds belong
+    to the nearest edge zone. ``margin`` metres around each core are the
+    overlap band a track may drift into before it is handed to the zone it is
+    in now, so targets moving along a border do not bounce between zones.
+    """
+
+    def __init__(
+        self,
+        bounds: Sequence[float],
+        cols: int = 2,
+        rows: int = 2,
+        margin: float = 10.0,
+    ) -> None:
+        xmin, ymin, xmax, ymax = (float(b) for b in bounds)
+        if xmax <= xmin or ymax <= ymin:
+            raise ValueError(f"empty zone bounds {tuple(bounds)!r}")
+        if cols < 1 or rows < 1:
+            raise ValueError("zone grid needs at least one column and one row")
+        self.bounds = (xmin, ymin, xmax, ymax)
+        self.cols = int(cols)
+        self.rows = int(rows)
+        self.margin = float(margin)
+
+        xs = np.linspace(xmin, xmax, self.cols + 1)
+        ys = np.linspace(ymin, ymax, self.rows + 1)
+        xs[0], xs[-1], ys[0], ys[-1] = -np.inf, np.inf, -np.inf, np.inf
+        r, c = np.divmod(np.arange(len(self)), self.cols)
+        # (zones, 4) core + margin rectangles; outer edges are unbounded
+        m = self.margin
+        self.rects = np.stack([xs[c] - m, ys[r] - m, xs[c + 1] + m, ys[r + 1] + m], axis=1)
+
+    @classmethod
+    def parse(cls, shape: str, bounds: str = "0,0,400,300", margin: float = 10.0) -> "ZoneGrid":
+        """Grid from env-style strings: ``"2x2"`` and ``"xmin,ymin,xmax,ymax"``."""
+        try:
+            cols, rows = (int(v) for v in shape.lower().split("x"))
+            b = [float(v) for v in bounds.split(",")]
+        except ValueError:
+            raise ValueError(f"bad zone grid {shape!r} / {bounds!r}") from None
+        if len(b) != 4:
+            raise ValueError(f"zone bounds need 4 numbers, got {bounds!r}")
+        return cls(b, cols, rows, margin)
+
+    def __len__(self) -> int:
+        return self.cols * self.rows
+
+    def zone_of(self, xy: np.ndarray) -> np.ndarray:
+        """Zone index of each (x, y) row."""
+        xmin, ymin, xmax, ymax = self.bounds
+        xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        c = np.floor((xy[:, 0] - xmin) / (xmax - xmin) * self.cols)
+        r = np.floor((xy[:, 1] - ymin) / (ymax - ymin) * self.rows)
+        c = np.clip(c, 0, self.cols - 1).astype(np.intp)
+        r = np.clip(r, 0, self.rows - 1).astype(np.intp)
+        return r * self.cols + c
+
+    def contains(self, zones: np.ndarray, xy: np.ndarray) -> np.ndarray:
+        """Whether each point lies inside core + margin of its zone."""
+        rect = self.rects[zones]
+        x, y = xy[:, 0], xy[:, 1]
+        return (x >= rect[:, 0]) & (x < rect[:, 2]) & (y >= rect[:, 1]) & (y < rect[:, 3])
+
+
+class _Discard:
+    """Repository for zone trackers: the coordinator owns persistence."""
+
+    async def save_many(self, tracks: Any) -> List[str]:
+        return []
+
+    async def delete_many(self, track_ids: Any) -> int:
+        return 0
+
+    async def list(self) -> List[Track]:
+        return []
+
+
+@dataclass
+class ZoneFrame:
+    """One zone's reply for a frame, as TrackStore columns."""
+
+    ids: List[str]
+    columns: Dict[str, np.ndarray]
+    new_ids: List[str]
+    deleted_ids: List[str]
+    deleted: Dict[str, np.ndarray]
+
+
+class ZoneShard:
+    """
+    The tracker of one zone. Runs inside a worker process (``_serve``) or
+    in the coordinator's process for ``mode="inline"``.
+    """
+
+    def __init__(self, zone: int, max_distance: float = 50.0, max_missed: int = 2) -> None:
+        self.zone = zone
+        self.tracker = ModernTracker(
+            _Discard(),
+            max_distance=max_distance,
+            max_missed=max_missed,
+            write_behind=False,
+            track_store=True,
+            id_prefix=f"track_z{zone}_",
+        )
+
+    async def update(self, batch: DetectionBatch, timestamp: datetime) -> ZoneFrame:
+        res = await self.tracker.update(batch, timestamp)
+        st = self.tracker.store
+        assert st is not None
+        return ZoneFrame(
+            ids=[t.id for t in res.active_tracks],
+            columns=st.columns(st.slots(res.active_tracks)),
+            new_ids=[t.id for t in res.new_tracks],
+            deleted_ids=[t.id for t in res.deleted_tracks],
+            deleted=TrackStore.gather(res.deleted_tracks),  # type: ignore[arg-type]
+        )
+
+    async def detach(self, track_ids: List[str]) -> List[Handoff]:
+        return self.tracker.detach(track_ids)  # type: ignore[return-value]
+
+    async def attach(self, items: List[Handoff]) -> None:
+        self.tracker.attach(items)
+
+    async def reserve(self, track_ids: List[str]) -> None:
+        self.tracker.reserve_ids(track_ids)
+
+    async def close(self) -> None:
+        await self.tracker.close()
+
+
+def _serve(conn: Any, zone: int, options: Dict[str, Any]) -> None:
+    """Worker process loop: ``(op, args)`` in, ``(ok, value)`` out."""
+    shard = ZoneShard(zone, **options)
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                op, args = conn.recv()
+            except EOFError:
+                break
+            try:
+                value = loop.run_until_complete(getattr(shard, op)(*args))
+                conn.send((True, value))
+            except Exception as e:
+                conn.send((False, repr(e)))
+            if op == "close":
+                break
+    finally:
+        loop.close()
+        conn.close()
+
+
+class _ProcessShard:
+    """``ZoneShard`` interface over a Pipe to a worker process."""
+
+    def __init__(
+        self, zone: int, options: Dict[str, Any], executor: ThreadPoolExecutor
+    ) -> None:
+        ctx = mp.get_context("spawn")
+        self._conn, child = ctx.Pipe()
+        self._proc = ctx.Process(
+            target=_serve, args=(child, zone, options), name=f"aura-zone-{zone}", daemon=True
+        )
+        self._proc.start()
+        child.close()
+        self._executor = executor
+        self._lock = threading.Lock()
+        self.zone = zone
+
+    def _call(self, op: str, args: Tuple[Any, ...]) -> Any:
+        with self._lock:
+            self._conn.send((op, args))
+            ok, value = self._conn.recv()
+        if not ok:
+            raise RuntimeError(f"zone {self.zone} worker failed on {op}: {value}")
+        return value
+
+    async def _ask(self, op: str, *args: Any) -> Any:
+        # Pipe I/O blocks; run it off the loop so all zones wait concurrently.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, op, args)
+
+    async def update(self, batch: DetectionBatch, timestamp: datetime) -> ZoneFrame:
+        return await self._ask("update", batch, timestamp)
+
+    async def detach(self, track_ids: List[str]) -> List[Handoff]:
+        return await self._ask("detach", track_ids)
+
+    async def attach(self, items: List[Handoff]) -> None:
+        await self._ask("attach", items)
+
+    async def reserve(self, track_ids: List[str]) -> None:
+        await self._ask("reserve", track_ids)
+
+    async def close(self) -> None:
+        try:
+            if self._proc.is_alive():
+                await self._ask("close")
+        except (EOFError, OSError, RuntimeError):
+            pass
+        finally:
+            self._conn.close()
+            self._proc.join(timeout=5.0)
+            if self._proc.is_alive():
+                self._proc.terminate()
+
+
+class ShardedTracker:
+    """
+    ``ModernTracker`` drop-in that spreads the tracking area over a
+    :class:`ZoneGrid`, one tracker per zone in its own worker process
+    (``mode="process"``) or in this process (``mode="inline"``, same code
+    path without the transport). Per frame:
+
+    1. Route: a detection goes to the zone owning the nearest predicted
+       track within ``max_distance``, otherwise to the zone it lies in. A
+       track keeps its detections while it drifts through the overlap band,
+       and a new object starts in exactly one zone.
+    2. Every zone runs its frame concurrently.
+    3. The replies are merged into one TrackStore; results hold its views.
+    4. Hand off: tracks outside their zone's core + margin are detached
+       (with their Kalman state) and attached to the zone they are in now.
+       Ids do not change.
+
+    Association is per zone, so two tracks in different zones competing for
+    one detection are resolved by distance instead of a global assignment.
+    The coordinator persists through its own write-behind sink; zone trackers
+    persist nothing. Workers start on the first frame.
+    """
+
+    def __init__(
+        self,
+        grid: ZoneGrid,
+        track_repository: TrackRepo | InMemoryTrackRepository | None = None,
+        max_distance: float = 50.0,
+        max_missed: int = 2,
+        mode: str = "process",
+        write_behind: bool = True,
+    ) -> None:
+        if mode not in ("process", "inline"):
+            raise ValueError(f"unknown shard mode {mode!r}")
+        self.grid = grid
+        self.mode = mode
+        self.max_distance = float(max_distance)
+        self.max_missed = int(max_missed)
+        self.track_repository: TrackRepo = track_repository or InMemoryTrackRepository()  # type: ignore[assignment]
+        self.write_behind = bool(write_behind)
+        self.sink = WriteBehindTrackSink(self.track_repository)
+        self.store = TrackStore()
+        self._tracks: Dict[str, Track] = {}
+        self._owner = np.full(self.store.capacity, -1, dtype=np.intp)  # by store slot
+        self._shards: List[Any] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.handoffs = 0
+
+    async def start(self) -> None:
+        """Start the zone workers and hand them the persisted tracks."""
+        if self._shards:
+            return
+        options = {"max_distance": self.max_distance, "max_missed": self.max_missed}
+        if self.mode == "process":
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.grid), thread_name_prefix="aura-zone"
+            )
+            self._shards = [
+                _ProcessShard(z, options, self._executor) for z in range(len(self.grid))
+            ]
+        else:
+            self._shards = [ZoneShard(z, **options) for z in range(len(self.grid))]
+
+        stored = await self.track_repository.list()
+        # A persisted track may have left the zone that created it; every
+        # zone skips all stored ids so none is handed out twice.
+        ids = [t.id for t in stored]
+        await asyncio.gather(*(sh.reserve(ids) for sh in self._shards))
+        persisted = [t for t in stored if t.status != TrackStatus.DELETED]
+        if persisted:
+            xy = np.array([[t.state.position.x, t.state.position.y] for t in persisted])
+            zones = self.grid.zone_of(xy).tolist()
+            views = [self._adopt(t, z) for t, z in zip(persisted, zones)]
+            await asyncio.gather(
+                *(
+                    sh.attach([(v.to_track(), None, None) for v, z in zip(views, zones) if z == k])
+                    for k, sh in enumerate(self._shards)
+                )
+            )
+
+    async def update(
+        self, detections: List[Detection] | DetectionBatch, timestamp: datetime
+    ) -> TrackingResult:
+        start_time = time.time()
+        ts = timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+        await self.start()
+        batch = (
+            detections
+            if isinstance(detections, DetectionBatch)
+            else DetectionBatch.from_detections(detections)
+        )
+
+        zone = self._route(batch, ts)
+        replies: List[ZoneFrame] = await asyncio.gather(
+            *(sh.update(batch.take(zone == k), ts) for k, sh in enumerate(self._shards))
+        )
+        new_tracks, deleted_tracks = self._merge(replies)
+        await self._handoff()
+
+        active_tracks = list(self._tracks.values())
+        self.sink.submit(active_tracks, (t.id for t in deleted_tracks))
+        if self.write_behind:
+            self.sink.schedule()
+        else:
+            await self.sink.flush()
+
+        return TrackingResult(
+            active_tracks=active_tracks,
+            new_tracks=new_tracks,
+            deleted_tracks=deleted_tracks,
+            processing_time_ms=(time.time() - start_time) * 1000.0,
+        )
+
+    def active_tracks(self) -> List[Track]:
+        """Current working set, without running a frame."""
+        return list(self._tracks.values())
+
+    async def flush(self) -> None:
+        """Write all pending track deltas to the repository."""
+        await self.sink.flush()
+
+    async def close(self) -> None:
+        shards, self._shards = self._shards, []
+        await asyncio.gather(*(sh.close() for sh in shards))
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        await self.sink.close()
+
+    # ----------------------------------------------------------------- internals
+
+    def _adopt(self, track: Track, zone: int) -> Track:
+        view = self.store.adopt(track)
+        self._tracks[view.id] = view
+        self._own(self.store.slots_of([view.id]), zone)
+        return view
+
+    def _own(self, slots: np.ndarray, zone: int | np.ndarray) -> None:
+        if len(self._owner) < self.store.capacity:
+            grown = np.full(self.store.capacity, -1, dtype=np.intp)
+            grown[: len(self._owner)] = self._owner
+            self._owner = grown
+        self._owner[slots] = zone
+
+    def _route(self, batch: DetectionBatch, ts: datetime) -> np.ndarray:
+        zone = self.grid.zone_of(batch.positions[:, :2])
+        st = self.store
+        slots = st.live_slots()
+        if not len(slots) or not len(batch):
+            return zone
+        # Same constant-velocity prediction the zone trackers are about to run.
+        dt = np.maximum((datetime_to_ns(ts) - st.updated_ns[slots]) / 1e9, 0.0)
+        s = st.state[slots]
+        predicted = s[:, :3] + s[:, 3:] * dt[:, None]
+        dist, k = cKDTree(predicted).query(
+            batch.positions, distance_upper_bound=self.max_distance
+        )
+        hit = np.isfinite(dist)
+        zone[hit] = self._owner[slots[k[hit]]]
+        return zone
+
+    def _merge(self, replies: List[ZoneFrame]) -> Tuple[List[Track], List[Track]]:
+        st = self.store
+        new_tracks: List[Track] = []
+        deleted_tracks: List[Track] = []
+        for k, rep in enumerate(replies):
+            for tid in rep.new_ids:
+                view = st.add(tid, (0.0, 0.0, 0.0))
+                self._tracks[tid] = view
+                new_tracks.append(view)
+            if rep.ids:
+                slots = st.slots_of(rep.ids)
+                st.assign(slots, rep.columns)
+                self._own(slots, k)
+            if rep.deleted_ids:
+                st.assign(st.slots_of(rep.deleted_ids), rep.deleted)
+                for tid in rep.deleted_ids:
+                    del self._tracks[tid]
+                    deleted_tracks.append(st.remove(tid))  # type: ignore[arg-type]
+        return new_tracks, deleted_tracks
+
+    async def _handoff(self) -> None:
+        st = self.store
+        slots = st.live_slots()
+        if not len(slots):
+            return
+        xy = st.state[slots, :2]
+        owner = self._owner[slots]
+        stray = ~self.grid.contains(owner, xy)
+        if not stray.any():
+            return
+        moving, src = slots[stray], owner[stray]
+        dst = self.grid.zone_of(xy[stray])
+        ids = st.ids_at(moving.tolist())
+
+        by_src: Dict[int, List[str]] = {}
+        for tid, z in zip(ids, src.tolist()):
+            by_src.setdefault(z, []).append(tid)
+        detached = await asyncio.gather(
+            *(self._shards[z].detach(tids) for z, tids in by_src.items())
+        )
+        target = dict(zip(ids, dst.tolist()))
+        by_dst: Dict[int, List[Handoff]] = {}
+        for items in detached:
+            for item in items:
+                by_dst.setdefault(target[item[0].id], []).append(item)
+        await asyncio.gather(*(self._shards[z].attach(items) for z, items in by_dst.items()))
+        self._own(moving, dst)
+        self.handoffs += len(moving)
@@ -12,18 +12,30 @@ from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 import typer
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from pydantic import ValidationError
+
+from aura_v2.api.deltas import DeltaStreams, TrackDeltaEncoder
+from aura_v2.api.fast_ingest import (
+    ColumnarFrame,
+    FrameError,
+    dumps,
+    parse_track_body,
+    parse_track_frame,
+    track_output,
+)
+from aura_v2.api.frames import f32_batch, msgpack, unpack_f32_frame
 from aura_v2.api.schemas import DetectionInput, TrackOutput, TrackRequest, TrackResponse
-from aura_v2.domain import Confidence, Detection, Position3D, Track
+from aura_v2.domain import Confidence, Detection, DetectionBatch, Position3D, Track
 from aura_v2.domain.services import (
     BasicFusionService,
     FusionService,
     SensorCharacteristics,
 )
 from aura_v2.infrastructure.tracking.modern_tracker import ModernTracker, TrackingResult
+from aura_v2.infrastructure.tracking.sharded_tracker import ShardedTracker, ZoneGrid
 from aura_v2.utils.time import to_utc
 
 # Optional telemetry guard (no-op if missing)
@@ -35,22 +47,49 @@ except Exception:  # pragma: no cover - optional
     _tg_validate = None  # type: ignore[assignment]
 
 
+def _record_ts(ts: datetime) -> None:
+    if _tg_validate is not None:  # pragma: no cover - optional
+        try:
+            _tg_validate(ts)
+        except Exception:
+            pass
+
+
+def _build_tracker() -> ModernTracker | ShardedTracker:
+    """One ModernTracker, or a zone-sharded tracker when AURA_SHARDS is set."""
+    shards = os.environ.get("AURA_SHARDS", "").strip()
+    if not shards:
+        return ModernTracker()
+    grid = ZoneGrid.parse(
+        shards,
+        os.environ.get("AURA_SHARD_BOUNDS", "0,0,400,300"),
+        float(os.environ.get("AURA_SHARD_MARGIN", "10")),
+    )
+    return ShardedTracker(grid, mode=os.environ.get("AURA_SHARD_MODE", "process"))
+
+
 class AURAApplication:
     def __init__(self, config_path: Optional[Path] = None) -> None:
         self.config_path = Path(config_path) if config_path else None
         self.config: Dict[str, Any] = {}
         self.app: Optional[FastAPI] = None
-        self.tracker: Optional[ModernTracker] = None
+        self.tracker: Optional[ModernTracker | ShardedTracker] = None
         self.fusion_service: Optional[FusionService] = None
         self._frame_id: int = 0
         self._initialized: bool = False
         self._last_active_count: int = 0  # reported via /simple
+        # Delta streams for POST /track?mode=delta, one per client stream id
+        self._delta_epsilon = float(os.environ.get("AURA_DELTA_EPSILON", "0.01"))
+        self._deltas = DeltaStreams(
+            epsilon=self._delta_epsilon,
+            max_streams=int(os.environ.get("AURA_DELTA_STREAMS", "256")),
+        )
 
     def _initialize_sync(self) -> None:
         if self._initialized:
             return
         self._build_app()
-        self.tracker = ModernTracker()
+        self.tracker = _build_tracker()
         self.fusion_service = BasicFusionService(
             sensor_characteristics=[
                 SensorCharacteristics(name="camera_1", accuracy=0.90, latency_ms=20),
@@ -65,6 +104,7 @@ class AURAApplication:
         async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             # --- startup ---
             pump_task: Optional[asyncio.Task[Any]] = None
+            app.state.pump = None
             if os.environ.get("AURA_PUMP_ENABLED", "0") == "1":
                 dsn = os.environ.get("AURA_SOURCE_DSN", "")
                 host = os.environ.get("AURA_PUMP_HOST", "127.0.0.1")
@@ -82,23 +122,49 @@ class AURAApplication:
                     src = None
 
                 if src is not None:
+                    from aura_v2.sources.pump import HttpPump, InProcessPump
+
+                    # inproc: frames go through a bounded queue straight into
+                    # the tracker; http: legacy loopback POSTs to /track.
+                    mode = os.environ.get("AURA_PUMP_MODE", "inproc")
+                    if mode == "http":
+                        pump = HttpPump(src, f"http://{host}:{port}/track")
+                    else:
+                        try:
+                            maxsize = int(os.environ.get("AURA_PUMP_QUEUE", "64"))
+                        except Exception:
+                            maxsize = 64
+                        pump = InProcessPump(src, self._ingest_frame, maxsize=maxsize)
+                    app.state.pump = pump
+                    pump_task = asyncio.create_task(pump.run())
 
-                    async def pump() -> None:
-                        # Local import keeps app import time small
-                        import httpx  # type: ignore
-
-                        url = f"http://{host}:{port}/track"
-                        async with httpx.AsyncClient(timeout=10.0) as client:
-                            async for frame in src.frames():
-                                try:
-                                    await client.post(url, json=frame)
-                                except Exception:
-                                    # ignore transient errors
-                                    pass
+            app.state.pump_task = pump_task
 
-                    pump_task = asyncio.create_task(pump())
+            # Optional batched Mongo writer shared by request handlers
+            mongo_writer = None
+            if os.environ.get("AURA_MONGO_WRITER", "0") == "1":
+                try:
+                    from aura_v2.infrastructure.persistence.mongo_client import (
+                        MongoProvider,
+                    )
+                    from aura_v2.infrastructure.persistence.writer import (
+                        BufferedMongoWriter,
+                    )
+
+                    if MongoProvider.db() is None:
+                        MongoProvider.init()
+                    mongo_writer = BufferedMongoWriter(
+                        max_batch=int(os.environ.get("AURA_MONGO_WRITER_BATCH", "500")),
+                        max_age_s=float(os.environ.get("AURA_MONGO_WRITER_AGE_MS", "200"))
+                        / 1000.0,
+                        max_queue=int(os.environ.get("AURA_MONGO_WRITER_QUEUE", "10000")),
+                    )
+                    await mongo_writer.start()
+                except Exception as e:  # pragma: no cover - optional
+                    print(f"⚠️  Mongo writer disabled: {e}")
+                    mongo_writer = None
+            app.state.mongo_writer = mongo_writer
 
-            app.state.pump_task = pump_task
             try:
                 yield
             finally:
@@ -108,6 +174,12 @@ class AURAApplication:
                     task.cancel()
                     with suppress(asyncio.CancelledError):
                         await task
+                # Drain write-behind track deltas before the loop goes away
+                if self.tracker is not None:
+                    await self.tracker.close()
+                writer = getattr(app.state, "mongo_writer", None)
+                if writer is not None:
+                    await writer.close()
 
         return lifespan
 
@@ -186,48 +258,42 @@ class AURAApplication:
             print(f"⚠️  Dashboard setup error: {e}")
 
         @app.post("/track", response_model=TrackResponse, tags=["tracking"])
-        async def track(req: TrackRequest) -> TrackResponse:
-            if self.tracker is None or self.fusion_service is None:
-                raise HTTPException(status_code=503, detail="Service not initialized")
-
-            # Normalize batch timestamp first (always UTC-aware)
-            ts_raw = req.timestamp or datetime.now(timezone.utc)
-            ts = to_utc(ts_raw)
-            if _tg_validate is not None:  # pragma: no cover - optional
-                try:
-                    _tg_validate(ts)
-                except Exception:
-                    pass
-
-            def to_det(d: DetectionInput) -> Detection:
-                p = d.position or {}
-                pos = Position3D(
-                    x=float(p.get("x", 0.0)),
-                    y=float(p.get("y", 0.0)),
-                    z=float(p.get("z", 0.0)),
+        async def track(
+            req: TrackRequest,
+            mode: Optional[str] = None,
+            stream: Optional[str] = None,
+            x_aura_response: Optional[str] = Header(default=None),
+            x_aura_stream: Optional[str] = Header(default=None),
+        ) -> Any:
+            """
+            ``mode`` (query) or ``X-Aura-Response`` (header) selects the reply:
+            ``full`` (default, TrackResponse), ``delta`` (only tracks created,
+            moved more than AURA_DELTA_EPSILON or deleted since this stream's
+            last delta, with ``seq``) or ``snapshot`` (all tracks, resyncs the
+            stream). ``stream`` (query) or ``X-Aura-Stream`` (header) names
+            the caller's delta stream (default ``default``).
+            """
+            mode = (mode or x_aura_response or "full").lower()
+            if mode not in ("full", "delta", "snapshot"):
+                raise HTTPException(status_code=400, detail=f"unknown response mode: {mode}")
+            result = await self._ingest(req)
+            if mode == "delta":
+                return JSONResponse(
+                    self._deltas.get(stream or x_aura_stream or "default").delta(
+                        result.active_tracks,
+                        frame_id=self._frame_id,
+                        processing_time_ms=result.processing_time_ms,
+                    )
                 )
-                dts = to_utc(d.timestamp)
-                if _tg_validate is not None:  # pragma: no cover - optional
-                    try:
-                        _tg_validate(dts)
-                    except Exception:
-                        pass
-                return Detection(
-                    timestamp=dts,
-                    position=pos,
-                    confidence=Confidence(value=float(d.confidence)),
-                    sensor_id=d.sensor_id,
-                    attributes=d.attributes or {},
+            if mode == "snapshot":
+                return JSONResponse(
+                    self._deltas.get(stream or x_aura_stream or "default").snapshot(
+                        result.active_tracks,
+                        frame_id=self._frame_id,
+                        processing_time_ms=result.processing_time_ms,
+                    )
                 )
 
-            detections: List[Detection] = []
-            for d in (
-                req.radar_detections + req.camera_detections + req.lidar_detections
-            ):
-                detections.append(to_det(d))
-
-            result: TrackingResult = await self.tracker.update(detections, ts)
-
             threats: List[Dict[str, Any]] = [
                 {
                     "track_id": tr.id,
@@ -257,12 +323,8 @@ class AURAApplication:
                     updated_at=tr.updated_at,
                 )
 
-            self._frame_id += 1
-            active = [out(t) for t in result.active_tracks]
-            self._last_active_count = len(active)
-
             return TrackResponse(
-                active_tracks=active,
+                active_tracks=[out(t) for t in result.active_tracks],
                 new_tracks=[out(t) for t in result.new_tracks],
                 deleted_tracks=[t.id for t in result.deleted_tracks],
                 threats=threats,
@@ -270,8 +332,219 @@ class AURAApplication:
                 frame_id=self._frame_id,
             )
 
+        @app.post("/track/fast", tags=["tracking"])
+        async def track_fast(
+            request: Request,
+            mode: Optional[str] = None,
+            stream: Optional[str] = None,
+            x_aura_response: Optional[str] = Header(default=None),
+            x_aura_stream: Optional[str] = Header(default=None),
+        ) -> Response:
+            """
+            Same contract as ``POST /track`` without the Pydantic models: the
+            body is decoded once into columns and the reply serialized directly.
+            """
+            mode = (mode or x_aura_response or "full").lower()
+            if mode not in ("full", "delta", "snapshot"):
+                raise HTTPException(status_code=400, detail=f"unknown response mode: {mode}")
+            try:
+                frame = parse_track_body(await request.body(), on_timestamp=_record_ts)
+            except FrameError as e:
+                raise HTTPException(
+                    status_code=422,
+                    detail=[{"loc": ["body", *e.loc.split(".")], "msg": e.msg}],
+                ) from None
+            result = await self._ingest_columns(frame)
+            extra = {"frame_id": self._frame_id, "processing_time_ms": result.processing_time_ms}
+            if mode == "delta":
+                deltas = self._deltas.get(stream or x_aura_stream or "default")
+                payload = deltas.delta(result.active_tracks, **extra)
+            elif mode == "snapshot":
+                deltas = self._deltas.get(stream or x_aura_stream or "default")
+                payload = deltas.snapshot(result.active_tracks, **extra)
+            else:
+                payload = {
+                    "active_tracks": track_output(result.active_tracks),
+                    "new_tracks": track_output(result.new_tracks),
+                    "deleted_tracks": [t.id for t in result.deleted_tracks],
+                    "threats": [
+                        {
+                            "track_id": tr.id,
+                            "threat_level": int(tr.threat_level),
+                            "confidence": float(tr.confidence),
+                        }
+                        for tr in result.active_tracks
+                    ],
+                    **extra,
+                }
+            return Response(dumps(payload), media_type="application/json")
+
+        @app.get("/track/snapshot", tags=["tracking"])
+        async def track_snapshot(
+            stream: Optional[str] = None,
+            x_aura_stream: Optional[str] = Header(default=None),
+        ) -> Dict[str, Any]:
+            """
+            Full track state for a delta client that detected a ``seq`` gap.
+            Resyncs only the caller's stream (``stream`` / ``X-Aura-Stream``,
+            default ``default``); other streams are untouched.
+            """
+            if self.tracker is None:
+                raise HTTPException(status_code=503, detail="Service not initialized")
+            deltas = self._deltas.get(stream or x_aura_stream or "default")
+            return deltas.snapshot(self.tracker.active_tracks(), frame_id=self._frame_id)
+
+        @app.websocket("/ws/track")
+        async def ws_track(
+            ws: WebSocket, encoding: str = "json", sensor_id: str = "ws"
+        ) -> None:
+            await self._serve_ws(ws, encoding, sensor_id)
+
+        @app.get("/pump", tags=["system"])
+        async def pump_stats() -> Dict[str, Any]:
+            pump = getattr(app.state, "pump", None)
+            return pump.stats.summary() if pump is not None else {"mode": None}
+
         self.app = app
 
+    async def _ingest(self, req: TrackRequest) -> TrackingResult:
+        """Run one validated frame through the tracker (shared by /track and the pump)."""
+        if self.tracker is None or self.fusion_service is None:
+            raise HTTPException(status_code=503, detail="Service not initialized")
+
+        # Normalize batch timestamp first (always UTC-aware)
+        ts_raw = req.timestamp or datetime.now(timezone.utc)
+        ts = to_utc(ts_raw)
+        _record_ts(ts)
+
+        def to_det(d: DetectionInput) -> Detection:
+            p = d.position or {}
+            pos = Position3D(
+                x=float(p.get("x", 0.0)),
+                y=float(p.get("y", 0.0)),
+                z=float(p.get("z", 0.0)),
+            )
+            dts = to_utc(d.timestamp)
+            _record_ts(dts)
+            return Detection(
+                timestamp=dts,
+                position=pos,
+                confidence=Confidence(value=float(d.confidence)),
+                sensor_id=d.sensor_id,
+                attributes=d.attributes or {},
+            )
+
+        detections: List[Detection] = []
+        for d in req.radar_detections + req.camera_detections + req.lidar_detections:
+            detections.append(to_det(d))
+        return await self._ingest_detections(detections, ts)
+
+    async def _ingest_detections(
+        self, detections: List[Detection] | DetectionBatch, ts: datetime
+    ) -> TrackingResult:
+        if self.tracker is None:
+            raise HTTPException(status_code=503, detail="Service not initialized")
+        result: TrackingResult = await self.tracker.update(detections, ts)
+        self._frame_id += 1
+        self._last_active_count = len(result.active_tracks)
+        return result
+
+    async def _ingest_columns(self, frame: ColumnarFrame) -> TrackingResult:
+        """Columnar frame (/track/fast, pump, WS) straight into the tracker."""
+        if self.tracker is None or self.fusion_service is None:
+            raise HTTPException(status_code=503, detail="Service not initialized")
+        return await self._ingest_detections(frame.batch, frame.timestamp)
+
+    async def _ingest_frame(self, frame: Dict[str, Any]) -> TrackingResult:
+        """In-process pump entry: same validation as POST /track, no HTTP."""
+        return await self._ingest_columns(parse_track_frame(frame, on_timestamp=_record_ts))
+
+    async def _serve_ws(self, ws: WebSocket, encoding: str, sensor_id: str) -> None:
+        """
+        Stream detection frames in, per-frame track deltas out.
+
+        Text messages are TrackRequest JSON. Binary messages are decoded per
+        ``encoding``: ``json`` (UTF-8 JSON), ``msgpack`` (TrackRequest map) or
+        ``f32`` (packed float32 rows, see ``aura_v2.api.frames``). Incoming
+        frames wait in a bounded queue; when the tracker falls behind, the
+        oldest waiting frame is dropped and counted in ``dropped``.
+        """
+        if encoding not in ("json", "msgpack", "f32") or (
+            encoding == "msgpack" and msgpack is None
+        ):
+            await ws.close(code=1003, reason=f"unsupported encoding: {encoding}")
+            return
+        await ws.accept()
+        try:
+            maxsize = int(os.environ.get("AURA_WS_QUEUE", "8"))
+        except Exception:
+            maxsize = 8
+        queue: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue(maxsize=max(1, maxsize))
+        dropped = 0
+
+        async def receive() -> None:
+            nonlocal dropped
+            while True:
+                msg = await ws.receive()
+                if msg["type"] == "websocket.disconnect":
+                    item = None
+                elif msg.get("bytes") is not None:
+                    item = {"bytes": msg["bytes"]}
+                else:
+                    item = {"text": msg.get("text") or ""}
+                if queue.full():
+                    queue.get_nowait()
+                    dropped += 1
+                queue.put_nowait(item)
+                if item is None:
+                    return
+
+        async def decode_and_ingest(item: Dict[str, Any]) -> TrackingResult:
+            raw = item.get("bytes")
+            if raw is None:
+                raw = item["text"].encode()
+            elif encoding == "f32":
+                ts, rows = unpack_f32_frame(raw)
+                ts = ts or datetime.now(timezone.utc)
+                return await self._ingest_detections(f32_batch(rows, ts, sensor_id), ts)
+            elif encoding == "msgpack":
+                frame = parse_track_frame(msgpack.unpackb(raw, timestamp=3), _record_ts)
+                return await self._ingest_columns(frame)
+            return await self._ingest_columns(parse_track_body(raw, _record_ts))
+
+        async def send(payload: Dict[str, Any]) -> None:
+            if encoding == "msgpack":
+                await ws.send_bytes(msgpack.packb(payload, datetime=True))
+            else:
+                await ws.send_text(json.dumps(payload))
+
+        # Per-connection delta stream
+        deltas = TrackDeltaEncoder(epsilon=self._delta_epsilon)
+        reader = asyncio.create_task(receive())
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                try:
+                    result = await decode_and_ingest(item)
+                except (ValidationError, ValueError) as e:
+                    await send({"error": str(e), "dropped": dropped})
+                    continue
+                payload = deltas.delta(
+                    result.active_tracks,
+                    frame_id=self._frame_id,
+                    processing_time_ms=result.processing_time_ms,
+                    dropped=dropped,
+                )
+                await send(payload)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            reader.cancel()
+            with suppress(asyncio.CancelledError, WebSocketDisconnect):
+                await reader
+
     def get_app(self) -> FastAPI:
         if not self._initialized:
             self._initialize_sync()
@@ -294,6 +567,7 @@ def dev_server(
     https: bool = False,
     source: Optional[str] = "demo://?fps=2",
     no_source: bool = False,
+    pump_mode: str = "inproc",
 ) -> None:
     """Start development server with optional HTTPS."""
     # Configure source pump env for the app factory
@@ -304,6 +578,7 @@ def dev_server(
         os.environ["AURA_SOURCE_DSN"] = source or ""
         os.environ["AURA_PUMP_HOST"] = host
         os.environ["AURA_PUMP_PORT"] = str(port)
+        os.environ["AURA_PUMP_MODE"] = pump_mode
 
     if https:
         cert_file = Path("certs/localhost.crt")
@@ -345,76 +620,40 @@ def dev_server(
 
 
 @app_cli.command("scenario-run")
-def scenario_run(outdir: Optional[str] = None) -> None:
+def scenario_run(
+    outdir: Optional[str] = None,
+    log: Optional[str] = typer.Option(None, help="Recorded JSONL detection log; synthetic frames if omitted."),
+    key: str = typer.Option("timestamp", help="Field grouping log rows into frames."),
+    seed: int = 0,
+    targets: int = typer.Option(50, help="Synthetic scenario: number of targets."),
+    frames: int = typer.Option(200, help="Synthetic scenario: number of frames."),
+    trace_memory: bool = typer.Option(False, help="Also report the tracemalloc peak (slower)."),
+) -> None:
     """
-    Minimal offline scenario executor that runs a canned set of frames
-    through the tracking pipeline, then writes metrics.
+    Offline replay: stream a detection log (or a seeded synthetic scenario)
+    through fusion, tracker, threat and collision without HTTP, as fast as
+    possible, then write metrics.json.
     """
+    from aura_v2.observability.replay import ReplayRunner, synthetic_frames
+    from aura_v2.sources.jsonl import JsonlSource
+
     outp = (
         Path(outdir)
         if outdir
         else Path("runs") / datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
     )
     outp.mkdir(parents=True, exist_ok=True)
-    run_id = uuid.uuid4().hex[:8]
-
-    async def _run() -> None:
-        # Replace this with real scenario loading as needed
-        scenario = {
-            "name": "demo",
-            "frames": [
-                {
-                    "detections": [
-                        {
-                            "sensor_id": "camera_1",
-                            "timestamp": datetime.now(timezone.utc),
-                            "position": {"x": 10.0, "y": 20.0},
-                            "confidence": 0.9,
-                        }
-                    ]
-                }
-                for _ in range(10)
-            ],
-        }
-
-        tracker = ModernTracker()
 
-        async def process(dets: List[Dict[str, Any]], ts: datetime) -> None:
-            def td(d: Dict[str, Any]) -> Detection:
-                p = d.get("position") or {}
-                pos = Position3D(
-                    x=float(p.get("x", 0.0)),
-                    y=float(p.get("y", 0.0)),
-                    z=float(p.get("z", 0.0)),
-                )
-                dts = to_utc(d["timestamp"])
-                return Detection(
-                    timestamp=dts,
-                    position=pos,
-                    confidence=Confidence(value=float(d["confidence"])),
-                    sensor_id=str(d["sensor_id"]),
-                    attributes=d.get("attributes", {}),
-                )
-
-            dd = [td(x) for x in dets]
-            await tracker.update(dd, ts)
-
-        ts0 = datetime.now(timezone.utc)
-        frames = scenario.get("frames") or []
-        total = 0
-        for frame in frames:
-            detections = frame.get("detections", [])
-            await process(detections, ts=ts0)
-            total += 1
-        metrics = {
-            "run_id": run_id,
-            "scenario": scenario.get("name", "unknown"),
-            "summary": {"frames": total},
-            "meta": {"versions": {"app": "2.0.0"}},
-        }
-        (outp / "metrics.json").write_text(json.dumps(metrics, indent=2))
+    if log:
+        source: Any = JsonlSource(log, loop=False, speed=0, frame_key=key).frames()
+        name = Path(log).name
+    else:
+        source = synthetic_frames(seed=seed, targets=targets, frames=frames)
+        name = f"synthetic-{targets}x{frames}"
 
-    asyncio.run(_run())
+    runner = ReplayRunner(seed=seed, trace_memory=trace_memory)
+    metrics = {"run_id": uuid.uuid4().hex[:8], **asyncio.run(runner.run(source, scenario=name))}
+    (outp / "metrics.json").write_text(json.dumps(metrics, indent=2))
     print(str(outp))
 
 
@@ -0,0 +1,248 @@
+# aura_v2/observability/replay.py
+from __future__ import annotations
+
+import hashlib
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from aura_v2.api.fast_ingest import parse_track_frame
+from aura_v2.application.services.collision_predictor import VectorizedCollisionPredictor
+from aura_v2.application.services.threat_analyzer import BasicThreatAnalyzer
+from aura_v2.domain.services import BasicFusionService, FusionService
+from aura_v2.domain.services.collision_prediction import CollisionPredictor
+from aura_v2.domain.services.threat_analysis import ThreatAnalyzer
+from aura_v2.infrastructure.tracking.modern_tracker import ModernTracker
+
+__all__ = ["LatencyHistogram", "ReplayRunner", "synthetic_frames", "STAGES"]
+
+# Offline replay harness: recorded frames go through the same stages as a
+# live /track call (validation, fusion, tracker, threat, collision) without
+# HTTP, as fast as they can be processed. Everything that could differ
+# between two runs of the same input is seeded or fixed, so metrics.json
+# files from different commits can be compared directly.
+
+STAGES = ("parse", "fusion", "track", "threat", "collision", "total")
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+_SENSORS = (("camera_detections", "camera_1"), ("radar_detections", "radar_1"), ("lidar_detections", "lidar_1"))
+
+
+class LatencyHistogram:
+    """Per-frame latencies in ms: exact percentiles plus log-spaced buckets."""
+
+    # 10 µs .. 100 s, four buckets per decade
+    EDGES_MS = tuple(round(10 ** (e / 4), 4) for e in range(-8, 21))
+
+    def __init__(self) -> None:
+        self._ms: List[float] = []
+
+    def add(self, ms: float) -> None:
+        self._ms.append(ms)
+
+    def __len__(self) -> int:
+        return len(self._ms)
+
+    def summary(self) -> Dict[str, Any]:
+        a = np.asarray(self._ms, dtype=float)
+        if not len(a):
+            return {"count": 0}
+        counts = np.bincount(np.searchsorted(self.EDGES_MS, a), minlength=len(self.EDGES_MS) + 1)
+        p50, p90, p99 = np.percentile(a, [50, 90, 99]).tolist()
+        return {
+            "count": int(len(a)),
+            "mean": float(a.mean()),
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+            "max": float(a.max()),
+            "buckets": {
+                "le_ms": [*self.EDGES_MS, "inf"],
+                "count": counts.tolist(),
+            },
+        }
+
+
+def synthetic_frames(
+    seed: int = 0,
+    targets: int = 50,
+    frames: int = 200,
+    dt: float = 0.1,
+    area: float = 400.0,
+    noise: float = 0.2,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Deterministic TrackRequest-shaped frames: ``targets`` constant-velocity
+    objects in an ``area`` x ``area`` square, each detected by one of the
+    three sensors per frame with Gaussian position noise.
+    """
+    rng = np.random.default_rng(seed)
+    p0 = rng.uniform(0.0, area, size=(targets, 2))
+    v = rng.normal(scale=5.0, size=(targets, 2))
+    for k in range(frames):
+        ts = (T0 + timedelta(seconds=dt * k)).isoformat()
+        xy = p0 + v * (dt * k) + rng.normal(scale=noise, size=(targets, 2))
+        sensor = rng.integers(0, len(_SENSORS), size=targets)
+        conf = rng.uniform(0.6, 1.0, size=targets)
+        frame: Dict[str, Any] = {group: [] for group, _ in _SENSORS}
+        for (x, y), s, c in zip(xy.tolist(), sensor.tolist(), conf.tolist()):
+            group, sid = _SENSORS[s]
+            frame[group].append(
+                {"sensor_id": sid, "timestamp": ts, "position": {"x": x, "y": y}, "confidence": c}
+            )
+        frame["timestamp"] = ts
+        yield frame
+
+
+def _git_rev() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=False,
+            text=True,
+            timeout=5,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kB on Linux, bytes on macOS
+    return rss / (1024.0 * 1024.0) if sys.platform == "darwin" else rss / 1024.0
+
+
+@dataclass
+class ReplayRunner:
+    """
+    Runs frames through fusion -> tracker -> threat -> collision and
+    collects per-stage latency histograms, throughput, track counts and
+    memory high-water marks.
+
+    ``trace_memory=True`` also reports the tracemalloc peak of Python
+    allocations during the run. This is slower, so latencies from such
+    runs are not comparable with untraced ones.
+    """
+
+    tracker: Any = None
+    fusion: FusionService = field(default_factory=BasicFusionService)
+    threat_analyzer: Optional[ThreatAnalyzer] = field(default_factory=BasicThreatAnalyzer)
+    collision_predictor: Optional[CollisionPredictor] = field(default_factory=VectorizedCollisionPredictor)
+    seed: int = 0
+    trace_memory: bool = False
+
+    def __post_init__(self) -> None:
+        if self.tracker is None:
+            self.tracker = ModernTracker()
+        self.latency = {s: LatencyHistogram() for s in STAGES}
+
+    async def run(
+        self,
+        frames: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        scenario: str = "replay",
+    ) -> Dict[str, Any]:
+        random.seed(self.seed)
+        np.random.seed(self.seed)
+        if self.trace_memory:
+            tracemalloc.start()
+        n_frames = n_dets = created = deleted = collisions = active_max = 0
+        active_sum = 0
+        last: List[Any] = []
+        lat = self.latency
+        wall = time.perf_counter()
+        try:
+            async for frame in _aiter(frames):
+                t0 = time.perf_counter()
+                cols = parse_track_frame(frame)
+                t1 = time.perf_counter()
+                dets = self.fusion.fuse(cols.batch.to_detections())
+                t2 = time.perf_counter()
+                res = await self.tracker.update(dets, cols.timestamp)
+                t3 = time.perf_counter()
+                if self.threat_analyzer is not None:
+                    for tr in res.active_tracks:
+                        tr.threat_level = self.threat_analyzer.analyze(tr)
+                t4 = time.perf_counter()
+                if self.collision_predictor is not None:
+                    collisions += len(self.collision_predictor.predict(res.active_tracks))
+                t5 = time.perf_counter()
+
+                for stage, a, b in zip(STAGES, (t0, t1, t2, t3, t4, t0), (t1, t2, t3, t4, t5, t5)):
+                    lat[stage].add((b - a) * 1000.0)
+                n_frames += 1
+                n_dets += len(cols.batch)
+                created += len(res.new_tracks)
+                deleted += len(res.deleted_tracks)
+                active = len(res.active_tracks)
+                active_sum += active
+                active_max = max(active_max, active)
+                last = res.active_tracks
+            wall = time.perf_counter() - wall
+            await self.tracker.close()
+            traced_peak = tracemalloc.get_traced_memory()[1] / 1e6 if self.trace_memory else None
+        finally:
+            if self.trace_memory:
+                tracemalloc.stop()
+
+        return {
+            "scenario": scenario,
+            "summary": {
+                "frames": n_frames,
+                "detections": n_dets,
+                "wall_s": wall,
+                "frames_per_s": n_frames / wall if wall > 0 else 0.0,
+                "detections_per_s": n_dets / wall if wall > 0 else 0.0,
+                "tracks": {
+                    "created": created,
+                    "deleted": deleted,
+                    "active_final": len(last),
+                    "active_max": active_max,
+                    "active_mean": active_sum / n_frames if n_frames else 0.0,
+                },
+                "collisions": collisions,
+                "memory": {"max_rss_mb": _max_rss_mb(), "traced_peak_mb": traced_peak},
+                "digest": _digest(last),
+            },
+            "latency_ms": {s: h.summary() for s, h in lat.items()},
+            "meta": {
+                "versions": {
+                    "app": "2.0.0",
+                    "python": sys.version.split()[0],
+                    "numpy": np.__version__,
+                },
+                "seed": self.seed,
+                "git": _git_rev(),
+                "tracker": type(self.tracker).__name__,
+            },
+        }
+
+
+def _digest(tracks: List[Any]) -> str:
+    """Hash of the final track states: equal digests mean identical tracking output."""
+    h = hashlib.sha256()
+    for t in sorted(tracks, key=lambda t: t.id):
+        p = t.state.position
+        h.update(f"{t.id}:{p.x:.6f},{p.y:.6f},{p.z:.6f}:{t.hits}:{t.status.value};".encode())
+    return h.hexdigest()[:16]
+
+
+async def _aiter(
+    frames: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+) -> AsyncIterator[Dict[str, Any]]:
+    if hasattr(frames, "__aiter__"):
+        async for f in frames:  # type: ignore[union-attr]
+            yield f
+    else:
+        for f in frames:  # type: ignore[union-attr]
+            yield f
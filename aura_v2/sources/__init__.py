@@ -9,8 +9,8 @@ except Exception:  # aiokafka not installed
 
 def from_dsn(dsn: str):
     # demo://?fps=2
-    # jsonl://<path>?loop=1&interval=1.0
-    # kafka://<brokers>/<topic>?group_id=...
+    # jsonl://<path>?loop=1&interval=1.0&speed=1&key=timestamp&start=<time>&cache=0
+    # kafka://<brokers>/<topic>?group_id=...&max_batch=32&linger_ms=50&decode_thread=0
     import urllib.parse as u
 
     p = u.urlparse(dsn)
@@ -22,11 +22,27 @@ def from_dsn(dsn: str):
         path = (p.netloc + p.path).lstrip("/")
         loop = q.get("loop", "1") not in ("0", "false", "False")
         interval = float(q.get("interval", "1.0"))
-        return JsonlSource(path, loop=loop, interval=interval)
+        return JsonlSource(
+            path,
+            loop=loop,
+            interval=interval,
+            frame_key=q.get("key", "timestamp"),
+            speed=float(q.get("speed", "1.0")),
+            start=q.get("start"),
+            cache=q.get("cache", "0") not in ("0", "false", "False"),
+        )
     if p.scheme == "kafka":
         assert KafkaSource, "aiokafka is not installed"
         brokers = p.netloc
         topic = p.path.lstrip("/")
         gid = q.get("group_id", "aura-dev")
-        return KafkaSource(brokers, topic, gid)
+        return KafkaSource(
+            brokers,
+            topic,
+            gid,
+            max_batch=int(q.get("max_batch", "32")),
+            linger_ms=float(q.get("linger_ms", "50")),
+            sensor=q.get("sensor", "camera"),
+            decode_in_thread=q.get("decode_thread", "0") not in ("0", "false", "False"),
+        )
     raise ValueError(f"Unsupported source DSN: {dsn}")
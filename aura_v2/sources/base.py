@@ -2,7 +2,10 @@ from __future__ import annotations
 import abc
 import asyncio
 import datetime as dt
-from typing import AsyncIterator, Dict, Any, Iterable
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Any, Iterable, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aura_v2.domain.entities import DetectionBatch
 
 Detection = Dict[str, Any]
 
@@ -12,6 +15,17 @@ class DetectionSource(abc.ABC):
     async def frames(self) -> AsyncIterator[Dict[str, Any]]:
         """Yield TrackingRequest-shaped dicts."""
 
+    async def ack(self, frame: Dict[str, Any]) -> None:
+        """Called by the pumps once ``frame`` has been processed (no-op by default)."""
+
+    async def batches(self) -> AsyncIterator[Tuple[dt.datetime, "DetectionBatch"]]:
+        """Yield ``(frame timestamp, DetectionBatch)``, validated like POST /track."""
+        from aura_v2.api.fast_ingest import parse_track_frame
+
+        async for frame in self.frames():
+            cols = parse_track_frame(frame)
+            yield cols.timestamp, cols.batch
+
 
 def now_iso() -> str:
     return dt.datetime.now(dt.timezone.utc).isoformat()
@@ -1,24 +1,182 @@
+from __future__ import annotations
+
 import asyncio
+import itertools
 import json
+import os
 import pathlib
+from datetime import datetime, timezone
+from typing import IO, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Union
+
 from .base import DetectionSource, batch
 
+try:  # optional: pip install "aura-v2[perf]"
+    import orjson  # type: ignore
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except Exception:  # pragma: no cover - optional
+    _loads = json.loads
+
+Frame = Dict[str, Any]
+Rows = List[Dict[str, Any]]
+
+
+def _seconds(value: Any) -> Optional[float]:
+    """Epoch seconds of a recorded timestamp (ISO-8601 or number); naive = UTC."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    return None
+
 
 class JsonlSource(DetectionSource):
-    def __init__(self, path: str, loop: bool = True, interval: float = 1.0):
+    """
+    Replays a JSONL file of detections (one per line), streamed line by line.
+
+    Consecutive rows with the same ``frame_key`` value form one frame. The
+    default key is ``timestamp``; ``frame_key=None`` emits the whole file as
+    one frame. Frames carry the first row's recorded timestamp and are paced
+    by it: ``speed=1`` replays in recorded time, ``speed=N`` N times faster,
+    ``speed=0`` as fast as possible.
+
+    ``start`` (ISO-8601 or epoch seconds) skips to the first frame at or
+    after that time by bisecting byte offsets, so the file must be time
+    ordered. ``cache=True`` keeps the parsed rows after the first pass so
+    later loops skip reading and parsing (memory grows with the file).
+    File reads and parsing run in a worker thread.
+    ``interval`` is the pause between loops.
+    """
+
+    _CHUNK = 64  # row groups parsed per worker-thread hop
+
+    def __init__(
+        self,
+        path: str,
+        loop: bool = True,
+        interval: float = 1.0,
+        *,
+        frame_key: Optional[str] = "timestamp",
+        speed: float = 1.0,
+        start: Union[str, float, None] = None,
+        cache: bool = False,
+    ):
         self.path = pathlib.Path(path)
         self.loop = loop
         self.interval = interval
+        self.frame_key = frame_key or None
+        self.speed = max(0.0, float(speed))
+        self.start = _seconds(start) if start is not None else None
+        if start is not None and self.start is None:
+            raise ValueError(f"cannot parse start time {start!r}")
+        self.cache = cache
+        self._cached: Optional[List[Rows]] = None
 
     async def frames(self):
         while True:
-            rows = [
-                json.loads(line)
-                for line in self.path.read_text().splitlines()
-                if line.strip()
-            ]
-            # put all rows into camera_detections by default
-            yield batch(camera=rows)
+            cached = self._cached
+            keep: Optional[List[Rows]] = [] if self.cache and cached is None else None
+            clock: Optional[tuple] = None
+            async for rows in self._groups(cached):
+                if keep is not None:
+                    keep.append(rows)
+                # Built per replay, so frames without a recorded time get a
+                # fresh timestamp on every loop.
+                frame = self._frame(rows)
+                t = _seconds(frame.get("timestamp")) if self.frame_key else None
+                if self.speed > 0 and t is not None:
+                    now = asyncio.get_running_loop().time()
+                    if clock is None:
+                        clock = (t, now)
+                    delay = clock[1] + (t - clock[0]) / self.speed - now
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                yield frame
+            if keep is not None:
+                self._cached = keep
             if not self.loop:
                 return
             await asyncio.sleep(self.interval)
+
+    async def _groups(self, cached: Optional[List[Rows]]) -> AsyncIterator[Rows]:
+        """Row groups from the cache, or from the file in a worker thread."""
+        if cached is not None:
+            for rows in cached:
+                yield rows
+            return
+        # Seeking, reading and parsing block, so they run in a thread
+        # _CHUNK groups at a time; the event loop stays free on large logs.
+        groups = self._read()
+        try:
+            while True:
+                chunk = await asyncio.to_thread(list, itertools.islice(groups, self._CHUNK))
+                if not chunk:
+                    return
+                for rows in chunk:
+                    yield rows
+        finally:
+            groups.close()
+
+    def _read(self) -> Iterator[Rows]:
+        key = self.frame_key
+        with self.path.open("rb") as f:
+            if self.start is not None:
+                self._seek(f, self.start)
+            rows: Rows = []
+            current: Any = None
+            for line in f:
+                if not line.strip():
+                    continue
+                row = _loads(line)
+                if key is not None:
+                    value = row.get(key)
+                    if rows and value != current:
+                        yield rows
+                        rows = []
+                    current = value
+                rows.append(row)
+            if rows:
+                yield rows
+
+    def _frame(self, rows: Rows) -> Frame:
+        # put all rows into camera_detections by default
+        frame = batch(camera=rows)
+        if self.frame_key is not None and rows[0].get("timestamp") is not None:
+            frame["timestamp"] = rows[0]["timestamp"]
+        return frame
+
+    def _seek(self, f: IO[bytes], target: float) -> None:
+        """Move ``f`` to the first line whose timestamp is >= ``target``."""
+
+        def first_time_from(offset: int) -> Optional[float]:
+            # Time of the first timestamped line starting at or after offset.
+            f.seek(max(0, offset - 1))
+            if offset:
+                f.readline()
+            for line in f:
+                if line.strip():
+                    t = _seconds(_loads(line).get("timestamp"))
+                    if t is not None:
+                        return t
+            return None
+
+        lo, hi = 0, os.fstat(f.fileno()).st_size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            t = first_time_from(mid)
+            if t is None or t >= target:
+                hi = mid
+            else:
+                lo = mid + 1
+        f.seek(max(0, lo - 1))
+        if lo:
+            f.readline()
@@ -1,27 +1,159 @@
+from __future__ import annotations
+
 import asyncio
 import json
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
 from aiokafka import AIOKafkaConsumer
+
 from .base import DetectionSource, batch
 
+try:  # optional: pip install "aura-v2[perf]"
+    import orjson  # type: ignore
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except Exception:  # pragma: no cover - optional
+    _loads = json.loads
+
+_GROUPS = {"camera", "radar", "lidar"}
+# Frame key holding the source's sequence number; TrackRequest ignores it.
+SEQ_KEY = "kafka_seq"
+
+
+@dataclass
+class KafkaStats:
+    messages: int = 0
+    frames: int = 0
+    bad_messages: int = 0
+    commits: int = 0
+
 
 class KafkaSource(DetectionSource):
-    def __init__(self, brokers: str, topic: str, group_id: str = "aura-dev"):
+    """
+    One JSON detection per Kafka message, grouped into frames.
+
+    Records are pulled with ``getmany()``. A frame closes when it holds
+    ``max_batch`` detections or ``linger_ms`` after its first message,
+    whichever comes first. Messages keep their per-partition offset order
+    inside and across frames.
+
+    Offsets are committed manually: a frame's highest offset per partition
+    is committed when the pump acks the frame, so the committed position
+    never runs ahead of processed frames (at-least-once). Each frame
+    carries its sequence number under ``SEQ_KEY``; ``ack`` goes by that
+    number, so a copy of the frame acks the same offsets. With
+    ``decode_in_thread`` the JSON decoding of each poll runs in a worker
+    thread instead of on the event loop.
+    """
+
+    def __init__(
+        self,
+        brokers: str,
+        topic: str,
+        group_id: str = "aura-dev",
+        *,
+        max_batch: int = 32,
+        linger_ms: float = 50.0,
+        sensor: str = "camera",
+        decode_in_thread: bool = False,
+        consumer_factory: Optional[Callable[[], Any]] = None,
+    ):
+        if sensor not in _GROUPS:
+            raise ValueError(f"sensor must be one of {sorted(_GROUPS)}, got {sensor!r}")
         self.brokers, self.topic, self.group_id = brokers, topic, group_id
+        self.max_batch = max(1, int(max_batch))
+        self.linger_s = max(0.0, float(linger_ms)) / 1000.0
+        self.sensor = sensor
+        self.decode_in_thread = bool(decode_in_thread)
+        self.stats = KafkaStats()
+        self._consumer_factory = consumer_factory or self._default_consumer
+        self._consumer: Any = None
+        # (frame seq, {partition: next offset}) in emit order, awaiting ack
+        self._unacked: Deque[Tuple[int, Dict[Any, int]]] = deque()
+        self._seq = 0
+        self._committed: Dict[Any, int] = {}
 
-    async def frames(self):
-        consumer = AIOKafkaConsumer(
+    def _default_consumer(self) -> Any:
+        return AIOKafkaConsumer(
             self.topic,
             bootstrap_servers=self.brokers,
             group_id=self.group_id,
-            value_deserializer=lambda v: json.loads(v.decode()),
+            enable_auto_commit=False,
         )
+
+    async def frames(self):
+        consumer = self._consumer = self._consumer_factory()
         await consumer.start()
         try:
-            camera = []
-            async for msg in consumer:
-                camera.append(msg.value)
-                if len(camera) >= 32:  # simple batch
-                    yield batch(camera=camera)
-                camera = []
+            buf: List[bytes] = []
+            offsets: Dict[Any, int] = {}
+            opened = 0.0
+            while True:
+                if buf:
+                    wait_s = max(0.0, opened + self.linger_s - time.monotonic())
+                else:
+                    wait_s = self.linger_s or 0.1
+                records = await consumer.getmany(
+                    timeout_ms=int(wait_s * 1000), max_records=self.max_batch - len(buf)
+                )
+                for tp, msgs in records.items():
+                    if not msgs:
+                        continue
+                    if not buf:
+                        opened = time.monotonic()
+                    buf.extend(m.value for m in msgs)
+                    offsets[tp] = msgs[-1].offset + 1
+                if not buf:
+                    continue
+                if len(buf) < self.max_batch and time.monotonic() - opened < self.linger_s:
+                    continue
+
+                raw, buf = buf, []
+                dets = (
+                    await asyncio.to_thread(self._decode, raw)
+                    if self.decode_in_thread
+                    else self._decode(raw)
+                )
+                frame = batch(**{self.sensor: dets})
+                self._seq += 1
+                frame[SEQ_KEY] = self._seq
+                self._unacked.append((self._seq, offsets))
+                offsets = {}
+                self.stats.frames += 1
+                yield frame
         finally:
+            self._consumer = None
             await consumer.stop()
+
+    def _decode(self, raw: List[bytes]) -> List[Dict[str, Any]]:
+        out = []
+        for value in raw:
+            try:
+                det = _loads(value)
+            except ValueError:
+                det = None
+            if isinstance(det, dict):
+                out.append(det)
+            else:
+                self.stats.bad_messages += 1
+        self.stats.messages += len(raw)
+        return out
+
+    async def ack(self, frame: Dict[str, Any]) -> None:
+        """Commit ``frame``'s offsets (and those of unacked frames before it)."""
+        seq = frame.get(SEQ_KEY)
+        if not isinstance(seq, int) or not self._unacked or seq < self._unacked[0][0]:
+            return
+        done: Dict[Any, int] = {}
+        while self._unacked and self._unacked[0][0] <= seq:
+            done.update(self._unacked.popleft()[1])
+        # Frames the pump gave up on before this one are covered too:
+        # committed offsets are a per-partition high-water mark.
+        todo = {tp: o for tp, o in done.items() if o > self._committed.get(tp, -1)}
+        if todo and self._consumer is not None:
+            await self._consumer.commit(todo)
+            self._committed.update(todo)
+            self.stats.commits += 1
@@ -0,0 +1,125 @@
+from __future__ import annotations
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from .base import DetectionSource
+
+Frame = Dict[str, Any]
+FrameHandler = Callable[[Frame], Awaitable[Any]]
+
+
+@dataclass
+class PumpStats:
+    """Frame-to-track latency (source yield -> tracker done) and throughput."""
+
+    mode: str
+    frames: int = 0
+    errors: int = 0
+    max_queue_depth: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    latency_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=4096))
+
+    def record(self, t_in: float) -> None:
+        self.frames += 1
+        self.latency_ms.append((time.perf_counter() - t_in) * 1000.0)
+
+    def summary(self) -> Dict[str, Any]:
+        lat = sorted(self.latency_ms)
+
+        def pct(p: float) -> float:
+            return lat[min(len(lat) - 1, int(p * len(lat)))] if lat else 0.0
+
+        elapsed = time.perf_counter() - self.started
+        return {
+            "mode": self.mode,
+            "frames": self.frames,
+            "errors": self.errors,
+            "fps": self.frames / elapsed if elapsed > 0 else 0.0,
+            "latency_ms_p50": pct(0.50),
+            "latency_ms_p99": pct(0.99),
+            "latency_ms_max": lat[-1] if lat else 0.0,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+class InProcessPump:
+    """
+    Feeds source frames straight into ``handler`` in the same event loop.
+
+    Frames pass through a bounded queue: when the handler falls behind the
+    source is paused (``put`` waits) instead of buffering without limit.
+    """
+
+    _END = object()
+
+    def __init__(self, source: DetectionSource, handler: FrameHandler, maxsize: int = 64):
+        self.source = source
+        self.handler = handler
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=max(1, maxsize))
+        self.stats = PumpStats(mode="inproc")
+
+    async def run(self) -> None:
+        consumer = asyncio.create_task(self._consume())
+        try:
+            async for frame in self.source.frames():
+                await self.queue.put((frame, time.perf_counter()))
+                depth = self.queue.qsize()
+                if depth > self.stats.max_queue_depth:
+                    self.stats.max_queue_depth = depth
+            await self.queue.put(self._END)
+            await consumer
+        finally:
+            if not consumer.done():
+                consumer.cancel()
+
+    async def _consume(self) -> None:
+        while True:
+            item = await self.queue.get()
+            if item is self._END:
+                return
+            frame, t_in = item
+            try:
+                await self.handler(frame)
+                await self.source.ack(frame)
+            except Exception:
+                self.stats.errors += 1
+                continue
+            self.stats.record(t_in)
+
+
+class HttpPump:
+    """Fallback: POST every frame to ``url`` (e.g. the app's own /track)."""
+
+    def __init__(self, source: DetectionSource, url: str, timeout: float = 10.0):
+        self.source = source
+        self.url = url
+        self.timeout = timeout
+        self.stats = PumpStats(mode="http")
+
+    async def run(self, client: Optional[Any] = None) -> None:
+        # Local import keeps app import time small
+        import httpx  # type: ignore
+
+        if client is None:
+            async with httpx.AsyncClient(timeout=self.timeout) as c:
+                await self._post_all(c)
+        else:
+            await self._post_all(client)
+
+    async def _post_all(self, client: Any) -> None:
+        async for frame in self.source.frames():
+            t_in = time.perf_counter()
+            try:
+                r = await client.post(self.url, json=frame)
+                if r.status_code >= 400:
+                    self.stats.errors += 1
+                    continue
+                await self.source.ack(frame)
+            except Exception:
+                # ignore transient errors
+                self.stats.errors += 1
+                continue
+            self.stats.record(t_in)
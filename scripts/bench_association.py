@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Association benchmark: legacy greedy loop vs gated GNN (spatial index + Hungarian).
+
+    python scripts/bench_association.py --sizes 100 1000 5000
+
+Scenes keep a constant target density (warehouse floor), so the number of
+in-gate candidates per track stays roughly constant as N grows.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from aura_v2.domain.entities import (  # noqa: E402
+    Confidence,
+    Detection,
+    Position3D,
+    Track,
+    TrackState,
+    Velocity3D,
+)
+from aura_v2.domain.services.association import GNN_AssociationStrategy  # noqa: E402
+
+TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_scene(n: int, seed: int = 0, density: float = 0.01):
+    """n tracks + n noisy detections spread over an area with fixed density (per m²)."""
+    rng = np.random.default_rng(seed)
+    side = math.sqrt(n / density)
+    xy = rng.uniform(0.0, side, size=(n, 2))
+    noisy = xy + rng.normal(scale=0.5, size=xy.shape)
+    order = rng.permutation(n)
+    tracks = [
+        Track(
+            id=f"t{i}",
+            state=TrackState(Position3D(float(x), float(y), 0.0), Velocity3D()),
+        )
+        for i, (x, y) in enumerate(xy)
+    ]
+    dets = [
+        Detection(
+            sensor_id="cam",
+            timestamp=TS,
+            position=Position3D(float(noisy[k, 0]), float(noisy[k, 1]), 0.0),
+            confidence=Confidence(0.9),
+        )
+        for k in order
+    ]
+    return tracks, dets
+
+
+def legacy_greedy(tracks: List[Track], dets: List[Detection], max_distance: float):
+    """The pre-GNN ModernTracker._associate loop, kept here as the baseline."""
+    matched, used = [], set()
+    for det in dets:
+        best_i, best = -1, float("inf")
+        for i, tr in enumerate(tracks):
+            if i in used:
+                continue
+            a, b = tr.state.position, det.position
+            dx, dy, dz = a.x - b.x, a.y - b.y, a.z - b.z
+            d = float(np.sqrt(dx * dx + dy * dy + dz * dz))
+            if d < best:
+                best, best_i = d, i
+        if best_i >= 0 and best <= max_distance:
+            matched.append((tracks[best_i], det, 1.0 / (1.0 + best)))
+            used.add(best_i)
+    return matched
+
+
+def timeit(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    ap.add_argument("--max-distance", type=float, default=3.0)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--index", choices=["kdtree", "grid"], default="kdtree")
+    ap.add_argument(
+        "--greedy-limit",
+        type=int,
+        default=5000,
+        help="skip the legacy loop above this size (it is O(N*M) Python calls)",
+    )
+    args = ap.parse_args()
+
+    gnn = GNN_AssociationStrategy(max_distance=args.max_distance, index=args.index)
+    print(f"{'N x M':>12} {'greedy ms':>12} {'gnn ms':>10} {'speedup':>9} {'matches':>9}")
+    for n in args.sizes:
+        tracks, dets = make_scene(n)
+        t_gnn = timeit(lambda tracks=tracks, dets=dets: gnn.associate(tracks, dets), args.repeat)
+        n_match = len(gnn.associate(tracks, dets))
+        if n <= args.greedy_limit:
+            t_greedy = timeit(
+                lambda tracks=tracks, dets=dets: legacy_greedy(tracks, dets, args.max_distance), 1
+            )
+            speed = f"{t_greedy / t_gnn:8.1f}x"
+            greedy = f"{t_greedy:12.1f}"
+        else:
+            speed, greedy = f"{'-':>9}", f"{'skipped':>12}"
+        print(f"{f'{n}x{n}':>12} {greedy} {t_gnn:10.1f} {speed} {n_match:9d}")
+
+
+if __name__ == "__main__":
+    main()
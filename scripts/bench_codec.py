@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Persistence codec throughput: reflective ``_jsonify`` path vs flat codec.
+
+    python scripts/bench_codec.py --n 20000
+
+Reports objects/sec for Track and Detection encode, decode and the full
+encode -> BSON bytes -> decode round trip.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, List
+
+import bson
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from aura_v2.domain.entities import (  # noqa: E402
+    Confidence,
+    Detection,
+    Position3D,
+    Track,
+    TrackState,
+    TrackStatus,
+    Velocity3D,
+)
+from aura_v2.infrastructure.persistence.codec import (  # noqa: E402
+    _jsonify,
+    decode_detection,
+    decode_track,
+    encode_detection,
+    encode_track,
+)
+from aura_v2.infrastructure.persistence.mongo import MongoTrackRepository  # noqa: E402
+
+TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_tracks(n: int) -> List[Track]:
+    return [
+        Track(
+            id=f"t{i}",
+            state=TrackState(Position3D(float(i), 1.0, 0.0), Velocity3D(0.5, 0.0, 0.0)),
+            status=TrackStatus.ACTIVE,
+            confidence=Confidence(0.9),
+            created_at=TS,
+            updated_at=TS,
+        )
+        for i in range(n)
+    ]
+
+
+def make_detections(n: int) -> List[Detection]:
+    return [
+        Detection(
+            sensor_id="radar",
+            timestamp=TS,
+            position=Position3D(float(i), 2.0, 0.0),
+            confidence=Confidence(0.8),
+            attributes={"snr": 10.0},
+        )
+        for i in range(n)
+    ]
+
+
+def rate(fn: Callable[[object], object], items: List[object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for it in items:
+            fn(it)
+        best = min(best, time.perf_counter() - t0)
+    return len(items) / best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    tracks = make_tracks(args.n)
+    dets = make_detections(args.n)
+    legacy_docs = [MongoTrackRepository._to_doc(t) for t in make_tracks(args.n)]
+    flat_docs = [encode_track(t) for t in tracks]
+    det_docs = [encode_detection(d) for d in dets]
+
+    rows = [
+        ("track encode", rate(MongoTrackRepository._to_doc, make_tracks(args.n), args.repeat),
+         rate(encode_track, tracks, args.repeat)),
+        ("track decode", rate(MongoTrackRepository._to_track, legacy_docs, args.repeat),
+         rate(decode_track, flat_docs, args.repeat)),
+        ("track bson rt",
+         rate(lambda t: bson.decode(bson.encode(MongoTrackRepository._to_doc(t))),
+              make_tracks(args.n), args.repeat),
+         rate(lambda t: decode_track(bson.decode(bson.encode(encode_track(t)))),
+              tracks, args.repeat)),
+        ("det encode", rate(_jsonify, dets, args.repeat),
+         rate(encode_detection, dets, args.repeat)),
+        ("det decode", float("nan"), rate(decode_detection, det_docs, args.repeat)),
+    ]
+    print(f"{'':14} {'reflective/s':>13} {'codec/s':>11} {'speedup':>8}")
+    for name, old, new in rows:
+        if math.isnan(old):  # no reflective decoder for detections
+            print(f"{name:14} {'-':>13} {new:11.0f} {'-':>8}")
+        else:
+            print(f"{name:14} {old:13.0f} {new:11.0f} {new / old:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Collision prediction per frame: pairwise loop vs vectorized + pruned.
+
+    python scripts/bench_collision.py --tracks 300 1000 3000 --area 5000
+
+Tracks are spread uniformly over an --area x --area square with Gaussian
+velocities (--speed m/s per axis). The basic predictor is skipped above
+--basic-max tracks since it is quadratic in Python.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from aura_v2.application.services import BasicCollisionPredictor, VectorizedCollisionPredictor  # noqa: E402
+from aura_v2.domain.entities import Confidence, Position3D, Track, TrackState, Velocity3D  # noqa: E402
+
+
+def make_tracks(n: int, area: float, speed: float, seed: int) -> list:
+    rng = np.random.default_rng(seed)
+    p = rng.uniform(0.0, area, size=(n, 2))
+    v = rng.normal(scale=speed, size=(n, 2))
+    return [
+        Track(
+            id=f"t{k}",
+            state=TrackState(
+                position=Position3D(float(p[k, 0]), float(p[k, 1]), 0.0),
+                velocity=Velocity3D(float(v[k, 0]), float(v[k, 1]), 0.0),
+            ),
+            confidence=Confidence(0.9),
+        )
+        for k in range(n)
+    ]
+
+
+def timed(fn, repeat: int):
+    out = fn()
+    t = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return out, (time.perf_counter() - t) * 1000.0 / repeat
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--tracks", type=int, nargs="+", default=[300, 1000, 3000])
+    ap.add_argument("--area", type=float, default=5000.0)
+    ap.add_argument("--speed", type=float, default=3.0)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--basic-max", type=int, default=3000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    for n in args.tracks:
+        tracks = make_tracks(n, args.area, args.speed, args.seed)
+        fast = VectorizedCollisionPredictor()
+        vel = np.array([(t.state.velocity.vx, t.state.velocity.vy, 0.0) for t in tracks])
+        print(f"{n:6d} tracks, prune radius {fast.search_radius(vel):.0f} m")
+        got, ms = timed(lambda fast=fast, tracks=tracks: fast.predict(tracks), args.repeat)
+        print(f"  {'vectorized':<18}: {ms:9.2f} ms, {len(got)} collisions")
+        approx, ms = timed(
+            lambda tracks=tracks: VectorizedCollisionPredictor(exact=False).predict(tracks),
+            args.repeat,
+        )
+        print(f"  {'vectorized approx':<18}: {ms:9.2f} ms, {len(approx)} collisions")
+        if n <= args.basic_max:
+            want, ms = timed(lambda tracks=tracks: BasicCollisionPredictor().predict(tracks), 1)
+            print(f"  {'basic':<18}: {ms:9.2f} ms, {len(want)} collisions, same: {got == want}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Incremental vs stateless collision prediction on a mostly static scene.
+
+    python scripts/bench_collision_incremental.py --tracks 2000 --moving 0.05
+
+A warehouse floor: --tracks objects in an --area square, most parked
+(position jitter below the tolerance), a --moving fraction driving at
+constant velocity. Per-frame time of VectorizedCollisionPredictor (every
+pair in the pruning radius, every frame) is compared with
+IncrementalCollisionPredictor (only changed tracks), plus its hit rate.
+Both see the same frames; their outputs differ only for pairs whose
+verdict flips within the incremental predictor's tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from aura_v2.application.services import (  # noqa: E402
+    IncrementalCollisionPredictor,
+    VectorizedCollisionPredictor,
+)
+from aura_v2.domain.entities import Confidence, Position3D, Track, TrackState, Velocity3D  # noqa: E402
+
+
+def tracks_at(ids, pos, vel) -> list:
+    return [
+        Track(
+            id=ids[k],
+            state=TrackState(
+                position=Position3D(*map(float, pos[k])),
+                velocity=Velocity3D(*map(float, vel[k])),
+            ),
+            confidence=Confidence(0.9),
+        )
+        for k in range(len(ids))
+    ]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--tracks", type=int, default=2000)
+    ap.add_argument("--moving", type=float, default=0.05)
+    ap.add_argument("--area", type=float, default=1000.0)
+    ap.add_argument("--frames", type=int, default=50)
+    ap.add_argument("--dt", type=float, default=0.1)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    n = args.tracks
+    ids = [f"t{k}" for k in range(n)]
+    pos = np.zeros((n, 3))
+    pos[:, :2] = rng.uniform(0.0, args.area, size=(n, 2))
+    vel = np.zeros((n, 3))
+    moving = rng.random(n) < args.moving
+    vel[moving, :2] = rng.normal(scale=2.0, size=(int(moving.sum()), 2))
+
+    fast = VectorizedCollisionPredictor(exact=False)
+    inc = IncrementalCollisionPredictor()
+    t_fast = t_inc = 0.0
+    diff = []
+    for k in range(args.frames):
+        now = k * args.dt
+        jitter = np.zeros_like(pos)
+        jitter[~moving, :2] = rng.normal(scale=0.05, size=(int((~moving).sum()), 2))
+        tracks = tracks_at(ids, pos + vel * now + jitter, vel)
+        t = time.perf_counter()
+        a = fast.predict(tracks)
+        t_fast += time.perf_counter() - t
+        t = time.perf_counter()
+        b = inc.predict(tracks, now=now)
+        t_inc += time.perf_counter() - t
+        diff.append(abs(len(a) - len(b)))
+
+    f = args.frames
+    st = inc.stats
+    print(f"{n} tracks, {int(moving.sum())} moving, {f} frames")
+    # Parked jitter is below the tolerance, so pairs right at the threshold
+    # keep their cached verdict; the counts differ by at most a few.
+    print(f"collision count differs in {sum(d > 0 for d in diff)} frames, by at most {max(diff)}")
+    print(f"vectorized : {t_fast * 1000 / f:8.2f} ms/frame")
+    print(
+        f"incremental: {t_inc * 1000 / f:8.2f} ms/frame, hit rate {st.hit_rate:.3f}, "
+        f"{st.pairs_evaluated / f:,.0f} pairs/frame, {st.entries_expired} expired"
+    )
+
+
+if __name__ == "__main__":
+    main()
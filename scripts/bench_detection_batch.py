@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+List[Detection] vs DetectionBatch through ModernTracker.update.
+
+    python scripts/bench_detection_batch.py --frames 100 --dets 200 2000
+
+Both paths start from the same columns (what /track/fast and the f32
+WebSocket decode to): "list" builds one Detection per row before calling
+update(), "batch" wraps the columns in a DetectionBatch. Reported per frame:
+conversion cost and total update cost, batch Kalman on.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from aura_v2.domain.entities import Confidence, Detection, DetectionBatch, Position3D  # noqa: E402
+from aura_v2.infrastructure.tracking.modern_tracker import ModernTracker  # noqa: E402
+
+
+def as_list(xyz: np.ndarray, conf: np.ndarray, ts: datetime) -> list:
+    return [
+        Detection(sensor_id="cam", timestamp=ts, position=Position3D(x, y, z), confidence=Confidence(c))
+        for (x, y, z), c in zip(xyz.tolist(), conf.tolist())
+    ]
+
+
+def as_batch(xyz: np.ndarray, conf: np.ndarray, ts: datetime) -> DetectionBatch:
+    return DetectionBatch.from_columns(xyz, conf, ts, "cam")
+
+
+async def run(convert, frames: int, dets: int) -> tuple[float, float]:
+    rng = np.random.default_rng(0)
+    p0 = rng.uniform(0.0, 20.0 * dets, size=(dets, 3))
+    v = rng.normal(scale=3.0, size=(dets, 3))
+    conf = np.full(dets, 0.9)
+    tracker = ModernTracker(batch_kalman=True, max_distance=10.0)
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    conv = total = 0.0
+    for k in range(frames):
+        ts = t0 + timedelta(seconds=0.1 * k)
+        xyz = p0 + v * (0.1 * k)
+        a = time.perf_counter()
+        d = convert(xyz, conf, ts)
+        b = time.perf_counter()
+        await tracker.update(d, ts)
+        c = time.perf_counter()
+        conv += b - a
+        total += c - a
+    await tracker.close()
+    return conv * 1000.0 / frames, total * 1000.0 / frames
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--frames", type=int, default=100)
+    ap.add_argument("--dets", type=int, nargs="+", default=[200, 2000])
+    args = ap.parse_args()
+
+    print(f"{'dets':>6} {'path':>6} {'convert ms':>11} {'frame ms':>9}")
+    for n in args.dets:
+        for name, fn in (("list", as_list), ("batch", as_batch)):
+            conv, total = asyncio.run(run(fn, args.frames, n))
+            print(f"{n:6d} {name:>6} {conv:11.3f} {total:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+/track vs /track/fast: request decode + tracker + response encode.
+
+    python scripts/bench_fast_track.py --frames 300 --dets 50 200
+
+Both endpoints run in-process over httpx's ASGI transport (no sockets) on a
+fresh app each, fed identical pre-encoded JSON bodies. Also reports the
+decode step alone: ``TrackRequest.model_validate_json`` vs
+``parse_track_body``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+import httpx
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from aura_v2.api.fast_ingest import orjson, parse_track_body  # noqa: E402
+from aura_v2.api.schemas import TrackRequest  # noqa: E402
+from aura_v2.main import AURAApplication  # noqa: E402
+
+
+def make_bodies(n: int, dets: int, seed: int = 0) -> List[bytes]:
+    rng = np.random.default_rng(seed)
+    p0 = rng.uniform(0.0, 500.0, size=(dets, 2))
+    v = rng.normal(scale=2.0, size=(dets, 2))
+    t0 = datetime.now(timezone.utc)
+    out = []
+    for k in range(n):
+        ts = (t0 + timedelta(seconds=0.033 * k)).isoformat()
+        xy = p0 + v * (0.033 * k)
+        body = {
+            "camera_detections": [
+                {"sensor_id": "camera_1", "timestamp": ts,
+                 "position": {"x": float(x), "y": float(y), "z": 0.0}, "confidence": 0.9}
+                for x, y in xy
+            ],
+            "timestamp": ts,
+        }
+        out.append(json.dumps(body).encode())
+    return out
+
+
+async def run(path: str, bodies: List[bytes]) -> List[float]:
+    app = AURAApplication().get_app()
+    lat = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for body in bodies:
+            t = time.perf_counter()
+            r = await client.post(path, content=body, headers={"content-type": "application/json"})
+            lat.append((time.perf_counter() - t) * 1000.0)
+            r.raise_for_status()
+    return lat
+
+
+def decode_cost(bodies: List[bytes]) -> List[float]:
+    out = []
+    for fn in (TrackRequest.model_validate_json, parse_track_body):
+        t = time.perf_counter()
+        for b in bodies:
+            fn(b)
+        out.append((time.perf_counter() - t) * 1e6 / len(bodies))
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--frames", type=int, default=300)
+    ap.add_argument("--dets", type=int, nargs="+", default=[50, 200])
+    args = ap.parse_args()
+
+    print(f"orjson: {'yes' if orjson is not None else 'no (json fallback)'}")
+    print(f"{'dets':>5} {'endpoint':>12} {'frames/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'decode us':>10}")
+    for dets in args.dets:
+        bodies = make_bodies(args.frames, dets)
+        pyd_us, fast_us = decode_cost(bodies)
+        for path, us in (("/track", pyd_us), ("/track/fast", fast_us)):
+            lat = asyncio.run(run(path, bodies))
+            p50, p99 = np.percentile(lat, [50, 99])
+            fps = 1000.0 * len(lat) / sum(lat)
+            print(f"{dets:5d} {path:>12} {fps:9.1f} {p50:8.2f} {p99:8.2f} {us:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
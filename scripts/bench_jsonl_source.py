@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+JsonlSource replay: time to first frame, full-pass rate, cached loops, seek.
+
+    python scripts/bench_jsonl_source.py --frames 20000 --per-frame 20
+
+Writes a time-ordered replay log to a temp file (frames x per-frame rows)
+and replays it as fast as possible (speed=0). "read_text" is the old
+approach for reference: the whole file read, split and parsed before the
+first (single) frame.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from aura_v2.sources.jsonl import JsonlSource  # noqa: E402
+
+T0 = 1_700_000_000.0
+
+
+def write_log(path: Path, frames: int, per_frame: int) -> None:
+    with path.open("w") as f:
+        for k in range(frames):
+            ts = T0 + 0.1 * k
+            for i in range(per_frame):
+                f.write(
+                    json.dumps(
+                        {
+                            "sensor_id": "camera_1",
+                            "timestamp": ts,
+                            "position": {"x": float(i), "y": 0.1 * k},
+                            "confidence": 0.9,
+                        }
+                    )
+                    + "\n"
+                )
+
+
+async def replay(src: JsonlSource, limit: int) -> tuple[float, float]:
+    """(ms to first frame, seconds for ``limit`` frames)."""
+    t = time.perf_counter()
+    first = None
+    n = 0
+    gen = src.frames()
+    async for _ in gen:
+        if first is None:
+            first = time.perf_counter() - t
+        n += 1
+        if n == limit:
+            break
+    await gen.aclose()
+    return (first or 0.0) * 1000.0, time.perf_counter() - t
+
+
+def read_text_ms(path: Path) -> float:
+    t = time.perf_counter()
+    [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+    return (time.perf_counter() - t) * 1000.0
+
+
+def peak_mb(fn) -> float:
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--frames", type=int, default=20_000)
+    ap.add_argument("--per-frame", type=int, default=20)
+    args = ap.parse_args()
+    rows = args.frames * args.per_frame
+
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "replay.jsonl"
+        write_log(path, args.frames, args.per_frame)
+        print(f"log: {rows} rows, {path.stat().st_size / 1e6:.1f} MB")
+
+        n = args.frames
+
+        def stream() -> JsonlSource:
+            return JsonlSource(str(path), loop=False, speed=0)
+
+        old = peak_mb(lambda: read_text_ms(path))
+        print(f"read_text: first frame {read_text_ms(path):9.1f} ms, peak {old:8.2f} MB")
+        first, total = asyncio.run(replay(stream(), n))
+        peak = peak_mb(lambda: asyncio.run(replay(stream(), n)))
+        print(f"streaming: first frame {first:9.3f} ms, {rows / total:10,.0f} rows/s, peak {peak:8.2f} MB")
+
+        cached = JsonlSource(str(path), loop=True, interval=0, speed=0, cache=True)
+        _, total = asyncio.run(replay(cached, 3 * n))
+        print(f"cache x3 : {3 * rows / total:10,.0f} rows/s (first pass parses, two from memory)")
+
+        half = n // 2
+        seek = JsonlSource(str(path), loop=False, speed=0, start=T0 + 0.1 * half)
+        first, _ = asyncio.run(replay(seek, 1))
+        print(f"seek     : frame {half} of {n} after {first:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
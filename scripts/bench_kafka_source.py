@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+KafkaSource ingestion throughput.
+
+    python scripts/bench_kafka_source.py --messages 200000 --partitions 4
+    python scripts/bench_kafka_source.py --brokers localhost:9092 --topic aura.dets
+
+Without --brokers the source reads from an in-memory consumer that serves
+pre-encoded JSON detections through getmany(), so the numbers are the
+source's own cost: polling, framing, decoding, offset bookkeeping and
+commits (every frame is acked). "per-message" is the old consumption style
+for comparison: ``async for msg in consumer`` with the JSON deserializer
+called per record, then 32-row frames.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from aura_v2.sources.base import batch  # noqa: E402
+from aura_v2.sources.kafka import KafkaSource  # noqa: E402
+
+Msg = namedtuple("Msg", "offset value")
+
+
+class MemoryConsumer:
+    def __init__(self, values: List[bytes], partitions: int) -> None:
+        self.parts = {p: values[p::partitions] for p in range(partitions)}
+        self.pos = {p: 0 for p in self.parts}
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def commit(self, offsets: Dict[Any, int]) -> None: ...
+
+    async def getmany(self, timeout_ms: int = 0, max_records: int | None = None) -> Dict[Any, List[Msg]]:
+        out, left = {}, max_records or 10**9
+        for p, vals in self.parts.items():
+            i = self.pos[p]
+            take = vals[i : i + left]
+            if take:
+                out[p] = [Msg(i + k, v) for k, v in enumerate(take)]
+                self.pos[p] += len(take)
+                left -= len(take)
+        if not out:
+            await asyncio.sleep(timeout_ms / 1000.0)
+        return out
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for p, vals in self.parts.items():
+            for i, v in enumerate(vals):
+                yield Msg(i, json.loads(v.decode()))
+
+
+def payload(n: int) -> List[bytes]:
+    return [
+        json.dumps(
+            {
+                "sensor_id": "camera_1",
+                "timestamp": "2025-01-01T00:00:00Z",
+                "position": {"x": i * 0.1, "y": 2.0, "z": 0.0},
+                "confidence": 0.9,
+            }
+        ).encode()
+        for i in range(n)
+    ]
+
+
+async def run_source(src: KafkaSource, n: int) -> float:
+    t = time.perf_counter()
+    seen = 0
+    gen = src.frames()
+    async for frame in gen:
+        seen += len(frame["camera_detections"])
+        await src.ack(frame)
+        if seen >= n:
+            break
+    await gen.aclose()
+    return n / (time.perf_counter() - t)
+
+
+async def run_per_message(consumer: MemoryConsumer, n: int) -> float:
+    t = time.perf_counter()
+    camera: List[Any] = []
+    seen = 0
+    async for msg in consumer:
+        camera.append(msg.value)
+        if len(camera) >= 32:
+            batch(camera=camera)
+            seen += len(camera)
+            camera = []
+    return seen / (time.perf_counter() - t)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--messages", type=int, default=200_000)
+    ap.add_argument("--partitions", type=int, default=4)
+    ap.add_argument("--brokers", default=None)
+    ap.add_argument("--topic", default="aura.detections")
+    args = ap.parse_args()
+    n = args.messages
+    values = payload(n)
+
+    if args.brokers is None:
+        rate = asyncio.run(run_per_message(MemoryConsumer(values, args.partitions), n))
+        print(f"{'per-message':>24}: {rate:12,.0f} msg/s")
+    for size in (32, 256, 1024):
+        for thread in (False, True):
+            kw: Dict[str, Any] = {"max_batch": size, "linger_ms": 50, "decode_in_thread": thread}
+            if args.brokers is None:
+                kw["consumer_factory"] = lambda: MemoryConsumer(values, args.partitions)
+            src = KafkaSource(args.brokers or "memory", args.topic, **kw)
+            rate = asyncio.run(run_source(src, n))
+            label = f"getmany {size}{' +thread' if thread else ''}"
+            print(f"{label:>24}: {rate:12,.0f} msg/s  commits {src.stats.commits}")
+
+
+if __name__ == "__main__":
+    main()
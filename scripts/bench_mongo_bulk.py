@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Track persistence benchmark: per-document ``save`` vs bulk ``save_many``.
+
+Needs a reachable mongod (``MONGO_URI``, default mongodb://localhost:27017):
+
+    python scripts/bench_mongo_bulk.py --sizes 1000 10000
+
+Each size is written twice per mode (insert, then replace of the same ids)
+into a scratch collection that is dropped afterwards.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+
+from aura_v2.domain.entities import (  # noqa: E402
+    Confidence,
+    Position3D,
+    Track,
+    TrackState,
+    TrackStatus,
+    Velocity3D,
+)
+from aura_v2.infrastructure.persistence.mongo import (  # noqa: E402
+    MongoTrackRepository,
+    _encode_track,
+)
+
+TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_tracks(n: int) -> List[Track]:
+    return [
+        Track(
+            id=f"bench_{i:06d}",
+            state=TrackState(
+                Position3D(float(i), 2.0 * i, 0.0), Velocity3D(0.5, -0.25, 0.0)
+            ),
+            status=TrackStatus.ACTIVE,
+            confidence=Confidence(0.9),
+            created_at=TS,
+            updated_at=TS,
+        )
+        for i in range(n)
+    ]
+
+
+def encode_rate(tracks: List[Track]) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    for t in tracks:
+        MongoTrackRepository._to_doc(t)
+    t_reflect = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for t in tracks:
+        _encode_track(t)
+    t_direct = time.perf_counter() - t0
+    return len(tracks) / t_reflect, len(tracks) / t_direct
+
+
+async def run(sizes: List[int], uri: str, db: str) -> None:
+    client = AsyncIOMotorClient(uri, serverSelectionTimeoutMS=3000)
+    await client.admin.command("ping")
+    repo = MongoTrackRepository(client=client, db_name=db, collection_name="bench_tracks")
+    print(
+        f"{'N':>7} {'encode/s':>10} {'direct/s':>10} "
+        f"{'save docs/s':>12} {'save_many docs/s':>17} {'speedup':>8}"
+    )
+    try:
+        for n in sizes:
+            tracks = make_tracks(n)
+            enc_r, enc_d = encode_rate(tracks)
+
+            await repo.delete_all()
+            t0 = time.perf_counter()
+            for _ in range(2):
+                for t in tracks:
+                    await repo.save(t)
+            single = 2 * n / (time.perf_counter() - t0)
+
+            await repo.delete_all()
+            t0 = time.perf_counter()
+            for _ in range(2):
+                await repo.save_many(tracks)
+            bulk = 2 * n / (time.perf_counter() - t0)
+            assert await repo._collection.count_documents({}) == n
+
+            print(
+                f"{n:7d} {enc_r:10.0f} {enc_d:10.0f} "
+                f"{single:12.0f} {bulk:17.0f} {bulk / single:7.1f}x"
+            )
+    finally:
+        await repo._collection.drop()
+        client.close()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    ap.add_argument("--uri", default=os.getenv("MONGO_URI", "mongodb://localhost:27017"))
+    ap.add_argument("--db", default=os.getenv("MONGO_DB", "aura_bench"))
+    args = ap.parse_args()
+    asyncio.run(run(args.sizes, args.uri, args.db))
+
+
+if __name__ == "__main__":
+    main()
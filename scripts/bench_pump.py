@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Source pump benchmark: in-process queue vs HTTP loopback to /track.
+
+    python scripts/bench_pump.py --frames 500 --dets 50 --fps 0 30
+
+``--fps 0`` runs the source unthrottled (max sustainable fps); any other
+value paces the source and reports frame-to-track latency at that rate.
+The HTTP mode starts uvicorn on a free local port in a background thread.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import uvicorn  # noqa: E402
+
+from aura_v2.main import AURAApplication  # noqa: E402
+from aura_v2.sources.base import DetectionSource  # noqa: E402
+from aura_v2.sources.pump import HttpPump, InProcessPump  # noqa: E402
+
+
+class SyntheticSource(DetectionSource):
+    """``dets`` targets moving on straight lines, one frame per tick."""
+
+    def __init__(self, frames: int, dets: int, fps: float, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.n_frames = frames
+        self.p0 = rng.uniform(0.0, 500.0, size=(dets, 2))
+        self.v = rng.normal(scale=2.0, size=(dets, 2))
+        self.dt = 1.0 / fps if fps > 0 else 0.0
+
+    async def frames(self):
+        t0 = datetime.now(timezone.utc)
+        for k in range(self.n_frames):
+            ts = (t0 + timedelta(seconds=0.033 * k)).isoformat()
+            xy = self.p0 + self.v * (0.033 * k)
+            dets: List[Dict[str, Any]] = [
+                {
+                    "sensor_id": "camera_1",
+                    "timestamp": ts,
+                    "position": {"x": float(x), "y": float(y)},
+                    "confidence": 0.9,
+                }
+                for x, y in xy
+            ]
+            yield {
+                "camera_detections": dets,
+                "radar_detections": [],
+                "lidar_detections": [],
+                "timestamp": ts,
+            }
+            if self.dt:
+                await asyncio.sleep(self.dt)
+            else:
+                await asyncio.sleep(0)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def run_inproc(src: DetectionSource) -> Dict[str, Any]:
+    aura = AURAApplication()
+    aura.get_app()
+    pump = InProcessPump(src, aura._ingest_frame, maxsize=64)
+    await pump.run()
+    return pump.stats.summary()
+
+
+async def run_http(src: DetectionSource) -> Dict[str, Any]:
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(AURAApplication().get_app(), host="127.0.0.1", port=port, log_level="error")
+    )
+    th = threading.Thread(target=server.run, daemon=True)
+    th.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        pump = HttpPump(src, f"http://127.0.0.1:{port}/track")
+        await pump.run()
+        return pump.stats.summary()
+    finally:
+        server.should_exit = True
+        th.join()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--frames", type=int, default=500)
+    ap.add_argument("--dets", type=int, default=50)
+    ap.add_argument("--fps", type=float, nargs="+", default=[0.0, 30.0])
+    args = ap.parse_args()
+
+    print(
+        f"{'mode':>7} {'target fps':>10} {'fps':>8} {'p50 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8} {'errors':>7}"
+    )
+    for fps in args.fps:
+        for name, runner in (("http", run_http), ("inproc", run_inproc)):
+            s = asyncio.run(runner(SyntheticSource(args.frames, args.dets, fps)))
+            target = "max" if fps <= 0 else f"{fps:g}"
+            print(
+                f"{name:>7} {target:>10} {s['fps']:8.1f} {s['latency_ms_p50']:8.2f} "
+                f"{s['latency_ms_p99']:8.2f} {s['latency_ms_max']:8.2f} {s['errors']:7d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
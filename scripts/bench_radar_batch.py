@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Radar frame conversion cost: CFAR columns -> detections.
+
+    python scripts/bench_radar_batch.py --detections 50 500 5000
+
+"objects" is the old per-detection path (np.array per polar conversion,
+Detection + value objects + attributes dict, datetime.now() per row).
+"batch" is RadarAdapter._frame_batch (one columnar frame); "batch+legacy"
+adds RadarBatch.to_detections() for consumers that still need objects.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from aura_v2.domain.entities import Detection  # noqa: E402
+from aura_v2.domain.value_objects import Confidence, Position3D, Velocity3D  # noqa: E402
+from aura_v2.infrastructure.sensors.radar_adapter import RadarAdapter  # noqa: E402
+
+
+def columns(n: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    return {
+        "range": rng.uniform(5, 120, n),
+        "doppler_velocity": rng.uniform(-6, 6, n),
+        "snr": rng.uniform(12, 40, n),
+        "azimuth": rng.uniform(-0.6, 0.6, n),
+        "elevation": rng.uniform(-0.1, 0.1, n),
+        "rcs": rng.uniform(10, 1e4, n),
+    }
+
+
+def objects(adapter: RadarAdapter, dets: list) -> list:
+    out = []
+    for det in dets:
+        position = np.array(adapter._polar_to_cartesian(det["range"], det["azimuth"], det["elevation"]))
+        out.append(
+            Detection(
+                timestamp=datetime.now(timezone.utc),
+                position=Position3D(x=position[0], y=position[1], z=position[2]),
+                velocity=Velocity3D(vx=det["doppler_velocity"], vy=0, vz=0),
+                confidence=Confidence(min(1.0, det["snr"] / 30.0)),
+                sensor_id="radar_main",
+                attributes={"rcs": det["rcs"], "snr": det["snr"], "doppler": det["doppler_velocity"]},
+            )
+        )
+    return out
+
+
+def timed(fn, repeat: int) -> float:
+    t = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t) * 1e6 / repeat
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--detections", type=int, nargs="+", default=[50, 500, 5000])
+    ap.add_argument("--repeat", type=int, default=50)
+    args = ap.parse_args()
+    adapter = RadarAdapter(offload_dsp=False)
+    for n in args.detections:
+        cols = columns(n)
+        keys = list(cols)
+        dets = [dict(zip(keys, row)) for row in zip(*(cols[k].tolist() for k in keys))]
+        repeat = max(1, args.repeat * 50 // max(n, 50))
+        old = timed(lambda dets=dets: objects(adapter, dets), repeat)
+        now = datetime.now(timezone.utc)
+        batch = timed(lambda cols=cols, now=now: adapter._frame_batch(cols, now), repeat)
+        legacy = timed(
+            lambda cols=cols, now=now: adapter._frame_batch(cols, now).to_detections(), repeat
+        )
+        print(
+            f"{n:6d} dets: objects {old:10.1f} us, batch {batch:8.1f} us "
+            f"({old / batch:5.1f}x), batch+legacy {legacy:10.1f} us"
+        )
+    adapter.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Single tracker vs zone-sharded tracker on one large site.
+
+    python scripts/bench_sharded.py --targets 8000 --frames 30 --shards 2x2
+
+N targets spread over --bounds (default 400 m x 300 m), constant random
+velocities, all detected every frame. Each configuration gets the same
+DetectionBatch stream; the first frame (track creation) is not timed.
+Reported: ms per frame, handoffs and the machine's CPU count. Process
+shards only pay off with at least as many free cores as zones; on fewer
+cores the run measures transport overhead.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from aura_v2.domain.entities import DetectionBatch  # noqa: E402
+from aura_v2.infrastructure.tracking.modern_tracker import ModernTracker  # noqa: E402
+from aura_v2.infrastructure.tracking.sharded_tracker import (  # noqa: E402
+    ShardedTracker,
+    ZoneGrid,
+)
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+async def run(tracker: Any, n: int, frames: int, bounds: list) -> float:
+    rng = np.random.default_rng(0)
+    xmin, ymin, xmax, ymax = bounds
+    p0 = np.stack(
+        [rng.uniform(xmin, xmax, n), rng.uniform(ymin, ymax, n), np.zeros(n)], axis=1
+    )
+    v = rng.normal(scale=1.5, size=(n, 3)) * np.array([1.0, 1.0, 0.0])
+    spent = 0.0
+    for k in range(frames + 1):
+        ts = T0 + timedelta(seconds=0.1 * k)
+        batch = DetectionBatch.from_columns(p0 + v * (0.1 * k), np.full(n, 0.9), ts, "cam")
+        t = time.perf_counter()
+        await tracker.update(batch, ts)
+        if k:
+            spent += time.perf_counter() - t
+    await tracker.close()
+    return spent * 1000.0 / frames
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--targets", type=int, default=8000)
+    ap.add_argument("--frames", type=int, default=30)
+    ap.add_argument("--shards", default="2x2")
+    ap.add_argument("--bounds", default="0,0,400,300")
+    ap.add_argument("--margin", type=float, default=10.0)
+    ap.add_argument("--max-distance", type=float, default=2.0)
+    args = ap.parse_args()
+    bounds = [float(b) for b in args.bounds.split(",")]
+    grid = ZoneGrid.parse(args.shards, args.bounds, args.margin)
+    md = args.max_distance
+
+    print(f"cpus: {os.cpu_count()}  targets: {args.targets}  zones: {len(grid)}")
+    configs = (
+        ("single", lambda: ModernTracker(max_distance=md, track_store=True)),
+        ("inline", lambda: ShardedTracker(grid, max_distance=md, mode="inline")),
+        ("process", lambda: ShardedTracker(grid, max_distance=md, mode="process")),
+    )
+    for name, make in configs:
+        tracker = make()
+        ms = asyncio.run(run(tracker, args.targets, args.frames, bounds))
+        extra = f"  handoffs {tracker.handoffs}" if isinstance(tracker, ShardedTracker) else ""
+        print(f"{name:>8}: {ms:8.2f} ms/frame{extra}")
+
+
+if __name__ == "__main__":
+    main()
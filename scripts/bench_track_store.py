@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Track objects vs TrackStore: memory per track and tracker cost per frame.
+
+    python scripts/bench_track_store.py --tracks 10000 --frames 30
+
+Memory: tracemalloc delta for N ``Track`` objects (with their TrackState,
+Position3D, Velocity3D, Confidence and datetimes) vs a TrackStore holding
+the same N tracks plus one cached TrackView each.
+
+Update cost: N targets on straight lines, all detected every frame, fed as
+one DetectionBatch to ModernTracker(batch_kalman=True) (Track objects) and
+ModernTracker(track_store=True). The first frame (track creation) is not
+timed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, List
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from aura_v2.domain.entities import (  # noqa: E402
+    DetectionBatch,
+    Position3D,
+    Track,
+    TrackState,
+    TrackStore,
+    Velocity3D,
+)
+from aura_v2.infrastructure.tracking.modern_tracker import ModernTracker  # noqa: E402
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def measure(build: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    keep = build()
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del keep
+    return used
+
+
+def objects(n: int) -> List[Track]:
+    return [
+        Track(
+            id=f"track_{i:05d}",
+            state=TrackState(Position3D(float(i), 0.0, 0.0), Velocity3D(1.0, 0.0, 0.0)),
+            created_at=T0 + timedelta(microseconds=i),
+            updated_at=T0 + timedelta(microseconds=i),
+        )
+        for i in range(n)
+    ]
+
+
+def store(n: int) -> TrackStore:
+    st = TrackStore(capacity=n)
+    for i in range(n):
+        st.add(
+            f"track_{i:05d}",
+            (float(i), 0.0, 0.0),
+            (1.0, 0.0, 0.0),
+            created_at=T0 + timedelta(microseconds=i),
+            updated_at=T0 + timedelta(microseconds=i),
+        )
+    return st
+
+
+async def run(tracker: ModernTracker, n: int, frames: int) -> float:
+    rng = np.random.default_rng(0)
+    p0 = rng.uniform(0.0, 30.0 * n ** 0.5, size=(n, 3)) * np.array([1.0, 1.0, 0.0])
+    v = rng.normal(scale=2.0, size=(n, 3))
+    spent = 0.0
+    for k in range(frames + 1):
+        ts = T0 + timedelta(seconds=0.1 * k)
+        batch = DetectionBatch.from_columns(p0 + v * (0.1 * k), np.full(n, 0.9), ts, "cam")
+        t = time.perf_counter()
+        await tracker.update(batch, ts)
+        if k:
+            spent += time.perf_counter() - t
+    await tracker.close()
+    return spent * 1000.0 / frames
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--tracks", type=int, default=10_000)
+    ap.add_argument("--frames", type=int, default=30)
+    args = ap.parse_args()
+    n = args.tracks
+
+    obj_b = measure(lambda: objects(n))
+    st_b = measure(lambda: store(n))
+    print(f"memory per track: objects {obj_b / n:7.1f} B   store+views {st_b / n:7.1f} B")
+
+    for name, kw in (("objects", {"batch_kalman": True}), ("store", {"track_store": True})):
+        ms = asyncio.run(run(ModernTracker(max_distance=5.0, **kw), n, args.frames))
+        print(f"update per frame ({n} tracks): {name:>7} {ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Streaming ingestion benchmark: POST /track vs WS /ws/track.
+
+    python scripts/bench_ws.py --frames 500 --dets 50
+
+Each mode runs against a fresh app served by uvicorn on a free local port.
+REST and "ws lockstep" wait for each reply before sending the next frame;
+"ws window" keeps up to --window frames in flight (keep it <= AURA_WS_QUEUE
+so nothing is dropped). Reported: frames/s, per-frame round trip and bytes
+on the wire per frame (request + reply).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+import numpy as np
+import websockets
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import uvicorn  # noqa: E402
+
+from aura_v2.api.frames import msgpack, pack_f32_frame  # noqa: E402
+from aura_v2.main import AURAApplication  # noqa: E402
+
+
+def make_frames(n: int, dets: int, seed: int = 0) -> List[Tuple[datetime, np.ndarray]]:
+    rng = np.random.default_rng(seed)
+    p0 = rng.uniform(0.0, 500.0, size=(dets, 2))
+    v = rng.normal(scale=2.0, size=(dets, 2))
+    t0 = datetime.now(timezone.utc)
+    out = []
+    for k in range(n):
+        xy = p0 + v * (0.033 * k)
+        rows = np.column_stack([xy, np.zeros(dets), np.full(dets, 0.9)])
+        out.append((t0 + timedelta(seconds=0.033 * k), rows))
+    return out
+
+
+def as_request(ts: datetime, rows: np.ndarray) -> Dict[str, Any]:
+    iso = ts.isoformat()
+    return {
+        "camera_detections": [
+            {"sensor_id": "camera_1", "timestamp": iso,
+             "position": {"x": float(x), "y": float(y), "z": float(z)}, "confidence": float(c)}
+            for x, y, z, c in rows
+        ],
+        "timestamp": iso,
+    }
+
+
+class Server:
+    def __enter__(self) -> "Server":
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            self.port = s.getsockname()[1]
+        self.server = uvicorn.Server(
+            uvicorn.Config(AURAApplication().get_app(), host="127.0.0.1",
+                           port=self.port, log_level="error")
+        )
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.server.should_exit = True
+        self.thread.join()
+
+
+async def run_rest(port: int, frames) -> Tuple[float, List[float], int]:
+    lat, wire = [], 0
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        t0 = time.perf_counter()
+        for ts, rows in frames:
+            body = json.dumps(as_request(ts, rows)).encode()
+            t = time.perf_counter()
+            r = await client.post(f"http://127.0.0.1:{port}/track", content=body,
+                                  headers={"content-type": "application/json"})
+            lat.append((time.perf_counter() - t) * 1000.0)
+            wire += len(body) + len(r.content)
+        elapsed = time.perf_counter() - t0
+    return len(frames) / elapsed, lat, wire // len(frames)
+
+
+def encoder(encoding: str) -> Callable[[datetime, np.ndarray], Any]:
+    if encoding == "f32":
+        return lambda ts, rows: pack_f32_frame(rows, ts)
+    if encoding == "msgpack":
+        return lambda ts, rows: msgpack.packb(as_request(ts, rows))
+    return lambda ts, rows: json.dumps(as_request(ts, rows))
+
+
+async def run_ws(port: int, frames, encoding: str, window: int) -> Tuple[float, List[float], int]:
+    enc = encoder(encoding)
+    url = f"ws://127.0.0.1:{port}/ws/track?encoding={encoding}&sensor_id=camera_1"
+    lat, wire, sent_at = [], 0, []
+    async with websockets.connect(url, max_size=None) as ws:
+        t0 = time.perf_counter()
+        done = 0
+        for ts, rows in frames:
+            msg = enc(ts, rows)
+            sent_at.append(time.perf_counter())
+            await ws.send(msg)
+            wire += len(msg)
+            while len(sent_at) - done >= window:
+                reply = await ws.recv()
+                lat.append((time.perf_counter() - sent_at[done]) * 1000.0)
+                wire += len(reply)
+                done += 1
+        while done < len(sent_at):
+            reply = await ws.recv()
+            lat.append((time.perf_counter() - sent_at[done]) * 1000.0)
+            wire += len(reply)
+            done += 1
+        elapsed = time.perf_counter() - t0
+    return len(frames) / elapsed, lat, wire // len(frames)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--frames", type=int, default=500)
+    ap.add_argument("--dets", type=int, default=50)
+    ap.add_argument("--window", type=int, default=4)
+    args = ap.parse_args()
+
+    frames = make_frames(args.frames, args.dets)
+    encodings = ["json", "f32"] + (["msgpack"] if msgpack is not None else [])
+    modes: List[Tuple[str, Callable[[int], Any]]] = [("rest", lambda p: run_rest(p, frames))]
+    for e in encodings:
+        modes.append((f"ws {e} lockstep", lambda p, e=e: run_ws(p, frames, e, 1)))
+        modes.append((f"ws {e} window", lambda p, e=e: run_ws(p, frames, e, args.window)))
+
+    print(f"{'mode':>20} {'frames/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'bytes/frame':>12}")
+    for name, fn in modes:
+        with Server() as srv:
+            fps, lat, wire = asyncio.run(fn(srv.port))
+        p50, p99 = np.percentile(lat, [50, 99])
+        print(f"{name:>20} {fps:9.1f} {p50:8.2f} {p99:8.2f} {wire:12d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from aura_v2.infrastructure.persistence.schemas import MetricPoint
+from aura_v2.infrastructure.persistence.writer import BufferedMongoWriter
+
+pytestmark = pytest.mark.asyncio
+
+TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class _Collection:
+    def __init__(self, db: "_DB", name: str) -> None:
+        self.db, self.name = db, name
+
+    async def insert_many(self, docs, ordered=True):
+        assert ordered is False
+        self.db.batches.append((self.name, list(docs)))
+        if self.db.gate is not None:
+            await self.db.gate.wait()
+        if self.db.fail_dupes:
+            raise BulkWriteError({"nInserted": len(docs) - 1, "writeErrors": [{}]})
+
+
+class _DB:
+    def __init__(self) -> None:
+        self.batches = []
+        self.gate: asyncio.Event | None = None
+        self.fail_dupes = False
+
+    def __getitem__(self, name: str) -> _Collection:
+        return _Collection(self, name)
+
+
+def _metric(i: int) -> MetricPoint:
+    return MetricPoint(ts=TS, name="fps", value=float(i), labels={})
+
+
+async def test_size_threshold_flushes_full_batches() -> None:
+    db = _DB()
+    w = BufferedMongoWriter(db=db, max_batch=4, max_age_s=60.0)
+    await w.start()
+    for i in range(10):
+        await w.write_metric(_metric(i))
+    await asyncio.sleep(0.01)  # let the flusher run
+    assert [len(b) for _, b in db.batches] == [4, 4]
+
+    await w.close()
+    assert [len(b) for _, b in db.batches] == [4, 4, 2]
+    assert [d["value"] for _, b in db.batches for d in b] == [float(i) for i in range(10)]
+    assert w.stats()["metrics"]["written"] == 10
+
+
+async def test_age_threshold_flushes_partial_batch() -> None:
+    db = _DB()
+    w = BufferedMongoWriter(db=db, max_batch=100, max_age_s=0.02)
+    await w.start()
+    await w.write("audit", {"a": 1})
+    assert db.batches == []
+    await asyncio.sleep(0.1)
+    assert db.batches == [("audit", [{"a": 1}])]
+    await w.close()
+
+
+async def test_bounded_queue_applies_backpressure() -> None:
+    db = _DB()
+    db.gate = asyncio.Event()
+    w = BufferedMongoWriter(db=db, max_batch=2, max_age_s=60.0, max_queue=2)
+    await w.start()
+    for i in range(2):
+        await w.write("detections", {"i": i})
+    await asyncio.sleep(0.01)  # first batch taken, insert blocked on the gate
+    for i in range(2, 4):
+        await w.write("detections", {"i": i})
+
+    blocked = asyncio.create_task(w.write("detections", {"i": 4}))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()  # queue full, writer waits
+
+    db.gate.set()
+    await asyncio.wait_for(blocked, 1.0)
+    await w.close()
+    assert sorted(d["i"] for _, b in db.batches for d in b) == list(range(5))
+    with pytest.raises(RuntimeError):
+        await w.write("detections", {"i": 5})
+
+
+async def test_partial_bulk_failure_is_counted() -> None:
+    db = _DB()
+    db.fail_dupes = True
+    w = BufferedMongoWriter(db=db, max_batch=10)
+    for i in range(3):
+        await w.write("tracks", {"_id": i})
+    await w.flush()
+    s = w.stats()["tracks"]
+    assert (s["written"], s["failed"], s["queued"]) == (2, 1, 0)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from pymongo import DeleteOne, ReplaceOne
+
+from aura_v2.domain.entities import Confidence, Track, TrackState, TrackStatus
+from aura_v2.domain.value_objects import Position3D, Velocity3D
+from aura_v2.infrastructure.persistence.mongo import MongoTrackRepository, _encode_track
+
+pytestmark = pytest.mark.asyncio
+
+
+def _track(i: int, **kw) -> Track:
+    return Track(
+        id=f"bulk-{i}",
+        state=TrackState(
+            position=Position3D(x=float(i), y=np.float64(2.5), z=-1.0),
+            velocity=Velocity3D(vx=0.1, vy=np.float32(0.2), vz=0.0),
+        ),
+        status=TrackStatus.ACTIVE,
+        confidence=Confidence(0.75),
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        **kw,
+    )
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.calls = []
+
+    async def bulk_write(self, ops, ordered=True):
+        self.calls.append((ops, ordered))
+
+        class _Res:
+            deleted_count = sum(isinstance(op, DeleteOne) for op in ops)
+
+        return _Res()
+
+
+def _repo(col) -> MongoTrackRepository:
+    repo = MongoTrackRepository.__new__(MongoTrackRepository)
+    repo._collection = col  # type: ignore[attr-defined]
+    return repo
+
+
+async def test_track_encoder_uses_flat_codec_with_reflective_fallback() -> None:
+    t = _track(2, hits=7, missed=1)
+    doc = _encode_track(t)
+    assert doc["_id"] == "bulk-2" and doc["x"] == 2.0 and doc["vy"] == float(np.float32(0.2))
+    assert MongoTrackRepository._to_track(doc) == t
+    # not a plain domain Track -> reflective fallback
+    assert _encode_track({"id": "d1", "x": 1})["_id"] == "d1"
+
+
+async def test_save_many_and_delete_many_use_one_unordered_bulk_write() -> None:
+    col = _Recorder()
+    repo = _repo(col)
+
+    ids = await repo.save_many(_track(i) for i in range(3))
+    assert ids == ["bulk-0", "bulk-1", "bulk-2"]
+    ops, ordered = col.calls[-1]
+    assert ordered is False
+    assert all(isinstance(op, ReplaceOne) for op in ops) and len(ops) == 3
+
+    assert await repo.delete_many(["bulk-0", "bulk-1"]) == 2
+    ops, ordered = col.calls[-1]
+    assert ordered is False and len(ops) == 2
+
+    # nothing to send -> no round-trip
+    assert await repo.save_many([]) == [] and await repo.delete_many([]) == 0
+    assert len(col.calls) == 2
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from enum import Enum
+
+import bson
+import numpy as np
+
+from aura_v2.domain.entities import (
+    Confidence,
+    Detection,
+    ThreatLevel,
+    Track,
+    TrackState,
+    TrackStatus,
+)
+from aura_v2.domain.value_objects import CovarianceMatrix, Position3D, Velocity3D
+from aura_v2.infrastructure.persistence.codec import (
+    _jsonify,
+    decode_detection,
+    decode_track,
+    encode,
+    encode_detection,
+    encode_track,
+)
+
+# BSON dates are millisecond precision
+TS = datetime(2025, 3, 4, 5, 6, 7, 123000, tzinfo=timezone.utc)
+
+
+def _track() -> Track:
+    return Track(
+        id="t-1",
+        state=TrackState(
+            position=Position3D(x=np.float64(1.5), y=-2.0, z=0.25),
+            velocity=Velocity3D(vx=0.5, vy=np.float32(0.125), vz=0.0),
+        ),
+        status=TrackStatus.ACTIVE,
+        confidence=Confidence(0.8),
+        threat_level=ThreatLevel.HIGH,
+        created_at=TS,
+        updated_at=TS,
+        hits=4,
+        missed=1,
+    )
+
+
+def _detection() -> Detection:
+    return Detection(
+        sensor_id="radar-1",
+        timestamp=TS,
+        position=Position3D(x=3.0, y=4.0, z=5.0),
+        confidence=Confidence(0.9),
+        velocity=Velocity3D(vx=1.0, vy=0.0, vz=-1.0),
+        covariance=CovarianceMatrix(matrix=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 2.0]]),
+        attributes={"snr": 12.5, "cls": "vehicle"},
+    )
+
+
+def test_track_roundtrip_through_bson() -> None:
+    t = _track()
+    doc = encode_track(t)
+    assert "state" not in doc and doc["status"] == "active" and doc["threat_level"] == 2
+    assert all(type(doc[k]) is float for k in ("x", "y", "z", "vx", "vy", "vz"))
+
+    assert decode_track(doc) == t
+    assert decode_track(bson.decode(bson.encode(doc))) == t
+
+
+def test_track_without_velocity() -> None:
+    t = _track()
+    t.state = TrackState(position=Position3D(0.0, 0.0, 0.0), velocity=None)  # type: ignore[arg-type]
+    doc = encode_track(t)
+    assert "vx" not in doc
+    assert decode_track(doc).state.velocity is None
+
+
+def test_detection_roundtrip_through_bson() -> None:
+    d = _detection()
+    back = decode_detection(bson.decode(bson.encode(encode_detection(d))))
+    assert back == d
+
+    bare = Detection(
+        sensor_id="cam", timestamp=TS, position=Position3D(1.0, 2.0, 3.0),
+        confidence=Confidence(0.5),
+    )
+    doc = encode_detection(bare)
+    assert "vx" not in doc and "covariance" not in doc
+    assert decode_detection(doc) == bare
+
+
+def test_encode_dispatch_and_reflective_fallback() -> None:
+    t = _track()
+    assert encode(t) == encode_track(t)
+    assert encode(t.state) == {"x": 1.5, "y": -2.0, "z": 0.25, "vx": 0.5, "vy": 0.125, "vz": 0.0}
+    assert encode(t.state.position) == {"x": 1.5, "y": -2.0, "z": 0.25}
+
+    class Color(Enum):
+        RED = "red"
+
+    other = {"color": Color.RED, "v": np.int64(3), "xs": (1, 2)}
+    assert encode(other) == _jsonify(other) == {"color": "red", "v": 3, "xs": [1, 2]}
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from aura_v2.domain.entities import (
+    Confidence,
+    CovarianceMatrix,
+    Detection,
+    DetectionBatch,
+    Position3D,
+    Track,
+    TrackState,
+    Velocity3D,
+)
+from aura_v2.domain.services.association import GNN_AssociationStrategy
+from aura_v2.domain.services.hungarian_assoc import HungarianAssociationStrategy
+from aura_v2.infrastructure.tracking.modern_tracker import ModernTracker
+
+TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _det(x, y=0.0, sensor="cam", ts=TS, **kw):
+    return Detection(
+        sensor_id=sensor, timestamp=ts, position=Position3D(x, y, 0.0), confidence=Confidence(0.9), **kw
+    )
+
+
+def test_round_trip_keeps_every_field():
+    dets = [
+        _det(1.0, sensor="cam", attributes={"cls": "car"}),
+        _det(2.0, sensor="radar", ts=TS + timedelta(microseconds=7), velocity=Velocity3D(1.0, 2.0, 3.0)),
+        _det(3.0, sensor="cam", covariance=CovarianceMatrix(matrix=[[1, 0, 0], [0, 1, 0], [0, 0, 1]])),
+    ]
+    b = DetectionBatch.from_detections(dets)
+    assert b.sensor_ids == ("cam", "radar") and b.sensor_codes.tolist() == [0, 1, 0]
+    assert b.timestamps_ns.dtype == np.int64 and b.timestamps_ns[1] - b.timestamps_ns[0] == 7000
+    assert b.to_detections() == dets
+    assert b[1].timestamp.tzinfo.key == "UTC"
+
+
+def test_slices_are_views_and_columns_are_validated():
+    b = DetectionBatch.from_columns(np.arange(12.0).reshape(4, 3), [0.5] * 4, TS, "cam")
+    head = b[:2]
+    assert np.shares_memory(head.positions, b.positions) and len(head) == 2
+    assert b.x.tolist() == [0.0, 3.0, 6.0, 9.0] and np.shares_memory(b.xy, b.positions)
+    assert b.take(np.array([False, True, False, True])).positions[:, 0].tolist() == [3.0, 9.0]
+    with pytest.raises(ValueError):
+        DetectionBatch.from_columns([[0.0, 0.0, 0.0]], [1.5], TS, "cam")
+
+    both = DetectionBatch.concat([b[:1], DetectionBatch.from_detections([_det(5.0, sensor="radar")])])
+    assert [d.sensor_id for d in both.to_detections()] == ["cam", "radar"]
+
+
+def test_strategies_accept_batches():
+    tracks = [
+        Track(id=f"t{i}", state=TrackState(position=Position3D(x, 0.0, 0.0), velocity=Velocity3D()))
+        for i, x in enumerate([0.0, 10.0, 20.0])
+    ]
+    dets = [_det(10.5), _det(50.0), _det(0.2)]
+    batch = DetectionBatch.from_detections(dets)
+
+    gnn = GNN_AssociationStrategy(max_distance=2.0)
+    ti, dj, score = gnn.associate_batch(tracks, batch)
+    expected = gnn.associate(tracks, dets)
+    assert sorted(zip(ti.tolist(), dj.tolist())) == sorted(
+        (tracks.index(t), dets.index(d)) for t, d, _ in expected
+    )
+    assert sorted(score.tolist()) == sorted(s for _, _, s in expected)
+
+    matched, unmatched, lost = HungarianAssociationStrategy(max_distance=2.0).associate(tracks, batch)
+    assert {(t.id, d.position.x) for t, d in matched} == {("t0", 0.2), ("t1", 10.5)}
+    assert isinstance(unmatched, DetectionBatch) and unmatched.x.tolist() == [50.0]
+    assert [t.id for t in lost] == ["t2"]
+
+
+@pytest.mark.parametrize("batch_kalman", [False, True])
+async def test_tracker_gives_same_tracks_for_list_and_batch(batch_kalman):
+    a, b = ModernTracker(batch_kalman=batch_kalman), ModernTracker(batch_kalman=batch_kalman)
+    rng = np.random.default_rng(3)
+    p0 = rng.uniform(0.0, 300.0, size=(40, 3))
+    for k in range(5):
+        ts = TS + timedelta(seconds=0.1 * k)
+        dets = [_det(x + k, y, ts=ts) for x, y, _ in p0.tolist()]
+        ra = await a.update(dets, ts)
+        rb = await b.update(DetectionBatch.from_detections(dets), ts)
+        assert [t.id for t in ra.new_tracks] == [t.id for t in rb.new_tracks]
+        assert [(t.id, t.state.position, t.hits) for t in ra.active_tracks] == [
+            (t.id, t.state.position, t.hits) for t in rb.active_tracks
+        ]
+
+
+async def test_sources_yield_batches():
+    from aura_v2.sources.demo import DemoSource
+
+    gen = DemoSource(fps=100.0).batches()
+    ts, batch = await gen.__anext__()
+    await gen.aclose()
+    assert ts.tzinfo.key == "UTC" and batch.sensor_ids == ("camera_1",)
+    assert batch.positions.shape == (1, 3) and batch.timestamps_ns.tolist() == [0]
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+
+import numpy as np
+
+from aura_v2.domain.entities import (
+    Confidence,
+    Detection,
+    Position3D,
+    Track,
+    TrackState,
+    Velocity3D,
+)
+from aura_v2.domain.services.association import GNN_AssociationStrategy
+
+TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _track(tid, x, y=0.0):
+    return Track(
+        id=tid,
+        state=TrackState(position=Position3D(x, y, 0.0), velocity=Velocity3D()),
+    )
+
+
+def _det(x, y=0.0):
+    return Detection(
+        sensor_id="cam", timestamp=TS, position=Position3D(x, y, 0.0), confidence=Confidence(0.9)
+    )
+
+
+def _pairs(matched):
+    return {(t.id, d.position.x) for t, d, _ in matched}
+
+
+def test_global_optimum_beats_greedy_order():
+    # Greedy in detection order would give d(1.9)->t2 and leave t1's best det at 4.0.
+    tracks = [_track("t1", 0.0), _track("t2", 2.0)]
+    dets = [_det(1.9), _det(4.0)]
+    s = GNN_AssociationStrategy(max_distance=3.0)
+    assert _pairs(s.associate(tracks, dets)) == {("t1", 1.9), ("t2", 4.0)}
+    assert _pairs(s.associate(tracks, dets[::-1])) == {("t1", 1.9), ("t2", 4.0)}
+
+
+def test_gate_is_inclusive_and_scores_follow_distance():
+    s = GNN_AssociationStrategy(max_distance=2.0)
+    matched = s.associate([_track("t1", 0.0)], [_det(2.0)])
+    assert len(matched) == 1 and matched[0][2] == 1.0 / 3.0
+    assert s.associate([_track("t1", 0.0)], [_det(2.01)]) == []
+
+
+def test_assign_on_arrays_skips_ungated_rows():
+    rng = np.random.default_rng(1)
+    trk = rng.uniform(0, 1000, size=(200, 3))
+    det = trk + rng.normal(scale=0.2, size=trk.shape)
+    det[:20] += 500.0  # far away: must stay unmatched
+    rows, cols, dist = GNN_AssociationStrategy(max_distance=2.0).assign(trk, det)
+    assert np.all(dist <= 2.0)
+    assert not np.isin(np.arange(20), cols).any()
+    assert len(rows) >= 170 and len(set(rows.tolist())) == len(rows)
+
+
+def test_last_stats_describe_the_latest_frame():
+    s = GNN_AssociationStrategy(max_distance=3.0)
+    s.associate([_track("t1", 0.0), _track("t2", 2.0), _track("t3", 50.0)], [_det(1.9), _det(4.0)])
+    st = s.last_stats
+    assert st.edges == 3 and st.components == 1 and st.largest == (2, 2)
+    s.associate([], [_det(1.9)])
+    assert s.last_stats.components == 0
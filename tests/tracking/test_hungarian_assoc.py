@@ -47,3 +47,44 @@ def test_perf_50x50():
     matched, _, _ = s.associate(tracks, dets)
     dt = time.perf_counter() - t0
     assert len(matched) == 50 and dt < 0.05
+
+
+def _cluster_scene(n_clusters, per_cluster, seed=0):
+    rng = random.Random(seed)
+    tracks, dets = [], []
+    for c in range(n_clusters):
+        cx = c * 100.0  # clusters far apart -> independent components
+        for k in range(per_cluster):
+            x = cx + k * 1.0
+            tracks.append(_T(f"t{c}_{k}", (x, 0.0, 0.0)))
+            dets.append(_D(f"d{c}_{k}", (x + rng.uniform(-0.3, 0.3), 0.0, 0.0)))
+    return tracks, dets
+
+
+def test_component_stats_and_closed_form_clusters():
+    tracks, dets = _cluster_scene(n_clusters=5, per_cluster=1)
+    tracks.append(_T("lone", (1000.0, 0.0, 0.0)))
+    dets += [_D("near", (1000.5, 0.0, 0.0)), _D("far", (1001.5, 0.0, 0.0))]
+    s = HungarianAssociationStrategy(max_distance=2.0)
+    matched, u_d, u_t = s.associate(tracks, dets)
+
+    assert ("lone", "near") in _pairs(matched)
+    assert [d.id for d in u_d] == ["far"] and not u_t
+    st = s.last_stats
+    assert st.components == 6 and st.closed_form == 6 and st.solved == 0
+    assert st.largest == (1, 2)
+    assert st.histogram == {"1": 5, "2": 1}
+
+
+def test_thread_pool_gives_same_matches():
+    tracks, dets = _cluster_scene(n_clusters=8, per_cluster=30)
+    serial = HungarianAssociationStrategy(max_distance=2.5)
+    pooled = HungarianAssociationStrategy(max_distance=2.5, workers=4, parallel_min_size=16)
+    try:
+        a = _pairs(serial.associate(tracks, dets)[0])
+        b = _pairs(pooled.associate(tracks, dets)[0])
+    finally:
+        pooled.close()
+    assert a == b and len(a) == 240
+    assert pooled.last_stats.pooled == pooled.last_stats.solved > 0
+    assert serial.last_stats.pooled == 0
@@ -28,3 +28,40 @@ def test_combined_cost_weights_work():
     c1 = combined_cost(a, b, 1.0, w)
     c2 = combined_cost(a, b, 0.1, w)
     assert c2 > c1  # lower confidence increases cost
+
+
+def test_vectorized_cost_matrix_matches_loop():
+    import numpy as np
+    from aura_v2.domain.association.hungarian_solver import (
+        build_cost_matrix,
+        build_cost_matrix_np,
+        build_cost_matrix_py,
+    )
+
+    rng = np.random.default_rng(5)
+    trks = [
+        {"bbox": rng.uniform([0, 0, 0, 0], [300, 300, 40, 40]).tolist()} for _ in range(70)
+    ]
+    trks.append({"bbox": [10.0, 10.0, 0.0, 0.0]})  # degenerate box: union may be 0
+    dets = [
+        {"bbox": (np.asarray(t["bbox"]) + rng.normal(scale=3.0, size=4)).tolist(),
+         "score": float(rng.uniform(-0.2, 1.2))}
+        for t in trks[:50]
+    ]
+    dets.append({"bbox": [10.0, 10.0, 0.0, 0.0]})  # no score -> 1.0
+    w = {"iou": 0.6, "motion": 0.3, "confidence": 0.1}
+
+    def close(a, b):
+        np.testing.assert_allclose(a, b, rtol=1e-12, atol=1e-12)
+
+    ref = build_cost_matrix_py(dets, trks, w, max_cost=50.0)
+    close(build_cost_matrix(dets, trks, w, max_cost=50.0), ref)
+
+    boxes_d = np.array([d["bbox"] for d in dets])
+    boxes_t = np.array([t["bbox"] for t in trks])
+    scores = np.array([d.get("score", 1.0) for d in dets])
+    close(build_cost_matrix_np(boxes_d, boxes_t, scores, w, 50.0), ref)
+    close(
+        build_cost_matrix_np(boxes_d, boxes_t, scores, {}, 1.5),
+        build_cost_matrix_py(dets, trks, {}, 1.5),
+    )
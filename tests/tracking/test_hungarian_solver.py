@@ -17,3 +17,32 @@ def test_assignment_simple():
     matches, umd, umt = solve_assignment(C, max_cost=5.0)
     assert len(matches) == 2
     assert umd == [] and umt == []
+
+
+def test_unmatched_bookkeeping_and_array_output():
+    C = np.array(
+        [
+            [0.1, 9.0, 9.0],
+            [9.0, 9.0, 9.0],  # only over-budget options -> unmatched
+            [9.0, 0.2, 9.0],
+            [9.0, 9.0, 0.3],
+            [0.05, 9.0, 9.0],  # more rows than cols
+        ]
+    )
+    matches, umd, umt = solve_assignment(C, max_cost=5.0)
+    assert matches == [(2, 1), (3, 2), (4, 0)]
+    assert umd == [0, 1] and umt == []
+
+    m_arr, umd_arr, umt_arr = solve_assignment(C, max_cost=5.0, as_arrays=True)
+    assert isinstance(m_arr, np.ndarray) and m_arr.shape == (3, 2)
+    assert m_arr.tolist() == [[2, 1], [3, 2], [4, 0]]
+    assert umd_arr.tolist() == [0, 1] and umt_arr.size == 0
+
+
+def test_large_frame_bookkeeping():
+    n = 5000
+    C = np.full((n, n), 10.0)
+    C[np.arange(n), np.arange(n)] = 1.0
+    C[::2, ::2] = 10.0  # half the rows end up over budget
+    matches, umd, _umt = solve_assignment(C, max_cost=5.0, as_arrays=True)
+    assert len(matches) == n // 2 and umd.tolist() == list(range(0, n, 2))
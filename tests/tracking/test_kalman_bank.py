@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from filterpy.kalman import KalmanFilter
+
+from aura_v2.domain.entities import Confidence, Detection, Position3D
+from aura_v2.infrastructure.tracking.kalman_bank import KalmanBank
+from aura_v2.infrastructure.tracking.modern_tracker import ModernTracker
+
+
+def _filterpy_kf(pos):
+    kf = KalmanFilter(dim_x=6, dim_z=3)
+    kf.F = np.eye(6)
+    kf.H = np.hstack([np.eye(3), np.zeros((3, 3))])
+    kf.P = np.eye(6) * 10.0
+    kf.R = np.eye(3) * 0.5
+    kf.Q = np.eye(6) * 0.01
+    kf.x = np.array([[*pos, 0.0, 0.0, 0.0]]).T
+    return kf
+
+
+def test_bank_matches_filterpy_with_per_track_dt():
+    rng = np.random.default_rng(0)
+    n = 20
+    starts = rng.uniform(-50, 50, size=(n, 3))
+    bank = KalmanBank(capacity=4)  # forces growth
+    ref = []
+    for i, p in enumerate(starts):
+        bank.add(f"t{i}", p)
+        ref.append(_filterpy_kf(p))
+
+    for _ in range(5):
+        dt = rng.uniform(0.05, 0.5, size=n)
+        dt[::7] = 0.0  # not propagated, like predict_track
+        bank.predict(dt)
+        z = starts + rng.normal(scale=0.3, size=(n, 3))
+        upd = np.flatnonzero(rng.random(n) > 0.3)
+        bank.update(upd, z[upd])
+
+        for i, kf in enumerate(ref):
+            if dt[i] > 0:
+                kf.F[0, 3] = kf.F[1, 4] = kf.F[2, 5] = dt[i]
+                kf.predict()
+            if i in upd:
+                kf.update(z[i].reshape(3, 1))
+
+    for i, kf in enumerate(ref):
+        np.testing.assert_allclose(bank.x[i], kf.x[:, 0], rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(bank.P[i], kf.P, rtol=1e-9, atol=1e-9)
+
+
+def test_remove_keeps_rows_dense():
+    bank = KalmanBank()
+    for i in range(3):
+        bank.add(f"t{i}", (float(i), 0.0, 0.0))
+    assert bank.remove("t0")
+    assert not bank.remove("t0")
+    assert len(bank) == 2 and "t0" not in bank
+    assert bank.x[bank.slots(["t2"])[0], 0] == 2.0
+    with pytest.raises(ValueError):
+        bank.predict(np.ones(3))
+
+
+async def test_tracker_batch_kalman_matches_per_track_filters():
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    plain = ModernTracker()
+    batched = ModernTracker(batch_kalman=True)
+    for k in range(6):
+        ts = t0 + timedelta(seconds=0.1 * k)
+        dets = [
+            Detection(
+                sensor_id="cam",
+                timestamp=ts,
+                position=Position3D(x=10.0 * i + 0.5 * k, y=2.0 * i, z=0.0),
+                confidence=Confidence(0.9),
+            )
+            for i in range(4)
+        ]
+        a = await plain.update(dets, ts)
+        b = await batched.update(dets, ts)
+
+    assert len(batched.kalman_bank) == 4
+    got = {t.id: t for t in b.active_tracks}
+    for t in a.active_tracks:
+        assert t.id in got
+        np.testing.assert_allclose(
+            [got[t.id].state.velocity.vx, got[t.id].state.velocity.vy],
+            [t.state.velocity.vx, t.state.velocity.vy],
+            rtol=1e-9,
+            atol=1e-9,
+        )
+        np.testing.assert_allclose(
+            batched.kalman_bank.x[batched.kalman_bank.slots([t.id])[0]],
+            plain.kalman_filters[t.id].x[:, 0],
+            rtol=1e-9,
+            atol=1e-9,
+        )
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from aura_v2.domain.entities import DetectionBatch, TrackStatus
+from aura_v2.infrastructure.persistence.in_memory import InMemoryTrackRepository
+from aura_v2.infrastructure.tracking.modern_tracker import ModernTracker
+from aura_v2.infrastructure.tracking.sharded_tracker import ShardedTracker, ZoneGrid
+
+TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _frames(n=40, frames=16, seed=2):
+    # Targets on a 20 m lattice (well apart for a 5 m gate), all moving +x at
+    # 20 m/s so the ones near x=100 cross the zone border mid-run.
+    rng = np.random.default_rng(seed)
+    cells = rng.choice(100, size=n, replace=False)
+    p0 = np.stack([cells % 10 * 20.0 + 5.0, cells // 10 * 20.0 + 5.0, np.zeros(n)], axis=1)
+    for k in range(frames):
+        ts = TS + timedelta(seconds=0.1 * k)
+        keep = slice(None) if k < 12 else slice(0, n // 2)  # half disappear late
+        xyz = p0[keep] + np.array([2.0 * k, 0.0, 0.0])
+        yield ts, DetectionBatch.from_columns(xyz, np.full(len(xyz), 0.9), ts, "cam")
+
+
+def _key(tracks):
+    return sorted(
+        (round(t.state.position.x, 6), round(t.state.position.y, 6), t.hits, t.missed, t.status.value)
+        for t in tracks
+    )
+
+
+def test_grid_zones_and_margins():
+    g = ZoneGrid.parse("2x2", "0,0,400,300", margin=10.0)
+    xy = np.array([[10.0, 10.0], [390.0, 10.0], [10.0, 290.0], [-50.0, 900.0], [200.0, 150.0]])
+    assert g.zone_of(xy).tolist() == [0, 1, 2, 2, 3]
+    # 205 is past the border at 200 but inside zone 0's margin; 215 is not
+    assert g.contains(np.array([0, 0, 0]), np.array([[205.0, 5.0], [215.0, 5.0], [-1e6, -1e6]])).tolist() == [
+        True,
+        False,
+        True,
+    ]
+    with pytest.raises(ValueError):
+        ZoneGrid.parse("2by2")
+
+
+async def test_inline_shards_match_single_tracker_and_keep_ids_across_borders():
+    ref = ModernTracker(track_store=True, max_distance=5.0, max_missed=1)
+    repo = InMemoryTrackRepository()
+    sharded = ShardedTracker(
+        ZoneGrid((0, 0, 200, 200), 2, 2, margin=3.0),
+        repo,
+        max_distance=5.0,
+        max_missed=1,
+        mode="inline",
+        write_behind=False,
+    )
+    first_ids = None
+    deleted = 0
+    for ts, batch in _frames():
+        ra, rb = await ref.update(batch, ts), await sharded.update(batch, ts)
+        assert _key(ra.active_tracks) == _key(rb.active_tracks)
+        assert len(ra.new_tracks) == len(rb.new_tracks)
+        assert _key(ra.deleted_tracks) == _key(rb.deleted_tracks)
+        assert all(t.status is TrackStatus.DELETED for t in rb.deleted_tracks)
+        deleted += len(rb.deleted_tracks)
+        if first_ids is None:
+            first_ids = {t.id for t in rb.active_tracks}
+        else:
+            assert {t.id for t in rb.active_tracks} <= first_ids
+    assert sharded.handoffs > 0 and deleted > 0
+    assert {t.id for t in await repo.list()} == {t.id for t in sharded.active_tracks()}
+    await ref.close()
+    await sharded.close()
+
+
+async def test_process_shards_match_inline():
+    grid = ZoneGrid((0, 0, 200, 200), 2, 1, margin=3.0)
+    a = ShardedTracker(grid, max_distance=5.0, mode="inline")
+    b = ShardedTracker(grid, max_distance=5.0, mode="process")
+    try:
+        for ts, batch in _frames(n=12, frames=6):
+            ra, rb = await a.update(batch, ts), await b.update(batch, ts)
+            assert [t.id for t in ra.active_tracks] == [t.id for t in rb.active_tracks]
+            assert _key(ra.active_tracks) == _key(rb.active_tracks)
+        assert a.handoffs == b.handoffs
+    finally:
+        await a.close()
+        await b.close()
+
+
+async def test_restart_does_not_reuse_persisted_ids():
+    grid = ZoneGrid((0, 0, 200, 200), 2, 1, margin=3.0)
+    repo = InMemoryTrackRepository()
+    first = ShardedTracker(grid, repo, max_distance=5.0, mode="inline", write_behind=False)
+    for ts, batch in _frames(n=12, frames=10):
+        last = await first.update(batch, ts)
+    await first.close()
+    assert first.handoffs > 0  # some tracks are stored outside the zone that made them
+    persisted = {t.id for t in await repo.list()}
+
+    second = ShardedTracker(grid, repo, max_distance=5.0, mode="inline", write_behind=False)
+    ts = TS + timedelta(seconds=1.0)
+    xyz = np.array([[t.state.position.x, t.state.position.y, 0.0] for t in last.active_tracks])
+    xyz = np.vstack([xyz, [[50.0, 210.0, 0.0], [150.0, 210.0, 0.0]]])  # one new per zone
+    batch = DetectionBatch.from_columns(xyz, np.full(len(xyz), 0.9), ts, "cam")
+    res = await second.update(batch, ts)
+    new = {t.id for t in res.new_tracks}
+    assert len(new) == 2 and not new & persisted
+    assert {t.id for t in await repo.list()} == persisted | new
+    await second.close()
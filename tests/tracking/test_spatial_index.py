@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from scipy.spatial.distance import cdist
+
+from aura_v2.domain.association.assignment import gated_assignment, sparse_assignment
+from aura_v2.domain.association.hungarian_solver import (
+    build_cost_matrix,
+    build_sparse_cost,
+    solve_assignment,
+    solve_sparse_assignment,
+)
+from aura_v2.domain.association.spatial_index import candidate_pairs, self_pairs
+
+
+@pytest.mark.parametrize("dim", [2, 3])
+@pytest.mark.parametrize("method", ["kdtree", "grid"])
+def test_candidate_pairs_match_brute_force(dim, method):
+    rng = np.random.default_rng(dim)
+    a = rng.uniform(-20, 80, size=(300, dim))
+    b = rng.uniform(-20, 80, size=(250, dim))
+    i, j, d = candidate_pairs(a, b, 4.0, method=method)
+
+    full = cdist(a, b)
+    ei, ej = np.nonzero(full <= 4.0)
+    assert list(zip(i.tolist(), j.tolist())) == list(zip(ei.tolist(), ej.tolist()))
+    np.testing.assert_allclose(d, full[ei, ej])
+
+
+@pytest.mark.parametrize("method", ["kdtree", "grid"])
+def test_self_pairs_match_brute_force(method):
+    pts = np.random.default_rng(3).uniform(0, 50, size=(200, 3))
+    i, j = self_pairs(pts, 5.0, method=method)
+    full = cdist(pts, pts)
+    ei, ej = np.nonzero(np.triu(full <= 5.0, k=1))
+    assert list(zip(i.tolist(), j.tolist())) == list(zip(ei.tolist(), ej.tolist()))
+    assert len(self_pairs(pts[:1], 5.0)[0]) == 0
+
+
+def test_sparse_assignment_equals_dense_gated_solve():
+    rng = np.random.default_rng(7)
+    a = rng.uniform(0, 200, size=(400, 2))
+    b = a[rng.permutation(400)[:350]] + rng.normal(scale=1.0, size=(350, 2))
+    gate = 3.0
+
+    r_dense, c_dense = gated_assignment(cdist(a, b), gate)
+    i, j, d = candidate_pairs(a, b, gate)
+    e = sparse_assignment(len(a), len(b), i, j, d)
+
+    assert sorted(zip(r_dense.tolist(), c_dense.tolist())) == sorted(
+        zip(i[e].tolist(), j[e].tolist())
+    )
+
+
+def test_sparse_bbox_costs_give_same_assignment_as_dense_matrix():
+    rng = np.random.default_rng(3)
+    w = {"iou": 0.6, "motion": 0.3, "confidence": 0.1}
+    trks = [
+        {"bbox": [float(x), float(y), 10.0, 10.0]}
+        for x, y in rng.uniform(0, 500, size=(60, 2))
+    ]
+    dets = [
+        {
+            "bbox": [t["bbox"][0] + dx, t["bbox"][1] + dy, 10.0, 10.0],
+            "score": float(s),
+        }
+        for t, (dx, dy), s in zip(
+            trks[:50], rng.normal(scale=1.5, size=(50, 2)), rng.uniform(0.3, 1.0, 50)
+        )
+    ]
+    max_cost = 1.5
+
+    dense = solve_assignment(build_cost_matrix(dets, trks, w, max_cost), max_cost)
+    rows, cols, costs = build_sparse_cost(dets, trks, w, max_cost)
+    assert rows.size < len(dets) * len(trks) / 10
+    sparse = solve_sparse_assignment(len(dets), len(trks), rows, cols, costs, max_cost)
+
+    assert sorted((int(r), int(c)) for r, c in dense[0]) == sparse[0]
+    assert dense[1] == sparse[1] and dense[2] == sparse[2]
@@ -0,0 +1,117 @@
+import copy
+import dataclasses
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from aura_v2.domain.entities import (
+    Confidence,
+    Detection,
+    Position3D,
+    ThreatLevel,
+    Track,
+    TrackState,
+    TrackStatus,
+    TrackStore,
+    TrackView,
+    Velocity3D,
+)
+from aura_v2.infrastructure.persistence.codec import encode
+from aura_v2.infrastructure.tracking.modern_tracker import ModernTracker
+
+TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_slots_grow_by_doubling_and_are_reused():
+    st = TrackStore(capacity=2)
+    a, b = st.add("a", (0, 0, 0)), st.add("b", (1, 0, 0))
+    c = st.add("c", (2, 0, 0))
+    assert st.capacity == 4 and (a._slot, b._slot, c._slot) == (0, 1, 2)
+    assert st.get("b").state.position.x == 1.0  # survived the grow
+
+    b.hits = 7
+    assert st.remove("b") is b and "b" not in st and len(st) == 2
+    d = st.add("d", (9, 9, 9))
+    assert d._slot == 1 and st.capacity == 4
+    # the detached view kept its own values
+    assert b.hits == 7 and b.state.position.x == 1.0 and d.hits == 1
+    assert [v.id for v in st] == ["a", "d", "c"]
+    with pytest.raises(KeyError):
+        st.add("a", (0, 0, 0))
+
+
+def test_view_behaves_like_track():
+    t = Track(
+        id="t1",
+        state=TrackState(Position3D(1.0, 2.0, 3.0), Velocity3D(0.5, 0.0, 0.0)),
+        threat_level=ThreatLevel.HIGH,
+        created_at=TS,
+        updated_at=TS,
+    )
+    st = TrackStore()
+    v = st.adopt(t)
+    assert isinstance(v, Track) and encode(v) == encode(t)
+
+    det = Detection(sensor_id="c", timestamp=TS + timedelta(seconds=1),
+                    position=Position3D(4.0, 5.0, 6.0), confidence=Confidence(0.9))
+    t.update(det, 0.8)
+    t.update(det, 0.8)
+    v.update(det, 0.8)
+    v.update(det, 0.8)
+    assert encode(v) == encode(t) and v.status is TrackStatus.ACTIVE
+
+    v.state = TrackState(Position3D(0.0, 0.0, 0.0), None)
+    assert v.state.velocity is None and st.state[v._slot].tolist() == [0.0] * 6
+
+
+def test_view_copies_detach_from_the_store():
+    st = TrackStore()
+    for k in range(50):
+        st.add(f"t{k}", (float(k), 0.0, 0.0), created_at=TS)
+    v = st.get("t7")
+    v.hits = 4
+    plain = v.to_track()
+    assert v == plain and plain == v and v == st.get("t7") and v != st.get("t8")
+    assert v.state == plain.state and plain.state == v.state
+
+    for c in (copy.copy(v), copy.deepcopy(v), pickle.loads(pickle.dumps(v))):
+        assert type(c) is Track and c == plain and c.hits == 4
+    assert type(copy.deepcopy([v])[0]) is Track
+    assert type(copy.copy(v.state)) is TrackState and copy.deepcopy(v.state) == plain.state
+    assert type(pickle.loads(pickle.dumps(v.state))) is TrackState
+
+    r = dataclasses.replace(v, hits=9)
+    assert type(r) is Track and r.hits == 9 and r.id == "t7" and v.hits == 4
+    s = dataclasses.replace(v.state, position=Position3D(1.0, 2.0, 3.0))
+    assert type(s) is TrackState and s.position.y == 2.0 and v.state.position.y == 0.0
+
+    # the copies are independent of the row
+    v.hits = 5
+    assert plain.hits == 4
+
+
+async def test_store_tracker_matches_object_tracker():
+    ref = ModernTracker(batch_kalman=True, max_missed=1)
+    col = ModernTracker(track_store=True, max_missed=1)
+    rng = np.random.default_rng(5)
+    p0 = rng.uniform(0.0, 400.0, size=(30, 3))
+    deleted = 0
+    for k in range(8):
+        ts = TS + timedelta(seconds=0.1 * k)
+        keep = p0[: 30 - 3 * k] if k < 5 else p0[:10]  # tracks drop out and get pruned
+        dets = [
+            Detection(sensor_id="cam", timestamp=ts, position=Position3D(x + k, y, z),
+                      confidence=Confidence(0.9))
+            for x, y, z in keep.tolist()
+        ]
+        ra, rb = await ref.update(dets, ts), await col.update(dets, ts)
+        assert all(isinstance(t, TrackView) for t in rb.active_tracks)
+        assert [encode(t) for t in ra.active_tracks] == [encode(t) for t in rb.active_tracks]
+        assert [t.id for t in ra.new_tracks] == [t.id for t in rb.new_tracks]
+        assert [t.id for t in ra.deleted_tracks] == [t.id for t in rb.deleted_tracks]
+        assert all(t.status is TrackStatus.DELETED for t in rb.deleted_tracks)
+        deleted += len(rb.deleted_tracks)
+    assert deleted > 0
+    assert len(col.store) == len(col.active_tracks()) == len(col.kalman_bank)
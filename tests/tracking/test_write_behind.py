@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aura_v2.domain.entities import Confidence, Detection, Position3D
+from aura_v2.infrastructure.persistence.in_memory import InMemoryTrackRepository
+from aura_v2.infrastructure.persistence.write_behind import WriteBehindTrackSink
+from aura_v2.infrastructure.tracking.modern_tracker import ModernTracker
+
+
+class CountingRepo(InMemoryTrackRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = {"list": 0, "save_many": 0, "saved": 0, "deleted": 0}
+
+    async def list(self):
+        self.calls["list"] += 1
+        return await super().list()
+
+    async def save_many(self, tracks):
+        tracks = list(tracks)
+        self.calls["save_many"] += 1
+        self.calls["saved"] += len(tracks)
+        return await super().save_many(tracks)
+
+    async def delete_many(self, track_ids):
+        track_ids = list(track_ids)
+        self.calls["deleted"] += len(track_ids)
+        return await super().delete_many(track_ids)
+
+
+class FailingRepo(CountingRepo):
+    fail = True
+
+    async def save_many(self, tracks):
+        if self.fail:
+            raise RuntimeError("store down")
+        return await super().save_many(tracks)
+
+
+def _dets(ts, xs):
+    return [
+        Detection(
+            sensor_id="cam",
+            timestamp=ts,
+            position=Position3D(x=x, y=0.0, z=0.0),
+            confidence=Confidence(0.9),
+        )
+        for x in xs
+    ]
+
+
+async def test_tracker_keeps_working_set_and_writes_behind():
+    repo = CountingRepo()
+    tracker = ModernTracker(track_repository=repo, max_missed=1)
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    for k in range(3):
+        ts = t0 + timedelta(seconds=0.1 * k)
+        res = await tracker.update(_dets(ts, [0.0, 100.0, 200.0]), ts)
+    assert len(res.active_tracks) == 3
+    # Only the start-up hydration scans the store.
+    assert repo.calls["list"] == 1
+
+    # Two frames without the far targets: they miss out and get pruned.
+    for k in range(3, 5):
+        ts = t0 + timedelta(seconds=0.1 * k)
+        res = await tracker.update(_dets(ts, [0.0]), ts)
+    assert [t.id for t in res.active_tracks] == ["track_00000"]
+    assert len(res.deleted_tracks) == 2
+
+    await tracker.flush()
+    stored = await repo.list()
+    assert [t.id for t in stored] == ["track_00000"]
+    assert repo.calls["list"] == 2
+    # One batched write per drain, at most one document per track per frame.
+    assert repo.calls["save_many"] <= 5
+    assert repo.calls["saved"] <= 3 * 5
+    assert repo.calls["deleted"] == 2
+
+
+async def test_tracker_hydrates_from_repository():
+    repo = CountingRepo()
+    first = ModernTracker(track_repository=repo, write_behind=False)
+    ts = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    await first.update(_dets(ts, [5.0]), ts)
+    assert len(await repo.list()) == 1
+
+    second = ModernTracker(track_repository=repo)
+    ts1 = ts + timedelta(seconds=0.1)
+    res = await second.update(_dets(ts1, [5.2]), ts1)
+    assert [t.id for t in res.active_tracks] == ["track_00000"]
+    assert res.new_tracks == []
+
+
+@pytest.mark.parametrize("track_store", [False, True])
+async def test_tracker_ids_continue_after_hydration(track_store):
+    repo = CountingRepo()
+    first = ModernTracker(track_repository=repo, write_behind=False, track_store=track_store)
+    ts = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    await first.update(_dets(ts, [5.0]), ts)
+
+    # With track_store=True a reused id is a hard KeyError from TrackStore.add.
+    second = ModernTracker(track_repository=repo, write_behind=False, track_store=track_store)
+    ts1 = ts + timedelta(seconds=0.1)
+    res = await second.update(_dets(ts1, [5.2, 500.0]), ts1)
+    assert [t.id for t in res.new_tracks] == ["track_00001"]
+    assert sorted(t.id for t in res.active_tracks) == ["track_00000", "track_00001"]
+    assert sorted(t.id for t in await repo.list()) == ["track_00000", "track_00001"]
+
+
+async def test_sink_coalesces_and_retries():
+    repo = FailingRepo()
+    sink = WriteBehindTrackSink(repo)
+    tracker = ModernTracker()
+    ts = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    res = await tracker.update(_dets(ts, [0.0, 50.0]), ts)
+    a, b = res.active_tracks
+
+    sink.submit([a, b])
+    sink.submit([a], deletes=[b.id])
+    assert len(sink) == 2
+
+    try:
+        await sink.flush()
+    except RuntimeError:
+        pass
+    assert sink.stats.errors == 1 and len(sink) == 2
+
+    repo.fail = False
+    await sink.close()
+    assert len(sink) == 0
+    assert [t.id for t in await repo.list()] == [a.id]
+    assert sink.stats.upserts == 1 and sink.stats.deletes == 1
@@ -1,6 +1,13 @@
 # aura_v2/tests/application/services/test_collision_predictor.py
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
 import pytest
-from aura_v2.application.services.collision_predictor import BasicCollisionPredictor
+from aura_v2.application.services.collision_predictor import (
+    BasicCollisionPredictor,
+    IncrementalCollisionPredictor,
+    VectorizedCollisionPredictor,
+)
 from aura_v2.domain.entities import (
     Track,
     TrackState,
@@ -35,3 +42,102 @@ def test_predict_no_collisions(collision_predictor):
         ),
     ]
     assert collision_predictor.predict(tracks) == []
+
+
+def _pairs(collisions):
+    return [(c.track1.id, c.track2.id) for c in collisions]
+
+
+def _frame(pos, vel, ts=None, ids=None):
+    ids = ids if ids is not None else [f"t{k:03d}" for k in range(len(pos))]
+    stamp = {"updated_at": ts} if ts is not None else {}
+    return [
+        Track(
+            id=ids[k],
+            state=TrackState(
+                position=Position3D(*map(float, pos[k])),
+                velocity=Velocity3D(*map(float, vel[k])),
+            ),
+            confidence=Confidence(0.9),
+            **stamp,
+        )
+        for k in range(len(pos))
+    ]
+
+
+def _random_tracks(n, area, speed, seed=0):
+    rng = np.random.default_rng(seed)
+    p = rng.uniform(0.0, area, size=(n, 3))
+    v = rng.normal(scale=speed, size=(n, 3))
+    p[:, 2] = v[:, 2] = 0.0
+    return _frame(p, v, ids=[str(k) for k in range(n)])
+
+
+@pytest.mark.parametrize(
+    "area, speed, method",
+    [(2000.0, 3.0, "kdtree"), (2000.0, 3.0, "grid"), (150.0, 5.0, "kdtree")],
+)
+def test_vectorized_predictor_matches_basic(area, speed, method):
+    tracks = _random_tracks(250, area, speed)
+    # Stationary pair and a receding pair: both skipped by the basic checks.
+    tracks += _random_tracks(2, 1.0, 0.0, seed=1)
+    want = BasicCollisionPredictor().predict(tracks)
+    assert len(want) > 5
+    fast = VectorizedCollisionPredictor(method=method, chunk_pairs=1000)
+    assert fast.predict(tracks) == want
+
+    approx = VectorizedCollisionPredictor(exact=False).predict(tracks)
+    assert _pairs(approx) == _pairs(want)
+    for a, b in zip(approx, want):
+        assert a.time_to_collision == pytest.approx(b.time_to_collision, abs=1e-9)
+        assert a.probability == pytest.approx(b.probability, abs=1e-9)
+
+
+def test_vectorized_predictor_small_inputs():
+    fast = VectorizedCollisionPredictor()
+    assert fast.predict([]) == []
+    assert fast.predict(_random_tracks(1, 10.0, 1.0)) == []
+
+
+def test_incremental_predictor_tracks_basic_over_frames():
+    rng = np.random.default_rng(0)
+    n = 200
+    pos = rng.uniform(0.0, 250.0, size=(n, 3))
+    vel = rng.normal(scale=2.0, size=(n, 3))
+    pos[:, 2] = vel[:, 2] = 0.0
+    vel[: n // 2] = 0.0  # parked
+    inc = IncrementalCollisionPredictor(position_tolerance=1e-6, velocity_tolerance=1e-9)
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    ids = [f"t{k:03d}" for k in range(n)]
+    for k in range(30):
+        if k == 12:
+            vel[n // 2] += (1.5, -1.0, 0.0)  # one track turns
+        if k == 20:  # one track is dropped
+            pos, vel, ids = pos[1:], vel[1:], ids[1:]
+        tracks = _frame(pos, vel, t0 + timedelta(seconds=0.5 * k), ids)
+        want = BasicCollisionPredictor().predict(tracks)
+        got = inc.predict(tracks)
+        assert _pairs(got) == _pairs(want)
+        for a, b in zip(got, want):
+            assert a.time_to_collision == pytest.approx(b.time_to_collision, abs=1e-9)
+            assert a.probability == pytest.approx(b.probability, abs=1e-9)
+        pos = pos + vel * 0.5
+
+    st = inc.stats
+    assert st.frames == 30 and st.entries_expired > 0
+    # Refresh every 5 s = 10 frames; everything else comes from the cache.
+    assert 0.85 < st.hit_rate < 0.95
+
+
+def test_incremental_predictor_static_scene_evaluates_nothing():
+    rng = np.random.default_rng(1)
+    pos = rng.uniform(0.0, 100.0, size=(300, 3))
+    vel = np.zeros((300, 3))
+    inc = IncrementalCollisionPredictor(refresh=60.0)
+    inc.predict(_frame(pos, vel), now=0.0)
+    first = inc.stats.pairs_evaluated
+    for k in range(1, 10):
+        jitter = pos + rng.normal(scale=0.05, size=pos.shape)
+        assert inc.predict(_frame(jitter, vel), now=0.1 * k) == []
+    assert inc.stats.pairs_evaluated == first
+    assert inc.stats.hit_rate == pytest.approx(0.9)
@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from aura_v2.api.deltas import DeltaStreams, TrackDeltaEncoder
+from aura_v2.domain import Position3D, Track, TrackState, Velocity3D
+from aura_v2.main import get_app
+
+
+def _t(tid, x, vx=0.0):
+    return Track(id=tid, state=TrackState(Position3D(x, 0.0, 0.0), Velocity3D(vx, 0.0, 0.0)))
+
+
+def test_encoder_reports_only_changes_beyond_epsilon():
+    enc = TrackDeltaEncoder(epsilon=0.1)
+    a, b = _t("a", 0.0), _t("b", 10.0)
+    d1 = enc.delta([a, b])
+    assert d1["seq"] == 1 and [r["id"] for r in d1["new"]] == ["a", "b"]
+
+    a.state = TrackState(Position3D(0.05, 0.0, 0.0), Velocity3D())  # within epsilon
+    b.state = TrackState(Position3D(10.0, 0.0, 0.0), Velocity3D(0.5, 0.0, 0.0))
+    d2 = enc.delta([a, b])
+    assert d2["seq"] == 2 and d2["new"] == [] and [r["id"] for r in d2["updated"]] == ["b"]
+
+    # drift is measured against what was published, not the previous frame
+    a.state = TrackState(Position3D(0.11, 0.0, 0.0), Velocity3D())
+    d3 = enc.delta([a])
+    assert [r["id"] for r in d3["updated"]] == ["a"] and d3["deleted"] == ["b"]
+
+    snap = enc.snapshot([a], frame_id=9)
+    assert snap["seq"] == 4 and snap["frame_id"] == 9 and [r["id"] for r in snap["tracks"]] == ["a"]
+    assert enc.delta([a])["updated"] == []
+
+
+def _body(xs):
+    ts = datetime.now(timezone.utc).isoformat()
+    return {
+        "camera_detections": [
+            {"sensor_id": "cam", "timestamp": ts, "position": {"x": x, "y": 0.0}, "confidence": 0.9}
+            for x in xs
+        ],
+        "timestamp": ts,
+    }
+
+
+def test_track_delta_mode_by_query_and_header():
+    client = TestClient(get_app())
+    full = client.post("/track", json=_body([0.0, 100.0])).json()
+    assert len(full["active_tracks"]) == 2
+
+    d1 = client.post("/track?mode=delta", json=_body([0.0, 100.0])).json()
+    assert d1["mode"] == "delta" and d1["seq"] == 1 and len(d1["new"]) == 2
+
+    # nothing moved -> empty delta
+    d2 = client.post(
+        "/track", json=_body([0.0, 100.0]), headers={"X-Aura-Response": "delta"}
+    ).json()
+    assert d2["seq"] == 2 and d2["new"] == d2["updated"] == d2["deleted"] == []
+    assert d2["frame_id"] == d1["frame_id"] + 1
+
+    d3 = client.post("/track?mode=delta", json=_body([5.0, 100.0])).json()
+    assert len(d3["updated"]) == 1 and d3["updated"][0]["x"] > 0.01
+
+    snap = client.get("/track/snapshot").json()
+    assert snap["mode"] == "snapshot" and snap["seq"] == 4 and len(snap["tracks"]) == 2
+
+    assert client.post("/track?mode=xml", json=_body([])).status_code == 400
+
+
+def test_interleaved_delta_clients_keep_their_own_streams():
+    client = TestClient(get_app())
+    a = client.post("/track?mode=delta&stream=a", json=_body([0.0, 100.0])).json()
+    b = client.post(
+        "/track", json=_body([0.0, 100.0]), headers={"X-Aura-Stream": "b", "X-Aura-Response": "delta"}
+    ).json()
+    # b joined later but still gets every track as new, with its own seq
+    assert a["seq"] == b["seq"] == 1 and len(a["new"]) == len(b["new"]) == 2
+
+    a2 = client.post("/track?mode=delta&stream=a", json=_body([5.0, 100.0])).json()
+    assert a2["seq"] == 2 and len(a2["updated"]) == 1
+
+    # the move a2 reported is still news to b: no gap, no missed update
+    b2 = client.post("/track?mode=delta&stream=b", json=_body([5.0, 100.0])).json()
+    assert b2["seq"] == 2 and len(b2["updated"]) == 1
+
+    # a resyncs; b's stream carries on without a gap
+    snap = client.get("/track/snapshot?stream=a").json()
+    assert snap["seq"] == 3 and len(snap["tracks"]) == 2
+    b3 = client.post("/track?mode=delta&stream=b", json=_body([5.0, 100.0])).json()
+    assert b3["seq"] == 3 and b3["new"] == [] and b3["deleted"] == []
+    a3 = client.post("/track?mode=delta&stream=a", json=_body([5.0, 100.0])).json()
+    assert a3["seq"] == 4 and a3["new"] == [] and a3["deleted"] == []
+
+    fast = client.post("/track/fast?mode=delta&stream=c", json=_body([5.0, 100.0])).json()
+    assert fast["seq"] == 1 and len(fast["new"]) == 2
+
+
+def test_delta_streams_drop_least_recently_used():
+    streams = DeltaStreams(max_streams=2)
+    a = streams.get("a")
+    streams.get("b")
+    assert streams.get("a") is a
+    streams.get("c")
+    assert "a" in streams and "b" not in streams and len(streams) == 2
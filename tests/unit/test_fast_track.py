@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from aura_v2.api.fast_ingest import FrameError, dumps, parse_track_body
+from aura_v2.main import get_app
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _body(k, xs):
+    ts = (T0 + timedelta(seconds=0.1 * k)).isoformat()
+    return {
+        "radar_detections": [
+            {"sensor_id": "radar", "timestamp": ts, "position": {"x": x, "y": 1.0}, "confidence": 0.8}
+            for x in xs
+        ],
+        "camera_detections": [
+            {"sensor_id": "cam", "timestamp": ts, "position": {"x": x + 500.0, "y": 0.0, "z": 2.0},
+             "confidence": 0.9, "attributes": {"cls": "car"}}
+            for x in xs
+        ],
+        "timestamp": ts,
+    }
+
+
+def _strip(resp):
+    body = resp.json()
+    body.pop("processing_time_ms")
+    return body
+
+
+def test_fast_path_matches_track_response():
+    slow, fast = TestClient(get_app()), TestClient(get_app())
+    for k in range(4):
+        xs = [0.0 + k, 100.0 + 2 * k]
+        a = slow.post("/track", json=_body(k, xs))
+        b = fast.post("/track/fast", json=_body(k, xs))
+        assert a.status_code == b.status_code == 200
+        assert _strip(a) == _strip(b)
+    # the reply also drives the delta stream
+    d = fast.post("/track/fast?mode=delta", json=_body(4, [4.0, 108.0])).json()
+    assert d["mode"] == "delta" and d["seq"] == 1 and len(d["new"]) == 4
+
+
+def test_fast_path_rejects_what_pydantic_rejects():
+    client = TestClient(get_app())
+    naive = _body(0, [0.0])
+    naive["radar_detections"][0]["timestamp"] = "2025-01-01T00:00:00"
+    r = client.post("/track/fast", json=naive)
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["body", "radar_detections", "0", "timestamp"]
+
+    bad = _body(0, [0.0])
+    bad["camera_detections"][0]["confidence"] = 1.5
+    assert client.post("/track/fast", json=bad).status_code == 422
+    assert client.post("/track/fast", content=b"{not json").status_code == 422
+    assert client.post("/track/fast?mode=bogus", json=_body(0, [])).status_code == 400
+
+
+def test_parse_normalizes_timestamps_to_utc():
+    body = dumps(
+        {
+            "timestamp": 1735689600,
+            "lidar_detections": [
+                {"sensor_id": "l", "timestamp": "2025-01-01T02:00:00+02:00",
+                 "position": {"x": "1.5"}, "confidence": 1}
+            ],
+        }
+    )
+    frame = parse_track_body(body)
+    assert frame.timestamp == T0 and frame.timestamp.tzinfo.key == "UTC"
+    assert frame.batch.timestamp(0) == T0
+    assert frame.batch.positions.tolist() == [[1.5, 0.0, 0.0]]
+    with pytest.raises(FrameError):
+        parse_track_body(b'{"camera_detections": [{"sensor_id": "c"}]}')
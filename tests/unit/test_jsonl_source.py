@@ -0,0 +1,115 @@
+import json
+import threading
+import time
+
+import pytest
+
+from aura_v2.sources import from_dsn
+from aura_v2.sources import jsonl
+from aura_v2.sources.jsonl import JsonlSource
+
+
+def _write(path, rows):
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows) + "\n")
+    return path
+
+
+def _rows(frames=20, per_frame=3, step=0.1):
+    return [
+        {
+            "sensor_id": "camera_1",
+            "timestamp": 1_700_000_000 + k * step,
+            "frame": k,
+            "position": {"x": float(i), "y": float(k)},
+            "confidence": 0.9,
+        }
+        for k in range(frames)
+        for i in range(per_frame)
+    ]
+
+
+async def _take(src, n=None):
+    out = []
+    gen = src.frames()
+    async for frame in gen:
+        out.append(frame)
+        if n is not None and len(out) == n:
+            break
+    await gen.aclose()
+    return out
+
+
+async def test_rows_are_grouped_into_frames_by_timestamp_or_key(tmp_path):
+    rows = _rows()
+    rows[3]["timestamp"] = rows[2]["timestamp"]  # key grouping ignores timestamps
+    path = _write(tmp_path / "log.jsonl", rows)
+
+    by_ts = await _take(JsonlSource(path, loop=False, speed=0))
+    assert [len(f["camera_detections"]) for f in by_ts[:3]] == [4, 2, 3]
+    assert by_ts[0]["timestamp"] == 1_700_000_000
+
+    by_key = await _take(JsonlSource(path, loop=False, speed=0, frame_key="frame"))
+    assert len(by_key) == 20 and all(len(f["camera_detections"]) == 3 for f in by_key)
+
+    whole = await _take(JsonlSource(path, loop=False, frame_key=None))
+    assert len(whole) == 1 and len(whole[0]["camera_detections"]) == 60
+
+
+async def test_replay_speed_paces_by_recorded_time(tmp_path):
+    path = _write(tmp_path / "log.jsonl", _rows(frames=6, step=0.05))  # 0.25 s recorded
+    t0 = time.perf_counter()
+    await _take(JsonlSource(path, loop=False, speed=1.0))
+    recorded = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    await _take(JsonlSource(path, loop=False, speed=5.0))
+    fast = time.perf_counter() - t0
+    assert recorded >= 0.24 and fast < recorded / 2
+
+
+@pytest.mark.parametrize("start", [1_700_000_000.75, "2023-11-14T22:13:20.75Z", 0, 1e12])
+async def test_seek_by_time(tmp_path, start):
+    path = _write(tmp_path / "log.jsonl", _rows())
+    frames = await _take(JsonlSource(path, loop=False, speed=0, start=start))
+    first = {0: 0, 1e12: None}.get(start, 8)
+    if first is None:
+        assert frames == []
+    else:
+        assert frames[0]["camera_detections"][0]["frame"] == first and len(frames) == 20 - first
+
+
+async def test_cache_replays_loops_without_rereading(tmp_path):
+    path = _write(tmp_path / "log.jsonl", _rows(frames=4))
+    src = JsonlSource(path, loop=True, interval=0, speed=0, cache=True)
+    gen = src.frames()
+    first = [await gen.__anext__() for _ in range(4)]
+    path.unlink()  # second loop must come from the cache
+    second = [await gen.__anext__() for _ in range(4)]
+    await gen.aclose()
+    assert first == second
+
+
+async def test_cache_without_frame_key_restamps_each_loop(tmp_path):
+    path = _write(tmp_path / "log.jsonl", _rows(frames=2))
+    src = JsonlSource(path, loop=True, interval=0.01, speed=0, frame_key=None, cache=True)
+    a, b = await _take(src, 2)
+    assert a["camera_detections"] == b["camera_detections"] and len(a["camera_detections"]) == 6
+    assert a["timestamp"] < b["timestamp"]
+
+
+async def test_file_is_read_off_the_event_loop(tmp_path, monkeypatch):
+    path = _write(tmp_path / "log.jsonl", _rows(frames=100))
+    threads = set()
+
+    def loads(line):
+        threads.add(threading.current_thread())
+        return json.loads(line)
+
+    monkeypatch.setattr(jsonl, "_loads", loads)
+    frames = await _take(JsonlSource(path, loop=False, speed=0, start=1_700_000_000 + 5.0))
+    assert len(frames) == 50
+    assert threads and threading.main_thread() not in threads
+
+
+def test_dsn_options(tmp_path):
+    src = from_dsn(f"jsonl://{tmp_path}/x.jsonl?loop=0&speed=10&key=frame&cache=1&start=5")
+    assert (src.loop, src.speed, src.frame_key, src.cache, src.start) == (False, 10.0, "frame", True, 5.0)
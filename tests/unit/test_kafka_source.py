@@ -0,0 +1,94 @@
+import asyncio
+import json
+from collections import namedtuple
+
+import pytest
+
+pytest.importorskip("aiokafka")
+
+from aura_v2.sources import from_dsn  # noqa: E402
+from aura_v2.sources.kafka import SEQ_KEY, KafkaSource  # noqa: E402
+
+Msg = namedtuple("Msg", "offset value")
+
+
+class FakeConsumer:
+    """getmany()/commit() over in-memory partitions."""
+
+    def __init__(self, partitions):
+        self.parts = {tp: list(values) for tp, values in partitions.items()}
+        self.pos = {tp: 0 for tp in self.parts}
+        self.commits = []
+        self.started = self.stopped = False
+
+    async def start(self):
+        self.started = True
+
+    async def stop(self):
+        self.stopped = True
+
+    async def getmany(self, timeout_ms=0, max_records=None):
+        out = {}
+        left = max_records or 10**9
+        for tp, values in self.parts.items():
+            take = values[self.pos[tp] : self.pos[tp] + left]
+            if take:
+                out[tp] = [Msg(self.pos[tp] + i, v) for i, v in enumerate(take)]
+                self.pos[tp] += len(take)
+                left -= len(take)
+        if not out:
+            await asyncio.sleep(timeout_ms / 1000.0)
+        return out
+
+    async def commit(self, offsets):
+        self.commits.append(dict(offsets))
+
+
+def _det(p, i):
+    return json.dumps({"sensor_id": p, "i": i}).encode()
+
+
+@pytest.mark.parametrize("decode_in_thread", [False, True])
+async def test_frames_fill_to_size_then_linger_and_keep_partition_order(decode_in_thread):
+    fake = FakeConsumer({"p0": [_det("p0", i) for i in range(40)], "p1": [_det("p1", i) for i in range(30)]})
+    fake.parts["p1"][5] = b"{not json"  # dropped from the second frame
+    src = KafkaSource(
+        "x", "t", max_batch=32, linger_ms=20, decode_in_thread=decode_in_thread,
+        consumer_factory=lambda: fake,
+    )
+    gen = src.frames()
+    frames = [await gen.__anext__() for _ in range(3)]
+    await gen.aclose()
+
+    sizes = [len(f["camera_detections"]) for f in frames]
+    assert sizes == [32, 31, 6] and src.stats.bad_messages == 1 and src.stats.messages == 70
+    seen = [d for f in frames for d in f["camera_detections"]]
+    for p in ("p0", "p1"):
+        order = [d["i"] for d in seen if d["sensor_id"] == p]
+        assert order == sorted(order)
+    assert fake.stopped and fake.commits == []
+
+
+async def test_offsets_are_committed_only_when_frames_are_acked():
+    fake = FakeConsumer({"p0": [_det("p0", i) for i in range(8)], "p1": [_det("p1", i) for i in range(4)]})
+    src = KafkaSource("x", "t", max_batch=4, linger_ms=5, consumer_factory=lambda: fake)
+    gen = src.frames()
+    f1, f2, f3 = [await gen.__anext__() for _ in range(3)]
+    assert fake.commits == []
+
+    assert [f[SEQ_KEY] for f in (f1, f2, f3)] == [1, 2, 3]
+
+    await src.ack(dict(f2))  # by sequence number, not identity; covers f1 as well
+    assert fake.commits == [{"p0": 8}]
+    await src.ack(f1)  # already covered: no-op
+    await src.ack({"camera_detections": []})  # not one of ours: no-op
+    await src.ack(f3)
+    assert fake.commits == [{"p0": 8}, {"p1": 4}] and src.stats.commits == 2
+    await gen.aclose()
+
+
+def test_dsn_options():
+    src = from_dsn("kafka://localhost:9092/aura.dets?max_batch=256&linger_ms=5&decode_thread=1&sensor=radar")
+    assert (src.topic, src.max_batch, src.linger_s, src.decode_in_thread, src.sensor) == (
+        "aura.dets", 256, 0.005, True, "radar",
+    )
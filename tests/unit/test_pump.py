@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+
+from aura_v2.main import get_app
+from aura_v2.sources.base import DetectionSource, batch
+from aura_v2.sources.pump import InProcessPump
+
+
+class _Finite(DetectionSource):
+    def __init__(self, n: int) -> None:
+        self.n = n
+
+    async def frames(self):
+        for i in range(self.n):
+            yield batch(camera=[{"i": i}])
+
+
+async def test_inproc_pump_is_bounded_and_ordered():
+    seen = []
+
+    async def slow_handler(frame):
+        await asyncio.sleep(0.001)
+        seen.append(frame["camera_detections"][0]["i"])
+        if len(seen) == 3:
+            raise ValueError("bad frame")
+
+    pump = InProcessPump(_Finite(40), slow_handler, maxsize=4)
+    await pump.run()
+    assert seen == list(range(40))
+    s = pump.stats.summary()
+    assert s["mode"] == "inproc" and s["frames"] == 39 and s["errors"] == 1
+    assert s["max_queue_depth"] <= 4
+    assert s["latency_ms_p99"] >= s["latency_ms_p50"] > 0.0
+
+
+def test_lifespan_pump_feeds_tracker_in_process(monkeypatch):
+    monkeypatch.setenv("AURA_PUMP_ENABLED", "1")
+    monkeypatch.setenv("AURA_SOURCE_DSN", "demo://?fps=100")
+    monkeypatch.delenv("AURA_PUMP_MODE", raising=False)
+    with TestClient(get_app()) as client:
+        deadline = time.time() + 5.0
+        while time.time() < deadline:
+            if client.get("/simple").json()["frame_id"] >= 3:
+                break
+            time.sleep(0.02)
+        simple = client.get("/simple").json()
+        stats = client.get("/pump").json()
+    assert simple["frame_id"] >= 3 and simple["active"] == 1
+    assert stats["mode"] == "inproc" and stats["frames"] >= 3
+
+
+async def test_inproc_pump_acks_processed_frames_only():
+    class _Acked(_Finite):
+        acked: list = []
+
+        async def ack(self, frame):
+            self.acked.append(frame["camera_detections"][0]["i"])
+
+    async def handler(frame):
+        if frame["camera_detections"][0]["i"] == 2:
+            raise ValueError("bad frame")
+
+    src = _Acked(5)
+    await InProcessPump(src, handler).run()
+    assert src.acked == [0, 1, 3, 4]
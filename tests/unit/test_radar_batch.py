@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+
+import numpy as np
+
+from aura_v2.infrastructure.sensors.radar_adapter import RadarAdapter
+
+
+def _power_map(rows=128, cols=96, seed=0):
+    rng = np.random.default_rng(seed)
+    power = rng.exponential(size=(rows, cols))
+    for r, d, a in ((40, 30, 500.0), (60, 50, 2000.0), (90, 70, 300.0)):
+        power[r, d] += a
+    return power
+
+
+def test_polar_to_cartesian_scalar_and_array():
+    adapter = RadarAdapter(offload_dsp=False)
+    r = np.array([10.0, 20.0, 5.0])
+    az = np.array([0.0, np.pi / 2, np.pi / 4])
+    el = np.array([0.0, 0.0, np.pi / 6])
+    xyz = adapter._polar_to_cartesian(r, az, el)
+    assert xyz.shape == (3, 3)
+    for k in range(3):
+        np.testing.assert_allclose(xyz[k], adapter._polar_to_cartesian(r[k], az[k], el[k]))
+    np.testing.assert_allclose(xyz[1], [0.0, 20.0, 0.0], atol=1e-12)
+
+
+def test_frame_batch_matches_per_detection_objects():
+    adapter = RadarAdapter(offload_dsp=False)
+    power = _power_map()
+    ts = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    frame = adapter._frame_batch(adapter._cfar_columns(power), ts)
+    dicts = adapter._cfar_detect(power)
+    assert len(frame) == len(dicts) >= 3
+
+    batch = frame.batch
+    assert batch.sensor_ids == ("radar_main",) and set(batch.timestamps_ns.tolist()) == {
+        batch.timestamps_ns[0]
+    }
+    np.testing.assert_allclose(batch.confidences, np.minimum(1.0, frame.snr / 30.0))
+
+    for det, d in zip(frame.to_detections(), dicts):
+        assert det.timestamp == ts and det.sensor_id == "radar_main"
+        assert (det.position.x, det.position.y, det.position.z) == (d["range"], 0.0, 0.0)
+        assert det.velocity.vx == d["doppler_velocity"] and det.velocity.vy == 0.0
+        assert float(det.confidence) == min(1.0, d["snr"] / 30.0)
+        assert det.attributes == {"rcs": d["rcs"], "snr": d["snr"], "doppler": d["doppler_velocity"]}
+
+
+def test_empty_frame():
+    adapter = RadarAdapter(offload_dsp=False)
+    frame = adapter._frame_batch(adapter._cfar_columns(np.ones((64, 64))), datetime.now(timezone.utc))
+    assert len(frame) == 0 and frame.to_detections() == []
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from aura_v2.infrastructure.sensors.cfar import CFAR
+from aura_v2.infrastructure.sensors.radar_adapter import RadarAdapter
+
+
+def _power_map(rows=96, cols=80, seed=0):
+    rng = np.random.default_rng(seed)
+    raw = rng.normal(size=(rows, cols)) + 1j * rng.normal(size=(rows, cols))
+    power = np.abs(raw) ** 2
+    for fr, fd, a in ((0.3, 0.3, 400.0), (0.32, 0.32, 60.0), (0.5, 0.5, 900.0), (0.7, 0.7, 40.0)):
+        power[int(fr * rows), int(fd * cols)] += a
+    power[:, int(0.55 * cols) :] *= 8.0  # noise step across doppler
+    return power
+
+
+def _reference(power, guard, train, pfa, method="ca", rank=None):
+    """Per-cell scan with the old detector's window, one estimator per method."""
+    h = guard + train
+    i, j = np.mgrid[-h : h + 1, -h : h + 1]
+    ring = (np.abs(i) > guard) | (np.abs(j) > guard)
+    lead, lag = ring & (i <= 0), ring & (i >= 0)
+    hits = []
+    rows, cols = power.shape
+    for r in range(h, rows - h):
+        for d in range(h, cols - h):
+            w = power[r - h : r + h + 1, d - h : d + h + 1]
+            if method == "ca":
+                noise = np.mean(w[ring])
+            elif method == "go":
+                noise = max(np.mean(w[lead]), np.mean(w[lag]))
+            elif method == "so":
+                noise = min(np.mean(w[lead]), np.mean(w[lag]))
+            else:
+                k = rank or (3 * ring.sum()) // 4
+                noise = np.sort(w[ring])[k - 1]
+            if power[r, d] > noise * -np.log(pfa):
+                hits.append((r, d, noise))
+    return hits
+
+
+def test_adapter_matches_the_per_cell_detector():
+    power = _power_map()
+    adapter = RadarAdapter(range_resolution=0.5, velocity_resolution=0.1)
+    got = adapter._cfar_detect(power)
+    want = _reference(power, 4, 16, 1e-6)
+    assert [(d["range"], d["doppler_velocity"]) for d in got] == [
+        (r * 0.5, (c - 80 // 2) * 0.1) for r, c, _ in want
+    ]
+    assert len(got) >= 2
+    for det, (r, c, noise) in zip(got, want):
+        assert det["rcs"] == power[r, c]
+        assert det["snr"] == pytest.approx(10 * np.log10(power[r, c] / noise), rel=1e-9)
+        assert det["azimuth"] == 0 and det["elevation"] == 0
+
+
+@pytest.mark.parametrize("method", ["ca", "go", "so", "os"])
+def test_variants_match_reference(method):
+    power = _power_map(rows=64, cols=56, seed=1)
+    got_r, got_d, got_noise = CFAR(guard=2, train=6, pfa=1e-3, method=method).detect(power)
+    want = _reference(power, 2, 6, 1e-3, method)
+    assert list(zip(got_r.tolist(), got_d.tolist())) == [(r, d) for r, d, _ in want]
+    np.testing.assert_allclose(got_noise, [n for _, _, n in want], rtol=1e-9)
+
+    noise = CFAR(guard=2, train=6, method=method).noise(power)
+    assert noise.shape == (64 - 16, 56 - 16)
+
+
+def test_go_is_never_below_so():
+    power = _power_map(seed=2)
+    go, so = (CFAR(method=m).noise(power) for m in ("go", "so"))
+    assert np.all(so <= go) and np.any(so < go)
+
+
+def test_small_maps_and_bad_parameters():
+    r, d, noise = CFAR().detect(np.ones((30, 30)))
+    assert len(r) == len(d) == len(noise) == 0
+    with pytest.raises(ValueError):
+        CFAR(method="median")
+    with pytest.raises(ValueError):
+        CFAR(guard=1, train=1, rank=17)
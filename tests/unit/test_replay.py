@@ -0,0 +1,52 @@
+import json
+
+from typer.testing import CliRunner
+
+from aura_v2.main import app_cli
+from aura_v2.observability.replay import STAGES, LatencyHistogram, ReplayRunner, synthetic_frames
+
+
+async def test_same_seed_gives_same_tracking_output():
+    a = await ReplayRunner(seed=3).run(synthetic_frames(seed=3, targets=12, frames=30))
+    b = await ReplayRunner(seed=3).run(synthetic_frames(seed=3, targets=12, frames=30))
+    c = await ReplayRunner(seed=4).run(synthetic_frames(seed=4, targets=12, frames=30))
+    assert a["summary"]["digest"] == b["summary"]["digest"] != c["summary"]["digest"]
+    assert a["summary"]["tracks"] == b["summary"]["tracks"]
+    s = a["summary"]
+    assert s["frames"] == 30 and s["detections"] == 360 and s["tracks"]["active_max"] >= 12
+    for stage in STAGES:
+        lat = a["latency_ms"][stage]
+        assert lat["count"] == 30 and sum(lat["buckets"]["count"]) == 30
+    assert a["latency_ms"]["total"]["p99"] >= a["latency_ms"]["track"]["p50"]
+
+
+def test_histogram_buckets():
+    h = LatencyHistogram()
+    for ms in (0.001, 0.5, 0.5, 2.0, 1e9):
+        h.add(ms)
+    s = h.summary()
+    assert s["count"] == 5 and s["max"] == 1e9
+    counts = dict(zip(s["buckets"]["le_ms"], s["buckets"]["count"]))
+    assert counts[0.01] == 1 and counts[0.5623] == 2 and counts[3.1623] == 1 and counts["inf"] == 1
+
+
+def test_scenario_run_replays_a_log_and_writes_metrics(tmp_path):
+    log = tmp_path / "log.jsonl"
+    rows = [
+        {
+            "sensor_id": "radar_1",
+            "timestamp": f"2025-01-01T00:00:{k:02d}Z",
+            "position": {"x": 10.0 + k, "y": 5.0},
+            "confidence": 0.9,
+        }
+        for k in range(10)
+    ]
+    log.write_text("".join(json.dumps(r) + "\n" for r in rows))
+    out = tmp_path / "run"
+    res = CliRunner().invoke(app_cli, ["scenario-run", "--outdir", str(out), "--log", str(log), "--trace-memory"])
+    assert res.exit_code == 0, res.output
+    m = json.loads((out / "metrics.json").read_text())
+    assert m["scenario"] == "log.jsonl" and m["summary"]["frames"] == 10
+    assert m["summary"]["tracks"]["active_final"] == 1
+    assert m["summary"]["memory"]["traced_peak_mb"] > 0 and m["summary"]["memory"]["max_rss_mb"] > 0
+    assert m["meta"]["seed"] == 0 and m["latency_ms"]["total"]["count"] == 10
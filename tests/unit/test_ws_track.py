@@ -0,0 +1,74 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from aura_v2.api.frames import pack_f32_frame, unpack_f32_frame
+from aura_v2.main import get_app
+
+
+def _frame(xs, ts=None):
+    ts = ts or datetime.now(timezone.utc).isoformat()
+    return {
+        "camera_detections": [
+            {"sensor_id": "cam", "timestamp": ts, "position": {"x": x, "y": 0.0}, "confidence": 0.9}
+            for x in xs
+        ],
+        "timestamp": ts,
+    }
+
+
+def test_f32_frame_roundtrip():
+    ts = datetime(2025, 1, 1, 0, 0, 1, 500000, tzinfo=timezone.utc)
+    buf = pack_f32_frame([[1.0, 2.0, 3.0, 0.5], [4.0, 5.0, 6.0, 1.0]], ts)
+    got_ts, rows = unpack_f32_frame(buf)
+    assert got_ts == ts and rows.shape == (2, 4) and rows[1, 2] == 6.0
+    assert unpack_f32_frame(pack_f32_frame([]))[0] is None
+    with pytest.raises(ValueError):
+        unpack_f32_frame(buf[:-3])
+
+
+def test_ws_json_stream_returns_deltas():
+    with TestClient(get_app()) as client:
+        with client.websocket_connect("/ws/track") as ws:
+            ws.send_text(json.dumps(_frame([0.0, 100.0])))
+            first = ws.receive_json()
+            ws.send_text(json.dumps(_frame([0.5, 100.5])))
+            second = ws.receive_json()
+            ws.send_text("{not json")
+            err = ws.receive_json()
+    assert len(first["new"]) == 2 and first["updated"] == [] and first["deleted"] == []
+    assert second["new"] == [] and {t["id"] for t in second["updated"]} == {
+        t["id"] for t in first["new"]
+    }
+    assert second["frame_id"] == first["frame_id"] + 1
+    assert "error" in err
+
+
+def test_ws_binary_f32_frames():
+    with TestClient(get_app()) as client:
+        with client.websocket_connect("/ws/track?encoding=f32&sensor_id=radar_1") as ws:
+            ws.send_bytes(pack_f32_frame([[1.0, 2.0, 0.0, 0.8]], datetime.now(timezone.utc)))
+            out = ws.receive_json()
+            ws.send_bytes(pack_f32_frame([[1.0, 2.0, 0.0, 1.5]]))
+            bad = ws.receive_json()
+    assert [(t["x"], t["y"]) for t in out["new"]] == [(1.0, 2.0)]
+    assert "confidence" in bad["error"]
+
+
+def test_ws_msgpack_frames():
+    msgpack = pytest.importorskip("msgpack")
+    with TestClient(get_app()) as client:
+        with client.websocket_connect("/ws/track?encoding=msgpack") as ws:
+            ws.send_bytes(msgpack.packb(_frame([3.0])))
+            out = msgpack.unpackb(ws.receive_bytes())
+    assert len(out["new"]) == 1 and out["new"][0]["x"] == 3.0
+
+
+def test_ws_rejects_unknown_encoding():
+    with TestClient(get_app()) as client:
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/ws/track?encoding=xml") as ws:
+                ws.receive_json()